@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: concurrent ShellCore.execute_async() calls on one event loop
+
+Async commands (sleep) are awaited on the loop itself, so N concurrent
+invocations finish in about the time of one and do not need N threads.
+Sync commands share the loop's default executor.
+
+Usage: python benchmarks/bench_async.py [concurrency]
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.shell import ShellCore
+
+
+async def run_batch(shell: ShellCore, command: str, count: int):
+    """Wall time and peak thread count for `count` concurrent calls"""
+    peak = threading.active_count()
+
+    async def watch():
+        nonlocal peak
+        while True:
+            peak = max(peak, threading.active_count())
+            await asyncio.sleep(0.005)
+
+    watcher = asyncio.create_task(watch())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(shell.execute_async(command) for _ in range(count)))
+    elapsed = time.perf_counter() - start
+    watcher.cancel()
+
+    failed = sum(1 for code, _ in results if code != 0)
+    return elapsed, peak, failed
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    shell = ShellCore(PROJECT_ROOT / 'commands', PROJECT_ROOT / 'plugins')
+
+    for label, command in (('async sleep 0.1', 'sleep 0.1'),
+                           ('sync echo', 'echo hello'),
+                           ('sync pipe', 'echo hello | grep hello')):
+        elapsed, peak, failed = await run_batch(shell, command, count)
+        print(f"{label:<16} x{count}: {elapsed * 1000:8.1f} ms   "
+              f"peak threads: {peak:3d}   failed: {failed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
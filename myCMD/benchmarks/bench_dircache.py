@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: repeated listings of a large directory with the dir cache
+
+Creates a directory with many files (default 100k) in a temporary
+directory, ages its mtime so listings are cacheable, then times
+'ls', 'ls-la' and 'ls+' cold and on repeat, then 'ls-la' once its
+cached sizes are stale and must be revalidated.  "legacy" is the old
+per-entry iterdir() + is_dir() + stat() loop.
+
+Usage: python benchmarks/bench_dircache.py [files]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import core.fscache as fscache
+from core.shell import ShellCore
+
+
+def legacy_ls(p: Path) -> int:
+    lines = 0
+    for name in sorted(item.name for item in p.iterdir()):
+        full_path = p / name
+        if not full_path.is_dir():
+            full_path.stat().st_size
+        lines += 1
+    return lines
+
+
+def timed(label: str, run, repeat: int = 5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:9.1f} ms")
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    root = Path(tempfile.mkdtemp(prefix='dircache-bench-'))
+    shell = ShellCore(PROJECT_ROOT / "commands", PROJECT_ROOT / "plugins")
+    try:
+        print(f"Creating {files} files...")
+        big = root / 'big'
+        big.mkdir()
+        for n in range(files):
+            (big / f"file{n:06d}.txt").touch()
+        old = time.time() - 60
+        os.utime(big, (old, old))
+
+        timed("legacy ls", lambda: legacy_ls(big), repeat=1)
+        for command in ('ls', 'ls-la', 'ls+'):
+            timed(f"{command} (cold)", lambda: (shell.dir_cache.invalidate(), shell.execute(f"{command} {big}")), repeat=1)
+            timed(f"{command} (repeat)", lambda: shell.execute(f"{command} {big}"))
+        fscache.STAT_TTL_NS = 0      # every repeat revalidates sizes and mtimes
+        timed("ls-la (revalidate)", lambda: shell.execute(f"ls-la {big}"))
+        print(f"hit rate: {shell.dir_cache.hit_rate:.0%}")
+    finally:
+        shell.shutdown()
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
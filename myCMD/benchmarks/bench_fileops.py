@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: threaded cp -r / rm -r vs sequential shutil
+
+Creates a tree of many small files (default 20k) in a temporary directory
+and times shutil.copytree / shutil.rmtree against the planned, thread
+pooled copy and remove from core.fileops.
+
+Usage: python benchmarks/bench_fileops.py [files] [threads]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.fileops import execute_copy, execute_remove, plan_copy, plan_remove
+
+
+def build_tree(root: Path, files: int):
+    for n in range(files):
+        d = root / f"d{n // 500:03d}"
+        if n % 500 == 0:
+            d.mkdir(parents=True)
+        (d / f"f{n}.txt").write_bytes(b"x" * (n % 4096))
+
+
+def timed(label: str, run):
+    start = time.perf_counter()
+    run()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+
+
+def drain(progress):
+    for step in progress:
+        if step.error:
+            raise RuntimeError(step.error)
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    root = Path(tempfile.mkdtemp(prefix='fileops-bench-'))
+    try:
+        src = root / 'src'
+        print(f"Building {files} files...")
+        build_tree(src, files)
+
+        timed("legacy: shutil.copytree", lambda: shutil.copytree(src, root / 'a'))
+        timed("legacy: shutil.rmtree", lambda: shutil.rmtree(root / 'a'))
+        for n in (1, threads):
+            target = str(root / f"copy{n}")
+            timed(f"cp -r, {n} thread(s)",
+                  lambda: drain(execute_copy(plan_copy([str(src)], target, recursive=True), n)))
+            timed(f"rm -r, {n} thread(s)",
+                  lambda: drain(execute_remove(plan_remove([target]), n)))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
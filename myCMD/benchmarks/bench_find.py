@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: scandir find vs the old rglob-and-collect find
+
+Builds a synthetic tree (default 200k files) in a temporary directory and
+reports time to the first result and total time for each implementation.
+"legacy" is the old implementation: rglob('*pattern*') into a list.
+
+Usage: python benchmarks/bench_find.py [files] [per_dir]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.fswalk import find, parse_find_args
+
+
+def build_tree(root: Path, files: int, per_dir: int):
+    """Write `files` empty files, `per_dir` per directory, two levels deep"""
+    for n in range(files):
+        d = root / f"d{n // (per_dir * 32):03d}" / f"s{n // per_dir % 32:02d}"
+        if n % per_dir == 0:
+            d.mkdir(parents=True, exist_ok=True)
+        (d / f"file{n}.{'py' if n % 10 == 0 else 'txt'}").touch()
+    (root / '.git' / 'objects').mkdir(parents=True)
+
+
+def legacy_find(root: Path, pattern: str):
+    results = []
+    for p in root.rglob(f'*{pattern}*'):
+        results.append(str(p))
+    return results
+
+
+def timed(label: str, run):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in run():
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} first {1000 * (first or 0):8.2f} ms  total {elapsed:7.3f} s  ({count} paths)")
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    per_dir = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    root = Path(tempfile.mkdtemp(prefix='find-bench-'))
+    try:
+        print(f"Building {files} files, {per_dir} per directory...")
+        build_tree(root, files, per_dir)
+        cwd = str(root)
+
+        timed("legacy: rglob '*.py*'", lambda: legacy_find(root, '.py'))
+        timed("find -name '*.py'", lambda: find(parse_find_args(['-name', '*.py']), cwd))
+        timed("find -type d", lambda: find(parse_find_args(['-type', 'd']), cwd))
+        timed("find -name '*.py' -prune .git", lambda: find(parse_find_args(['-name', '*.py', '-prune', '.git']), cwd))
+        timed("find -size -1k (stat per entry)", lambda: find(parse_find_args(['-size', '-1k']), cwd))
+        for threads in (4, 16):
+            timed(f"find -name '*.py' -parallel {threads}",
+                  lambda: find(parse_find_args(['-name', '*.py', '-parallel', str(threads)]), cwd))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: grep engine vs the old line-by-line substring grep
+
+Builds a synthetic log corpus (default 1 GB, split over 16 files) in a
+temporary directory, then times single-file and recursive searches.
+"legacy" is the old implementation: decode every line, `pattern in line`.
+Before timing, the stdin path (grep_lines) is checked against the file
+path on a small sample, so both agree for literal, -i and -v patterns.
+
+Usage: python benchmarks/bench_grep.py [size_mb] [files]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import core.grep as grep_engine
+from core.grep import compile_matcher, expand_operands, grep_lines, grep_paths, parse_grep_args
+
+LEVELS = ('INFO', 'INFO', 'INFO', 'DEBUG', 'WARN', 'ERROR')
+PATHS = ('/api/v1/items', '/api/v1/users', '/login', '/static/app.js', '/health')
+
+
+def build_corpus(root: Path, size_mb: int, files: int):
+    """Write `files` log files totalling about `size_mb` megabytes"""
+    rng = random.Random(42)
+    per_file = size_mb * 1024 * 1024 // files
+    block = []
+    for i in range(20000):
+        line = (f"2024-05-{i % 28 + 1:02d} 12:{i % 60:02d}:{i * 7 % 60:02d} "
+                f"{rng.choice(LEVELS)} req={rng.randrange(10**9):09d} "
+                f"path={rng.choice(PATHS)} status={rng.choice((200, 200, 200, 404, 500))} "
+                f"ms={rng.randrange(2000)}\n")
+        block.append(line)
+    block[777] = block[777].replace('ERROR', 'FATAL', 1) if 'ERROR' in block[777] else block[777] + 'FATAL\n'
+    data = ''.join(block).encode()
+
+    for n in range(files):
+        written = 0
+        with open(root / f"app{n:02d}.log", 'wb') as f:
+            while written < per_file:
+                f.write(data)
+                written += len(data)
+
+
+def legacy_grep(paths, pattern: str) -> int:
+    matches = 0
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                if pattern in line:
+                    matches += 1
+    return matches
+
+
+def check_stdin(sample: Path):
+    """grep_lines (pipe stdin) must find what the file scanner finds"""
+    text = sample.read_text().splitlines()
+    text.append('Fatal: Mixed Case fAtAl line')
+    sample.write_text('\n'.join(text) + '\n')
+    for args in (['FATAL'], ['-i', 'fatal'], ['-ic', 'fatal'], ['-i', 'ERROR'],
+                 ['-vc', 'INFO'], ['-ic', 'Status=500'], ['-iF', 'mixed case']):
+        options, _ = parse_grep_args(args + [sample.name])
+        matcher = compile_matcher(options)
+        from_file = list(grep_paths([(str(sample), sample.name)], options, matcher, False))
+        from_stdin = list(grep_lines(iter(text), options, matcher))
+        if from_file != from_stdin:
+            raise SystemExit(f"grep {' '.join(args)}: stdin gave {len(from_stdin)} lines, "
+                             f"file gave {len(from_file)}")
+    print("stdin vs file results: ok")
+
+
+def run(label: str, args, cwd: Path, parallel: bool = True):
+    options, operands = parse_grep_args(args)
+    matcher = compile_matcher(options)
+    files, _ = expand_operands(operands, cwd, options.recursive)
+    saved = grep_engine.PARALLEL_MIN_BYTES
+    if not parallel:
+        grep_engine.PARALLEL_MIN_BYTES = float('inf')
+    try:
+        start = time.perf_counter()
+        lines = sum(1 for _ in grep_paths(files, options, matcher, len(files) > 1 or options.recursive))
+        elapsed = time.perf_counter() - start
+    finally:
+        grep_engine.PARALLEL_MIN_BYTES = saved
+    size = sum(os.path.getsize(p) for p, _ in files) / 1e6
+    print(f"{label:<34} {elapsed:8.3f} s  {size / elapsed:8.0f} MB/s  ({lines} lines)")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    root = Path(tempfile.mkdtemp(prefix='grep-bench-'))
+    try:
+        print(f"Building {size_mb} MB corpus in {files} files...")
+        build_corpus(root, size_mb, files)
+        sample = root / 'sample.log'
+        sample.write_bytes((root / 'app00.log').read_bytes()[:1024 * 1024].rsplit(b'\n', 1)[0] + b'\n')
+        check_stdin(sample)
+        sample.unlink()
+        first = root / 'app00.log'
+
+        start = time.perf_counter()
+        found = legacy_grep([first], 'FATAL')
+        elapsed = time.perf_counter() - start
+        print(f"{'legacy: FATAL (1 file)':<34} {elapsed:8.3f} s  "
+              f"{first.stat().st_size / 1e6 / elapsed:8.0f} MB/s  ({found} lines)")
+
+        run("literal: FATAL (1 file)", ['FATAL', 'app00.log'], root)
+        run("literal -c: ERROR (1 file)", ['-c', 'ERROR', 'app00.log'], root)
+        run("-n literal: FATAL (1 file)", ['-n', 'FATAL', 'app00.log'], root)
+        run("-i: fatal (1 file)", ['-i', 'fatal', 'app00.log'], root)
+        run("-E: status=5..  ms=19.. (1 file)", ['-c', '-E', r'status=5\d\d ms=19\d\d', 'app00.log'], root)
+        run("-v -c: INFO (1 file)", ['-v', '-c', 'INFO', 'app00.log'], root)
+        run("-r FATAL, in-process", ['-r', 'FATAL', '.'], root, parallel=False)
+        run(f"-r FATAL, process pool x{os.cpu_count()}", ['-r', 'FATAL', '.'], root)
+    finally:
+        shutil.rmtree(root)
+        grep_engine.shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
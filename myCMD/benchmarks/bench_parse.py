@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark: parse cost per command line
+
+Compares the legacy regex splitter, the tokenizer/parser on a cold cache
+and compiled-plan cache hits, for pipelines of growing length.
+
+Usage: python benchmarks/bench_parse.py
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.parser import compile_plan
+
+
+def legacy_split(cmd_str):
+    """The pre-parser ShellCore.parse_command, for reference"""
+    if '#' in cmd_str:
+        cmd_str = cmd_str[:cmd_str.index('#')]
+    tokens = re.split(r'(\|{1,2}|&&|\|\||>>?  |\s+)', cmd_str)
+    return [t for t in tokens if t and not t.isspace()]
+
+
+def make_line(stages):
+    """Build a pipeline with the given number of stages"""
+    stage = 'grep -n "needle here" src/*.py'
+    return ' | '.join([stage] * stages) + ' > out.txt && echo done'
+
+
+def per_call_us(func, arg, number):
+    """Best-of-5 cost of one call, in microseconds"""
+    best = min(timeit.repeat(lambda: func(arg), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    uncached = compile_plan.__wrapped__
+
+    print(f"{'stages':>7} {'chars':>7} {'legacy re.split':>16} {'parse (cold)':>13} {'plan cache hit':>15}")
+    for stages in (1, 5, 20, 50, 200):
+        line = make_line(stages)
+        number = max(20, 20000 // stages)
+        compile_plan(line)
+        print(f"{stages:>7} {len(line):>7} "
+              f"{per_call_us(legacy_split, line, number):>13.1f} us "
+              f"{per_call_us(uncached, line, number):>10.1f} us "
+              f"{per_call_us(compile_plan, line, number):>12.2f} us")
+
+
+if __name__ == "__main__":
+    main()
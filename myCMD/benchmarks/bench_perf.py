@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: overhead of always-on latency histograms
+
+Measures PerfRecorder.record() on its own and a full execute('echo x')
+round trip with the recorder enabled vs replaced by a no-op.
+
+Usage: python benchmarks/bench_perf.py [calls]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.perf import PerfRecorder
+from core.shell import ShellCore
+
+
+class NullRecorder(PerfRecorder):
+    def record(self, name, ns, output_chars=0):
+        pass
+
+
+def per_call_us(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    recorder = PerfRecorder()
+    record_us = per_call_us(lambda: recorder.record('echo', 12_345, 5), calls)
+    print(f"record() alone        {record_us:8.3f} us/call")
+
+    shell = ShellCore(PROJECT_ROOT / 'commands', PROJECT_ROOT / 'plugins')
+    shell.execute('echo warmup')
+    line = 'echo x'
+
+    shell.perf = NullRecorder()
+    off_us = per_call_us(lambda: shell.execute(line), calls // 10)
+    shell.perf = PerfRecorder()
+    on_us = per_call_us(lambda: shell.execute(line), calls // 10)
+
+    print(f"execute() perf off    {off_us:8.3f} us/call")
+    print(f"execute() perf on     {on_us:8.3f} us/call   overhead {on_us - off_us:+.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: ShellCore() startup time, lazy manifest vs eager imports
+
+Each measurement runs in a fresh interpreter so module caches are cold.
+"eager" resolves every built-in command right after construction, which is
+what the shell used to do at startup.
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from core.shell import ShellCore
+from pathlib import Path
+shell = ShellCore(Path({root!r}) / 'commands', Path({root!r}) / 'plugins')
+if {eager}:
+    shell.registry.resolve_all(shell.commands)
+elapsed = time.perf_counter() - start
+print('RESULT', elapsed, len(shell.registry.loaded_modules()))
+"""
+
+
+def measure(eager: bool, runs: int):
+    """Median startup seconds and number of command modules imported"""
+    times = []
+    modules = 0
+    for _ in range(runs):
+        code = PROBE.format(root=str(PROJECT_ROOT), eager=eager)
+        out = subprocess.run([sys.executable, '-c', code],
+                             capture_output=True, text=True, check=True).stdout
+        line = next(l for l in out.splitlines() if l.startswith('RESULT'))
+        _, elapsed, loaded = line.split()
+        times.append(float(elapsed))
+        modules = int(loaded)
+    return statistics.median(times), modules
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for label, eager in (('eager (before)', True), ('lazy manifest', False)):
+        median, modules = measure(eager, runs)
+        print(f"{label:<16} {median * 1000:8.2f} ms   command modules imported: {modules}")
+
+
+if __name__ == "__main__":
+    main()
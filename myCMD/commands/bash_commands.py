@@ -4,9 +4,22 @@ Basic Bash-compatible commands
 """
 
 import os
-import shutil
+import re
+import threading
+import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
+
+from core.fileio import follow_lines, is_binary, iter_escaped_lines, iter_hex_lines, tail_lines
+from core.fileops import (FILE_WORKERS, execute_copy, execute_move, execute_remove,
+                          plan_copy, plan_move, plan_remove)
+from core.fswalk import find, human_size, parse_find_args
+from core.grep import compile_matcher, expand_operands, grep_lines, grep_paths, parse_grep_args
+from core.output import PagedOutput
+from core.pipeline import CommandCancelled, StageError, iter_file_lines, streaming
+from ui.ascii_renderer import ASCIIRenderer
 
 
 def cmd_ls(args: List[str], shell) -> Tuple[int, str]:  
@@ -14,25 +27,23 @@ def cmd_ls(args: List[str], shell) -> Tuple[int, str]:
     path = args[0] if args else '.'
     
     try:
-        p = Path(path)
+        p = shell.resolve_path(path)
         if not p.exists():
             return (1, f"[ERROR] {shell.i18n. t('no_file')}: {path}")
         
         if not p.is_dir():
             return (0, str(p. name))
         
-        items = sorted([item. name for item in p.iterdir()])
+        items = shell.dir_cache.listing(p)
         if not items:
             return (0, "[DIR] (empty)")
         
         output = "[DIR] Contents:\n"
         for item in items:
-            full_path = p / item
-            if full_path.is_dir():
-                output += f"  [D] {item}/\n"
+            if item.is_dir:
+                output += f"  [D] {item.name}/\n"
             else:  
-                size = full_path.stat().st_size
-                output += f"  [F] {item} ({size} bytes)\n"
+                output += f"  [F] {item.name} ({item.size} bytes)\n"
         
         return (0, output)
     except Exception as e:
@@ -44,9 +55,7 @@ def cmd_cd(args: List[str], shell) -> Tuple[int, str]:
     if not args:
         new_path = Path. home()
     else:
-        new_path = Path(args[0])
-        if not new_path.is_absolute():
-            new_path = shell.cwd / new_path
+        new_path = shell.resolve_path(args[0])
     
     try:
         if not new_path.exists():
@@ -55,8 +64,7 @@ def cmd_cd(args: List[str], shell) -> Tuple[int, str]:
         if not new_path.is_dir():
             return (1, f"[ERROR] Not a directory")
         
-        shell.cwd = new_path
-        os.chdir(new_path)
+        shell.chdir(new_path)
         return (0, f"[OK] Changed to:  {shell.cwd}")
     except Exception as e:  
         return (1, f"[ERROR] {e}")
@@ -79,117 +87,278 @@ def cmd_exit(args: List[str], shell) -> Tuple[int, str]:
     return (0, "[EXIT] Goodbye!")
 
 
-def cmd_cat(args: List[str], shell) -> Tuple[int, str]:
-    """Display file contents"""
-    if not args:
-        return (1, "[ERROR] cat: missing filename")
-    
-    content = ""
+def _parse_line_count(args: List[str], default: int = 10) -> Tuple[int, List[str]]:
+    """Split '-n N', '-nN' or '-N' off the argument list"""
+    count = default
+    rest = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '-n' and i + 1 < len(args):
+            count = int(args[i + 1])
+            i += 1
+        elif arg.startswith('-n'):
+            count = int(arg[2:] or default)
+        elif arg[:1] == '-' and arg[1:].isdigit():
+            count = int(arg[1:])
+        else:
+            rest.append(arg)
+        i += 1
+    return count, rest
+
+
+def _all_but_last(lines: Iterable[str], count: int) -> Iterator[str]:
+    """Every line except the last `count`, holding only `count` lines back"""
+    window = deque()
+    for line in lines:
+        window.append(line)
+        if len(window) > count:
+            yield window.popleft()
+
+
+@streaming
+def cmd_cat(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Display file contents (-x hex dump, -v show non-printing bytes)"""
+    mode = 'text'
+    sources = []
     for arg in args:
         if arg.startswith('--stdin='):
-            content += arg[8:]
+            sources.append(arg[8:].split('\n'))
+        elif arg in ('-x', '--hex'):
+            mode = 'hex'
+        elif arg in ('-v', '--show-nonprinting'):
+            mode = 'escaped'
         else:
-            try:  
-                p = Path(arg)
-                if p.exists() and p.is_file():
-                    content += p.read_text()
-                else:
-                    return (1, f"[ERROR] {shell.i18n.t('no_file')}: {arg}")
-            except Exception as e:  
-                return (1, f"[ERROR] {e}")
+            sources.append(arg)
+    
+    if not sources and stdin is None:
+        return (1, "[ERROR] cat: missing filename\nUsage: cat [-x|-v] <file>...")
+    
+    readers = {'text': iter_file_lines, 'hex': iter_hex_lines, 'escaped': iter_escaped_lines}
+    for i, source in enumerate(sources):
+        if not isinstance(source, str):
+            continue
+        p = shell.resolve_path(source)
+        if not (p.exists() and p.is_file()):
+            return (1, f"[ERROR] {shell.i18n.t('no_file')}: {source}")
+        if mode == 'text' and is_binary(p):
+            return (1, f"[ERROR] cat: {source}: binary file (use 'cat -x' for hex or 'cat -v' for escaped output)")
+        sources[i] = p
     
-    return (0, content)
+    if not sources:
+        sources.append(stdin)
+    
+    def generate():
+        for source in sources:
+            if isinstance(source, Path):
+                yield from readers[mode](source)
+            else:
+                yield from source
+    
+    return (0, generate())
 
 
-def cmd_head(args: List[str], shell) -> Tuple[int, str]:  
-    """Display first lines"""
-    lines = 10
-    filename = None
+@streaming
+def cmd_head(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:  
+    """Display first lines (-n -K: all but the last K)"""
+    try:
+        lines, rest = _parse_line_count(args)
+    except ValueError:
+        return (1, "[ERROR] head: invalid line count")
     
-    for arg in args:
-        if arg.startswith('-n'):
-            lines = int(arg[2:] or 10)
+    def select(source: Iterable[str]) -> Iterator[str]:
+        return islice(source, lines) if lines >= 0 else _all_but_last(source, -lines)
+    
+    if not rest:
+        if stdin is None:
+            return (1, "[ERROR] head: missing filename")
+        return (0, select(stdin))
+    
+    filename = rest[-1]
+    path = shell.resolve_path(filename)
+    if not path.is_file():
+        return (1, f"[ERROR] {shell.i18n.t('no_file')}: {filename}")
+    
+    def generate():
+        if lines >= 0:
+            yield f"[HEAD] First {lines} lines of {filename}:"
         else:
-            filename = arg
+            yield f"[HEAD] All but the last {-lines} lines of {filename}:"
+        yield from select(iter_file_lines(path))
+    
+    return (0, generate())
+
+
+@streaming
+def cmd_tail(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Display last lines (-f follow appends, -F also follow rotation)"""
+    follow = '-f' in args or '-F' in args
+    reopen = '-F' in args
+    try:
+        lines, rest = _parse_line_count([arg for arg in args if arg not in ('-f', '-F')])
+    except ValueError:
+        return (1, "[ERROR] tail: invalid line count")
+    lines = abs(lines)      # 'tail -n -K' is 'tail -n K'
+    if follow and shell.ui_thread == threading.get_ident():
+        # Following never returns on its own; it needs a worker that Ctrl+C can stop
+        return (1, "[ERROR] tail: -f/-F can't run on the UI thread")
     
-    if not filename:
-        return (1, "[ERROR] head: missing filename")
+    if not rest:
+        if stdin is None:
+            return (1, "[ERROR] tail: missing filename")
+        return (0, deque(stdin, maxlen=lines))
     
+    filename = rest[-1]
+    path = shell.resolve_path(filename)
+    header = f"[TAIL] Last {lines} lines of {filename}:"
     try:
-        content = Path(filename).read_text().split('\n')
-        output = f"[HEAD] First {lines} lines of {filename}:\n"
-        output += '\n'.join(content[: lines])
-        return (0, output)
-    except Exception as e:  
+        if reopen and not path.exists():
+            last, end = [], 0
+        else:
+            last, end = tail_lines(path, lines)
+    except Exception as e: 
         return (1, f"[ERROR] {e}")
+    
+    if not follow:
+        return (0, '\n'.join([header] + last))
+    
+    def generate():
+        yield header
+        yield from last
+        yield from follow_lines(path, shell.cancel_event, offset=end, reopen=reopen)
+    
+    return (0, generate())
 
 
-def cmd_tail(args: List[str], shell) -> Tuple[int, str]:
-    """Display last lines"""
-    lines = 10
-    filename = None
+@streaming
+def cmd_less(args: List[str], shell, stdin=None) -> Tuple[int, PagedOutput]:
+    """Page through a file or piped output"""
+    if not args:
+        if stdin is None:
+            return (1, "[ERROR] less: missing filename\nUsage: less <file> | <command> | less")
+        return (0, PagedOutput(stdin, title="(stdin)"))
     
-    for arg in args: 
-        if arg.startswith('-n'):
-            lines = int(arg[2:] or 10)
-        else:
-            filename = arg
+    path = shell.resolve_path(args[0])
+    if not path.is_file():
+        return (1, f"[ERROR] {shell.i18n.t('no_file')}: {args[0]}")
+    if is_binary(path):
+        return (1, f"[ERROR] less: {args[0]} is a binary file\n[INFO] Use 'cat -x {args[0]} | less'")
+    return (0, PagedOutput(iter_file_lines(path), title=args[0]))
+
+
+@streaming
+def cmd_more(args: List[str], shell, stdin=None) -> Tuple[int, PagedOutput]:
+    """Page through a file or piped output, quitting after the last page"""
+    code, output = cmd_less(args, shell, stdin)
+    if code == 0:
+        output.quit_at_end = True
+    return (code, output)
+
+
+def _grep_status(lines: Iterable[str], count: bool) -> Iterator[str]:
+    """Pass grep output through; without a match, end with exit status 1 as grep does"""
+    found = False
+    for line in lines:
+        # -c prints a count per file even when it is 0
+        found = found or not count or line.rpartition(':')[2] != '0'
+        yield line
+    if not found:
+        raise StageError(1, "")
+
+
+@streaming
+def cmd_grep(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Search text patterns (-i -v -c -n -l -r -E -F)"""
+    try:
+        options, operands = parse_grep_args(args)
+        matcher = compile_matcher(options)
+    except ValueError as e:
+        return (1, f"[ERROR] grep: {e}\nUsage: grep [-icvnlrEF] <pattern> [file...]")
+    except re.error as e:
+        return (1, f"[ERROR] grep: invalid pattern: {e}")
+    
+    if not operands:
+        if stdin is not None:
+            return (0, _grep_status(grep_lines(stdin, options, matcher), options.count))
+        if not options.recursive:
+            return (1, "[ERROR] grep: missing operands")
+        operands = ['']
+    
+    files, errors = expand_operands(operands, shell.cwd, options.recursive)
+    if not files and errors:
+        return (1, '\n'.join(errors))
+    show_names = len(files) > 1 or options.recursive
+    
+    def generate():
+        yield from errors
+        yield from _grep_status(grep_paths(files, options, matcher, show_names), options.count)
     
-    if not filename:  
-        return (1, "[ERROR] tail: missing filename")
+    return (0, generate())
+
+
+@streaming
+def cmd_find(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Find files (-name -iname -type -maxdepth -mindepth -size -mtime -prune)"""
+    usage = ("Usage: find [path...] [-name G] [-iname G] [-type f|d|l] [-maxdepth N] "
+             "[-mindepth N] [-size [+-]N[ckMG]] [-mtime [+-]N] [-prune G] [-parallel N]")
+    if not args:
+        return (1, f"[ERROR] find: missing pattern\n{usage}")
     
+    # Old form: 'find <pattern> [path]' matches names containing the pattern
+    legacy = (len(args) <= 2 and not any(arg.startswith('-') for arg in args)
+              and not shell.resolve_path(args[0]).is_dir())
     try:
-        content = Path(filename).read_text().split('\n')
-        output = f"[TAIL] Last {lines} lines of {filename}:\n"
-        output += '\n'.join(content[-lines:])
-        return (0, output)
-    except Exception as e: 
-        return (1, f"[ERROR] {e}")
+        if legacy:
+            options = parse_find_args(args[1:] + ['-name', f"*{args[0]}*"])
+        else:
+            options = parse_find_args(args)
+    except ValueError as e:
+        return (1, f"[ERROR] find: {e}\n{usage}")
+    
+    cancel = shell.cancel_event
+    
+    def generate():
+        found = False
+        for line in find(options, str(shell.cwd), cancel):
+            found = True
+            yield line
+        if cancel.is_set():
+            raise CommandCancelled()
+        if not found and legacy:
+            raise StageError(1, "")
+    
+    return (0, generate())
 
 
-def cmd_grep(args: List[str], shell) -> Tuple[int, str]:
-    """Search text patterns"""
-    if len(args) < 2:
-        return (1, "[ERROR] grep: missing operands")
+def cmd_source(args: List[str], shell) -> Tuple[int, str]:
+    """Run commands from a script file"""
+    record_history = '--history' in args
+    stop_on_error = '-e' in args
+    files = [arg for arg in args if arg not in ('--history', '-e')]
     
-    pattern = args[0]
-    filename = args[1]
+    if not files:
+        return (1, "[ERROR] source: missing filename\nUsage: source [-e] [--history] <file>")
     
-    try:
-        content = Path(filename).read_text()
-        matching = [line for line in content.split('\n') if pattern in line]
-        
-        if not matching:
-            return (0, f"[GREP] No matches for '{pattern}' in {filename}")
-        
-        output = f"[GREP] Found {len(matching)} match(es) for '{pattern}':\n"
-        output += '\n'.join(matching)
-        return (0, output)
-    except Exception as e:
-        return (1, f"[ERROR] {e}")
+    return shell.execute_script(files[0], record_history=record_history,
+                                stop_on_error=stop_on_error)
 
 
-def cmd_find(args: List[str], shell) -> Tuple[int, str]:
-    """Find files by pattern"""
-    if not args:
-        return (1, "[ERROR] find: missing pattern")
+async def cmd_sleep(args: List[str], shell) -> Tuple[int, str]:
+    """Wait for N seconds without holding a worker thread"""
+    try:
+        seconds = float(args[0]) if args else 1.0
+    except ValueError:
+        return (1, f"[ERROR] sleep: invalid time interval '{args[0]}'")
     
-    pattern = args[0]
-    search_path = Path(args[1]) if len(args) > 1 else shell.cwd
+    import asyncio      # slow to import, so only async paths load it
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    while (remaining := deadline - loop.time()) > 0:
+        if shell.cancel_event.is_set():
+            raise CommandCancelled()
+        await asyncio.sleep(min(remaining, 0.1))
     
-    try:  
-        results = []
-        for p in search_path.rglob(f'*{pattern}*'):
-            results.append(str(p))
-        
-        if not results:  
-            return (0, f"[FIND] No matches for '{pattern}'")
-        
-        output = f"[FIND] Found {len(results)} file(s):\n"
-        output += '\n'.join(results)
-        return (0, output)
-    except Exception as e:
-        return (1, f"[ERROR] {e}")
+    return (0, "")
 
 
 def cmd_echo(args: List[str], shell) -> Tuple[int, str]:
@@ -204,7 +373,7 @@ def cmd_touch(args: List[str], shell) -> Tuple[int, str]:
     
     try:
         for filename in args:
-            Path(filename).touch()
+            shell.resolve_path(filename).touch()
         return (0, f"[OK] Created {len(args)} file(s)")
     except Exception as e:  
         return (1, f"[ERROR] {e}")
@@ -217,29 +386,152 @@ def cmd_mkdir(args: List[str], shell) -> Tuple[int, str]:
     
     try:
         for dirname in args:
-            Path(dirname).mkdir(parents=True, exist_ok=True)
+            shell.resolve_path(dirname).mkdir(parents=True, exist_ok=True)
         return (0, f"[OK] Created {len(args)} directory/ies")
     except Exception as e:
         return (1, f"[ERROR] {e}")
 
 
-def cmd_rm(args: List[str], shell) -> Tuple[int, str]:
-    """Remove files or directories"""
-    if not args:  
+PROGRESS_INTERVAL = 0.25   # seconds between progress lines of cp/mv/rm
+
+
+def _parse_file_op(args: List[str], name: str):
+    """Split cp/mv/rm arguments into (flags, threads, operands)"""
+    flags = set()
+    threads = FILE_WORKERS
+    operands = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--dry-run':
+            flags.add('dry-run')
+        elif arg == '-j':
+            if i + 1 >= len(args) or not args[i + 1].isdigit() or int(args[i + 1]) < 1:
+                raise ValueError(f"{name}: -j needs a thread count")
+            threads = int(args[i + 1])
+            i += 1
+        elif arg.startswith('-') and len(arg) > 1 and arg[1:].isalpha():
+            flags.update('r' if ch == 'R' else ch for ch in arg[1:])
+        else:
+            operands.append(arg)
+        i += 1
+    return flags, threads, operands
+
+
+def _file_op_output(label: str, plan, run, shell, dry_run: bool, verb: str) -> Iterable[str]:
+    """Stream errors and progress bar lines while `run()` does the work"""
+    total_files = plan.total_files
+    total_bytes = plan.total_bytes
+    summary = (f"{total_files} file(s), {human_size(total_bytes)}"
+               f"{f', {len(plan.dirs)} dir(s)' if plan.dirs else ''}"
+               f"{f', {len(plan.renames)} rename(s)' if plan.renames else ''}")
+    
+    def line(files: int, done_bytes: int) -> str:
+        # Files and bytes weigh equally: many small files cost as much as one big one
+        fraction = (files / total_files + (done_bytes / total_bytes if total_bytes else 1.0)) / 2
+        return (f"[{label}] {ASCIIRenderer.draw_progressbar(min(fraction, 1.0))} "
+                f"{files}/{total_files} files, {human_size(done_bytes)}/{human_size(total_bytes)}")
+    
+    def failed(errors: int) -> StageError:
+        # Raised after the summary so && / || see the failure
+        return StageError(1, f"[ERROR] {label.lower()}: {errors} error(s)")
+    
+    def generate():
+        errors = len(plan.errors)
+        for error in plan.errors:
+            yield f"[ERROR] {label.lower()}: {error}"
+        if dry_run:
+            yield f"[DRY-RUN] {label.lower()} would {verb} {summary}"
+            if errors:
+                raise failed(errors)
+            return
+        if not (total_files or plan.dirs or plan.renames):
+            if errors:
+                raise failed(errors)
+            return
+        
+        cancel = shell.cancel_event
+        start = time.monotonic()
+        last = start
+        files = done_bytes = 0
+        for progress in run():
+            files, done_bytes = progress.files, progress.bytes
+            if progress.error:
+                errors += 1
+                yield f"[ERROR] {label.lower()}: {progress.error}"
+                continue
+            now = time.monotonic()
+            if now - last >= PROGRESS_INTERVAL:
+                last = now
+                yield line(files, done_bytes)
+        if cancel.is_set():
+            raise CommandCancelled()
+        shell.dir_cache.invalidate()
+        if total_files:
+            yield line(files, done_bytes)
+        yield f"[OK] {label.lower()}: {summary} in {time.monotonic() - start:.2f}s"
+        if errors:
+            raise failed(errors)
+    
+    return generate()
+
+
+@streaming
+def cmd_rm(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Remove files or directories (-r -f --dry-run -j N)"""
+    try:
+        flags, threads, operands = _parse_file_op(args, 'rm')
+    except ValueError as e:
+        return (1, f"[ERROR] {e}")
+    if not operands:
         return (1, "[ERROR] rm: missing operand")
     
+    # Directories are removed even without -r, as rm always did here
+    plan = plan_remove([str(shell.resolve_path(p)) for p in operands], recursive=True,
+                       force='f' in flags)
+    if plan.errors and not (plan.total_files or plan.dirs):
+        return (1, '\n'.join(f"[ERROR] rm: {e}" for e in plan.errors))
+    output = _file_op_output('RM', plan, lambda: execute_remove(plan, threads, shell.cancel_event),
+                             shell, 'dry-run' in flags, 'remove')
+    return (1 if plan.errors else 0, output)
+
+
+@streaming
+def cmd_cp(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Copy files and directories (-r --dry-run -j N)"""
     try:
-        for item in args:
-            p = Path(item)
-            if p.is_file():
-                p.unlink()
-            elif p.is_dir():
-                shutil. rmtree(p)
-            else:
-                return (1, f"[ERROR] {shell.i18n.t('no_file')}: {item}")
-        return (0, f"[OK] Removed {len(args)} item(s)")
-    except Exception as e:
+        flags, threads, operands = _parse_file_op(args, 'cp')
+    except ValueError as e:
+        return (1, f"[ERROR] {e}")
+    if len(operands) < 2:
+        return (1, "[ERROR] cp: missing destination\nUsage: cp [-r] [--dry-run] [-j N] <source>... <dest>")
+    
+    paths = [str(shell.resolve_path(p)) for p in operands]
+    plan = plan_copy(paths[:-1], paths[-1], recursive='r' in flags)
+    if plan.errors and not (plan.total_files or plan.dirs):
+        return (1, '\n'.join(f"[ERROR] cp: {e}" for e in plan.errors))
+    output = _file_op_output('CP', plan, lambda: execute_copy(plan, threads, shell.cancel_event),
+                             shell, 'dry-run' in flags, 'copy')
+    return (1 if plan.errors else 0, output)
+
+
+@streaming
+def cmd_mv(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Move or rename files and directories (--dry-run -j N)"""
+    try:
+        flags, threads, operands = _parse_file_op(args, 'mv')
+    except ValueError as e:
         return (1, f"[ERROR] {e}")
+    if len(operands) < 2:
+        return (1, "[ERROR] mv: missing destination\nUsage: mv [--dry-run] [-j N] <source>... <dest>")
+    
+    paths = [str(shell.resolve_path(p)) for p in operands]
+    plan = plan_move(paths[:-1], paths[-1])
+    if plan.errors and not (plan.total_files or plan.dirs or plan.renames):
+        return (1, '\n'.join(f"[ERROR] mv: {e}" for e in plan.errors))
+    output = _file_op_output('MV', plan, lambda: execute_move(plan, threads, shell.cancel_event),
+                             shell, 'dry-run' in flags, 'move')
+    return (1 if plan.errors else 0, output)
 
 
 def cmd_open(args: List[str], shell) -> Tuple[int, str]:
@@ -250,9 +542,7 @@ def cmd_open(args: List[str], shell) -> Tuple[int, str]:
     filename = args[0]
     
     try:
-        file_path = Path(filename)
-        if not file_path.is_absolute():
-            file_path = shell.cwd / file_path
+        file_path = shell.resolve_path(filename)
         
         if not file_path.exists():
             return (1, f"[ERROR] File not found: {filename}")
@@ -279,9 +569,7 @@ def cmd_create(args: List[str], shell) -> Tuple[int, str]:
     filename = args[0]
     
     try:  
-        file_path = Path(filename)
-        if not file_path.is_absolute():
-            file_path = shell.cwd / file_path
+        file_path = shell.resolve_path(filename)
         
         if file_path.exists():
             return (1, f"[ERROR] File already exists: {filename}")
@@ -367,98 +655,6 @@ def cmd_ui(args: List[str], shell) -> Tuple[int, str]:
     return (0, ui_menu)
 
 
-def cmd_help(args: List[str], shell) -> Tuple[int, str]:
-    """Display help"""
-    if args:
-        cmd = args[0]
-        if cmd in shell.commands:
-            doc = shell.commands[cmd].__doc__ or "No help available"
-            return (0, f"[HELP] {cmd}:  {doc}")
-        return (1, f"[ERROR] Help:  command '{cmd}' not found")
-    
-    help_text = """
-[HELP] NEXTGEN-BASH - Available Commands
-================================================================================
-
-FILES:
-  ls [path]           - List directory
-  cd [path]           - Change directory
-  pwd                 - Print working directory
-  cat <file>          - Display file
-  open <file>         - Open file
-  create <file>       - Create file
-  touch <file>        - Create empty file
-  mkdir <dir>         - Create directory
-  rm <file>           - Remove file
-
-TEXT: 
-  grep <pattern> <file> - Search text
-  echo <text>           - Print text
-  head [-n N] <file>    - Show first lines
-  tail [-n N] <file>    - Show last lines
-  find <pattern>        - Find files
-
-AI:
-  ai help <cmd>       - Explain command
-  ai fix              - Fix last error
-  ai explain          - Explain last command
-  ai bash <text>      - Convert to bash
-
-EXTEND:
-  mkcmd <name>        - Create custom command
-  editcmd <name>      - Edit command
-  reloadcmd           - Reload commands
-  cmds                - List all commands
-
-SANDBOX:
-  sandbox on|off      - Toggle sandbox
-  dryrun <cmd>        - Simulate command
-  trace <cmd>         - Trace execution
-
-ASCII:
-  theme list          - Show themes
-  theme set <name>    - Change theme
-  ascii banner        - Show banner
-  ascii clock         - Show clock
-
-VISUALIZE:
-  tree+               - Directory tree
-  ls+                 - Files with symbols
-  cat+                - Cat with highlights
-  preview <file>      - File preview
-  pipeviz             - Pipe visualization
-
-SESSION:
-  session save        - Save session
-  session load        - Load session
-  history [N]         - Show history
-  stats               - Statistics
-
-LANGUAGE:
-  lang list           - Show languages
-  lang set <code>     - Change language
-
-UTILITIES:
-  ui                  - Show this UI
-  help                - Show help
-  clear               - Clear screen
-  exit                - Exit shell
-
-EXAMPLES:
-  → ls
-  → cd projects
-  → cat file.txt
-  → ai help grep
-  → ui
-  → lang set ru
-  → theme set dos
-  → history 20
-
-================================================================================
-"""
-    return (0, help_text)
-
-
 COMMANDS = {
     'ls': cmd_ls,
     'cd': cmd_cd,
@@ -468,14 +664,19 @@ COMMANDS = {
     'cat': cmd_cat,
     'head': cmd_head,
     'tail': cmd_tail,
+    'less': cmd_less,
+    'more': cmd_more,
     'grep': cmd_grep,
     'find': cmd_find,
     'echo':  cmd_echo,
+    'source': cmd_source,
+    'sleep': cmd_sleep,
     'touch': cmd_touch,
     'mkdir': cmd_mkdir,
     'rm': cmd_rm,
+    'cp': cmd_cp,
+    'mv': cmd_mv,
     'open': cmd_open,
     'create': cmd_create,
     'ui': cmd_ui,
-    'help': cmd_help,
 }
\ No newline at end of file
@@ -69,22 +69,8 @@ def cmd_reloadcmd(args: List[str], shell) -> Tuple[int, str]:
         return (1, f"[ERROR] {e}")
 
 
-def cmd_cmds(args: List[str], shell) -> Tuple[int, str]:
-    """List all commands"""
-    cmds_list = sorted(list(shell.commands.keys()))
-    
-    output = f"\n[COMMANDS] Total:  {len(cmds_list)}\n"
-    output += "=" * 60 + "\n"
-    
-    for cmd in cmds_list:
-        output += f"  {cmd}\n"
-    
-    return (0, output)
-
-
 COMMANDS = {
     'mkcmd': cmd_mkcmd,
     'editcmd': cmd_editcmd,
     'reloadcmd': cmd_reloadcmd,
-    'cmds': cmd_cmds,
 }
\ No newline at end of file
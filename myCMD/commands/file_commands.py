@@ -4,7 +4,6 @@ File operations - open and create files from console
 """
 
 from typing import List, Tuple
-from pathlib import Path
 
 
 def cmd_open(args: List[str], shell) -> Tuple[int, str]:
@@ -15,9 +14,7 @@ def cmd_open(args: List[str], shell) -> Tuple[int, str]:
     filename = args[0]
     
     try:
-        file_path = Path(filename)
-        if not file_path.is_absolute():
-            file_path = shell.cwd / file_path
+        file_path = shell.resolve_path(filename)
         
         if not file_path.exists():
             return (1, f"[ERROR] File not found: {filename}")
@@ -44,9 +41,7 @@ def cmd_create(args: List[str], shell) -> Tuple[int, str]:
     filename = args[0]
     
     try: 
-        file_path = Path(filename)
-        if not file_path.is_absolute():
-            file_path = shell.cwd / file_path
+        file_path = shell.resolve_path(filename)
         
         if file_path.exists():
             return (1, f"[ERROR] File already exists: {filename}\n[INFO] Use 'rm {filename}' to delete first")
@@ -72,9 +67,7 @@ def cmd_edit(args: List[str], shell) -> Tuple[int, str]:
     filename = args[0]
     
     try: 
-        file_path = Path(filename)
-        if not file_path.is_absolute():
-            file_path = shell.cwd / file_path
+        file_path = shell.resolve_path(filename)
         
         if not file_path.exists():
             return (1, f"[ERROR] File not found: {filename}")
@@ -97,7 +90,7 @@ def cmd_ls_long(args: List[str], shell) -> Tuple[int, str]:
     path = args[0] if args else '.'
     
     try:
-        p = Path(path)
+        p = shell.resolve_path(path)
         if not p.exists():
             return (1, f"[ERROR] Not found: {path}")
         
@@ -110,17 +103,17 @@ def cmd_ls_long(args: List[str], shell) -> Tuple[int, str]:
         output += "-" * 80 + "\n"
         
         try:
-            items = sorted(p.iterdir())
+            items = shell.dir_cache.listing(p)
         except PermissionError:
             return (1, f"[ERROR] Permission denied: {path}")
         
         for item in items:
-            if item.is_dir():
+            if item.is_dir:
                 type_str = "[DIR]"
                 size_str = "-"
             else:
                 type_str = "[FILE]"
-                size_str = f"{item. stat().st_size} bytes"
+                size_str = f"{item.size} bytes"
             
             name = item.name
             if len(name) > 35:
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Help and command listing
+Read from the command manifest, so they import no other command module
+"""
+
+from typing import List, Tuple
+
+
+def _describe(name: str, shell) -> str:
+    """Help text from the manifest; custom commands and plugins use their docstring"""
+    entry = shell.registry.manifest.get(name)
+    if entry is not None:
+        return entry[2]
+    return (shell.commands[name].__doc__ or "No help available").strip().splitlines()[0]
+
+
+def cmd_help(args: List[str], shell) -> Tuple[int, str]:
+    """Display help"""
+    if args:
+        cmd = args[0]
+        if cmd in shell.commands:
+            return (0, f"[HELP] {cmd}:  {_describe(cmd, shell)}")
+        return (1, f"[ERROR] Help:  command '{cmd}' not found")
+    
+    help_text = """
+[HELP] NEXTGEN-BASH - Available Commands
+================================================================================
+
+FILES:
+  ls [path]           - List directory
+  ls-la [path]        - List with types and sizes
+  cd [path]           - Change directory
+  pwd                 - Print working directory
+  cat <file>          - Display file
+  cat -x|-v <file>    - Hex dump / show binary bytes
+  open <file>         - Open file
+  create <file>       - Create file
+  touch <file>        - Create empty file
+  mkdir <dir>         - Create directory
+  rm [-rf] <path>     - Remove files or directories
+  cp [-r] <src> <dst> - Copy files or trees
+  mv <src> <dst>      - Move or rename
+  (cp/mv/rm: --dry-run shows totals, -j N sets threads)
+
+TEXT: 
+  grep <pattern> <file> - Search text
+  grep -rnicvlEF ...    - Regex, recursive, count
+  echo <text>           - Print text
+  head [-n N] <file>    - Show first lines
+  tail [-n N] <file>    - Show last lines
+  tail -f|-F <file>     - Follow appends (Ctrl+C stops)
+  less <file>, cmd | less - Page output (Enter, b, /text, q)
+  more <file>           - Like less, quits at the end
+  find <pattern>        - Find files by name
+  find [path] -name G -type f|d -maxdepth N
+       -size +1M -mtime -7 -prune .git -parallel N
+  index build [path]    - Index paths (--prune .git); update, status
+  locate [-i] <text|glob> - Search the file index
+  source <file>         - Run commands from a script
+  sleep <seconds>       - Wait (async, non-blocking)
+
+AI:
+  ai help <cmd>       - Explain command
+  ai fix              - Fix last error
+  ai explain          - Explain last command
+  ai bash <text>      - Convert to bash
+
+EXTEND:
+  mkcmd <name>        - Create custom command
+  editcmd <name>      - Edit command
+  reloadcmd           - Reload commands
+  cmds                - List all commands
+
+SANDBOX:
+  sandbox on|off      - Toggle sandbox
+  dryrun <cmd>        - Simulate command
+  trace <cmd>         - Trace execution
+
+ASCII:
+  theme list          - Show themes
+  theme set <name>    - Change theme
+  ascii banner        - Show banner
+  ascii clock         - Show clock
+
+VISUALIZE:
+  tree+               - Directory tree
+  ls+                 - Files with symbols
+  cat+                - Cat with highlights
+  preview <file>      - File preview
+  pipeviz             - Pipe visualization
+
+JOBS:
+  <cmd> &             - Run command in background
+  jobs                - List background jobs
+  fg [%n]             - Wait for job, show output
+  wait [%n]           - Wait for jobs
+  kill %n             - Kill job
+
+SESSION:
+  session save        - Save session
+  session load        - Load session
+  history [N]         - Show history
+  stats               - Statistics
+  perf [reset|dump]   - Command latency histograms
+
+LANGUAGE:
+  lang list           - Show languages
+  lang set <code>     - Change language
+
+UTILITIES:
+  ui                  - Show this UI
+  help                - Show help
+  clear               - Clear screen
+  exit                - Exit shell
+
+EXAMPLES:
+  → ls
+  → cd projects
+  → cat file.txt
+  → ai help grep
+  → ui
+  → lang set ru
+  → theme set dos
+  → history 20
+
+================================================================================
+"""
+    return (0, help_text)
+
+
+
+def cmd_cmds(args: List[str], shell) -> Tuple[int, str]:
+    """List all commands"""
+    cmds_list = sorted(shell.commands.keys())
+    width = max((len(cmd) for cmd in cmds_list), default=0)
+    
+    output = f"\n[COMMANDS] Total:  {len(cmds_list)}\n"
+    output += "=" * 60 + "\n"
+    
+    for cmd in cmds_list:
+        output += f"  {cmd:<{width}}  {_describe(cmd, shell)}\n"
+    
+    return (0, output)
+
+
+COMMANDS = {
+    'help': cmd_help,
+    'cmds': cmd_cmds,
+}
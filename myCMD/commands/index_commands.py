@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent file index: index build/update/status/drop and locate
+"""
+
+import time
+from typing import Iterable, List, Tuple
+
+from core.file_index import FileIndex
+from core.fswalk import human_size
+from core.pipeline import CommandCancelled, streaming
+
+
+def _index(shell):
+    if getattr(shell, 'index_file', None) is None:
+        return None
+    return FileIndex(shell.index_file)
+
+
+def cmd_index(args: List[str], shell) -> Tuple[int, str]:
+    """Build and manage the file index (build [path] [--prune G], update, status, drop)"""
+    usage = "Usage: index build [path] [--prune GLOB]... | index update | index status | index drop <path>"
+    index = _index(shell)
+    if index is None:
+        return (1, "[ERROR] index: no index file configured")
+    action = args[0] if args else 'status'
+    rest = args[1:]
+    
+    if action in ('build', 'update'):
+        prune = None
+        paths = []
+        i = 0
+        while i < len(rest):
+            if rest[i] == '--prune':
+                if i + 1 >= len(rest):
+                    return (1, f"[ERROR] index: --prune needs a glob\n{usage}")
+                prune = (prune or []) + [rest[i + 1]]
+                i += 2
+            else:
+                paths.append(rest[i])
+                i += 1
+        
+        if action == 'update' and not paths:
+            roots = [root.path for root in index.roots()]
+            if not roots:
+                return (1, "[ERROR] index: nothing indexed yet; run 'index build <path>'")
+        else:
+            roots = [str(shell.resolve_path(p)) for p in paths or ['.']]
+        
+        output = ""
+        for root in roots:
+            if not shell.resolve_path(root).is_dir():
+                output += f"[ERROR] index: not a directory: {root}\n"
+                continue
+            stats = index.build(root, prune, cancel=shell.cancel_event)
+            if shell.cancel_event.is_set():
+                return (130, output + f"[INDEX] {root}: cancelled (partial index kept)")
+            rate = (stats.files + stats.dirs) / stats.seconds if stats.seconds else 0
+            output += (f"[INDEX] {stats.root}: {stats.files} files, {stats.dirs} dirs "
+                       f"({stats.scanned} dirs re-read) in {stats.seconds:.2f}s, {rate:.0f} entries/s\n")
+        output += f"[INDEX] Index size: {human_size(index.size())}"
+        return (0 if "[ERROR]" not in output else 1, output)
+    
+    if action == 'status':
+        roots = index.roots()
+        if not roots:
+            return (0, "[INFO] Nothing indexed yet; run 'index build <path>'")
+        output = f"\n[INDEX] {index.path} ({human_size(index.size())})\n"
+        output += "=" * 60 + "\n"
+        for root in roots:
+            age = time.strftime('%Y-%m-%d %H:%M', time.localtime(root.built_at))
+            output += (f"  {root.path}\n"
+                       f"    {root.files} files, {root.dirs} dirs, updated {age} "
+                       f"({root.build_seconds:.2f}s, {root.scanned} dirs re-read)\n")
+        return (0, output)
+    
+    if action == 'drop':
+        if not rest:
+            return (1, f"[ERROR] index: drop needs a path\n{usage}")
+        root = str(shell.resolve_path(rest[0]))
+        if not index.drop(root):
+            return (1, f"[ERROR] index: not indexed: {root}")
+        return (0, f"[INDEX] Dropped {root}")
+    
+    return (1, f"[ERROR] index: unknown action '{action}'\n{usage}")
+
+
+@streaming
+def cmd_locate(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Find indexed paths by substring or glob (-i, -n N)"""
+    usage = "Usage: locate [-i] [-n N] <substring|glob>"
+    ignore_case = False
+    limit = None
+    patterns = []
+    i = 0
+    while i < len(args):
+        if args[i] == '-i':
+            ignore_case = True
+        elif args[i] == '-n':
+            if i + 1 >= len(args) or not args[i + 1].isdigit():
+                return (1, f"[ERROR] locate: -n needs a number\n{usage}")
+            limit = int(args[i + 1])
+            i += 1
+        else:
+            patterns.append(args[i])
+        i += 1
+    
+    if len(patterns) != 1:
+        return (1, f"[ERROR] locate: expected one pattern\n{usage}")
+    index = _index(shell)
+    if index is None:
+        return (1, "[ERROR] locate: no index file configured")
+    if not index.roots():
+        return (1, "[ERROR] locate: nothing indexed yet; run 'index build <path>'")
+    
+    cancel = shell.cancel_event
+    
+    def generate():
+        for path in index.locate(patterns[0], ignore_case, limit):
+            if cancel.is_set():
+                raise CommandCancelled()
+            yield path
+    
+    return (0, generate())
+
+
+COMMANDS = {
+    'index': cmd_index,
+    'locate': cmd_locate,
+}
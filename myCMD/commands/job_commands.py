@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Background job control: jobs, fg, wait, kill
+"""
+
+from typing import List, Tuple
+
+WAIT_POLL = 0.1         # seconds between cancellation checks while waiting
+
+
+def _wait_job(job, shell) -> bool:
+    """Wait for a job until it finishes (True) or the shell is cancelled (False)"""
+    while not shell.jobs.wait(job, timeout=WAIT_POLL):
+        if shell.cancel_event.is_set():
+            return False
+    return True
+
+
+def _still_running(job) -> str:
+    return f"^C\n[{job.id}]  Running in background  {job.command}"
+
+
+def cmd_jobs(args: List[str], shell) -> Tuple[int, str]:
+    """List background jobs"""
+    jobs = list(shell.jobs.jobs.values())
+    if not jobs:
+        return (0, "[INFO] No background jobs")
+
+    output = "\n[JOBS]\n"
+    output += "=" * 60 + "\n"
+    for job in jobs:
+        output += f"  {job.describe()}\n"
+
+    return (0, output)
+
+
+def cmd_fg(args: List[str], shell) -> Tuple[int, str]:
+    """Wait for a job and show its output"""
+    job = shell.jobs.get(args[0] if args else None)
+    if job is None:
+        return (1, f"[ERROR] fg: no such job{' ' + args[0] if args else ''}")
+
+    if not _wait_job(job, shell):
+        return (130, _still_running(job))
+    shell.jobs.remove(job)
+
+    if job.status == 'killed':
+        return (1, f"[{job.id}] Killed  {job.command}")
+    return (job.code or 0, job.output)
+
+
+def cmd_wait(args: List[str], shell) -> Tuple[int, str]:
+    """Wait for background jobs to finish"""
+    if args:
+        jobs = [shell.jobs.get(spec) for spec in args]
+        if None in jobs:
+            return (1, "[ERROR] wait: no such job")
+    else:
+        jobs = list(shell.jobs.jobs.values())
+
+    code = 0
+    outputs = []
+    for job in jobs:
+        if not _wait_job(job, shell):
+            outputs.append(_still_running(job))
+            code = 130
+            break
+        shell.jobs.remove(job)
+        code = job.code if job.code is not None else 1
+        outputs.append(job.describe())
+        if job.output:
+            outputs.append(job.output)
+
+    return (code, '\n'.join(outputs))
+
+
+def cmd_kill(args: List[str], shell) -> Tuple[int, str]:
+    """Kill a background job"""
+    if not args:
+        return (1, "[ERROR] kill: usage: kill %n")
+
+    killed = []
+    for spec in args:
+        job = shell.jobs.get(spec)
+        if job is None:
+            return (1, f"[ERROR] kill: no such job {spec}")
+        if not shell.jobs.kill(job):
+            return (1, f"[ERROR] kill: job {spec} has already finished")
+        killed.append(f"[{job.id}] Killed  {job.command}")
+
+    return (0, '\n'.join(killed))
+
+
+COMMANDS = {
+    'jobs': cmd_jobs,
+    'fg': cmd_fg,
+    'wait': cmd_wait,
+    'kill': cmd_kill,
+}
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Built-in command manifest
+Maps command name -> (module, function, help text) so the shell can start
+without importing any command module. Keep in sync with each COMMANDS dict.
+"""
+
+MODULES = (
+    'bash_commands',
+    'ai_commands',
+    'extend_commands',
+    'sandbox_commands',
+    'ascii_commands',
+    'viz_commands',
+    'session_commands',
+    'language_commands',
+    'job_commands',
+    'file_commands',
+    'index_commands',
+    'help_commands',
+)
+
+MANIFEST = {
+    # bash_commands
+    'ls': ('bash_commands', 'cmd_ls', 'List directory contents'),
+    'cd': ('bash_commands', 'cmd_cd', 'Change directory'),
+    'pwd': ('bash_commands', 'cmd_pwd', 'Print working directory'),
+    'clear': ('bash_commands', 'cmd_clear', 'Clear screen'),
+    'exit': ('bash_commands', 'cmd_exit', 'Exit shell'),
+    'cat': ('bash_commands', 'cmd_cat', 'Display file contents'),
+    'head': ('bash_commands', 'cmd_head', 'Display first lines'),
+    'tail': ('bash_commands', 'cmd_tail', 'Display last lines'),
+    'less': ('bash_commands', 'cmd_less', 'Page through output'),
+    'more': ('bash_commands', 'cmd_more', 'Page through output'),
+    'grep': ('bash_commands', 'cmd_grep', 'Search text patterns'),
+    'find': ('bash_commands', 'cmd_find', 'Find files by name, type, size or age'),
+    'echo': ('bash_commands', 'cmd_echo', 'Print text'),
+    'source': ('bash_commands', 'cmd_source', 'Run commands from a script file'),
+    'sleep': ('bash_commands', 'cmd_sleep', 'Wait for N seconds'),
+    'touch': ('bash_commands', 'cmd_touch', 'Create empty file'),
+    'mkdir': ('bash_commands', 'cmd_mkdir', 'Create directory'),
+    'rm': ('bash_commands', 'cmd_rm', 'Remove files or directories'),
+    'cp': ('bash_commands', 'cmd_cp', 'Copy files and directories'),
+    'mv': ('bash_commands', 'cmd_mv', 'Move or rename files'),
+    'open': ('bash_commands', 'cmd_open', 'Open and display file'),
+    'create': ('bash_commands', 'cmd_create', 'Create a new file'),
+    'ui': ('bash_commands', 'cmd_ui', 'Show ASCII UI menu'),
+
+    # ai_commands
+    'ai': ('ai_commands', 'cmd_ai_help', 'AI explanation of a command'),
+
+    # extend_commands
+    'mkcmd': ('extend_commands', 'cmd_mkcmd', 'Create new custom command'),
+    'editcmd': ('extend_commands', 'cmd_editcmd', 'Edit custom command'),
+    'reloadcmd': ('extend_commands', 'cmd_reloadcmd', 'Reload commands'),
+
+    # sandbox_commands
+    'sandbox': ('sandbox_commands', 'cmd_sandbox', 'Toggle sandbox mode'),
+    'dryrun': ('sandbox_commands', 'cmd_dryrun', 'Show what command would do'),
+    'trace': ('sandbox_commands', 'cmd_trace', 'Step-by-step execution'),
+
+    # ascii_commands
+    'theme': ('ascii_commands', 'cmd_theme', 'Manage themes'),
+    'ascii': ('ascii_commands', 'cmd_ascii', 'ASCII art utilities'),
+    'banner': ('ascii_commands', 'cmd_banner', 'Display banner'),
+    'map': ('ascii_commands', 'cmd_map', 'Toggle system map'),
+
+    # viz_commands
+    'tree+': ('viz_commands', 'cmd_tree_plus', 'Display directory tree'),
+    'ls+': ('viz_commands', 'cmd_ls_plus', 'ls with symbols'),
+    'cat+': ('viz_commands', 'cmd_cat_plus', 'cat with formatting'),
+    'preview': ('viz_commands', 'cmd_preview', 'Preview file'),
+    'pipeviz': ('viz_commands', 'cmd_pipeviz', 'Visualize pipe chain'),
+    'dna': ('viz_commands', 'cmd_dna', 'Show command structure'),
+    'fsmap': ('viz_commands', 'cmd_fsmap', 'Watch filesystem'),
+    'timeflow': ('viz_commands', 'cmd_timeflow', 'Timeline of commands'),
+    'simulate': ('viz_commands', 'cmd_simulate', 'Simulate command execution'),
+
+    # session_commands
+    'session': ('session_commands', 'cmd_session', 'Manage sessions'),
+    'history': ('session_commands', 'cmd_history', 'Show command history'),
+    'stats': ('session_commands', 'cmd_stats', 'Show usage statistics'),
+    'profile': ('session_commands', 'cmd_profile', 'Profile command performance'),
+    'perf': ('session_commands', 'cmd_perf', 'Per-command latency histograms'),
+    'timeline': ('session_commands', 'cmd_timeline', 'Timeline visualization'),
+
+    # language_commands
+    'lang': ('language_commands', 'cmd_lang', 'Language management'),
+
+    # job_commands
+    'jobs': ('job_commands', 'cmd_jobs', 'List background jobs'),
+    'fg': ('job_commands', 'cmd_fg', 'Wait for a job and show its output'),
+    'wait': ('job_commands', 'cmd_wait', 'Wait for background jobs to finish'),
+    'kill': ('job_commands', 'cmd_kill', 'Kill a background job'),
+
+    # file_commands
+    'ls-la': ('file_commands', 'cmd_ls_long', 'List files with details'),
+    'edit': ('file_commands', 'cmd_edit', 'Show file for editing'),
+
+    # index_commands
+    'index': ('index_commands', 'cmd_index', 'Build and manage the file index'),
+    'locate': ('index_commands', 'cmd_locate', 'Find indexed paths instantly'),
+
+    # help_commands
+    'help': ('help_commands', 'cmd_help', 'Display help'),
+    'cmds': ('help_commands', 'cmd_cmds', 'List all commands'),
+}
+
+# First-argument keywords, used by tab completion
+SUBCOMMANDS = {
+    'lang': ('list', 'set', 'current'),
+    'theme': ('list', 'set'),
+    'session': ('save', 'load', 'reset'),
+    'map': ('on', 'off', 'once'),
+    'perf': ('show', 'reset', 'dump'),
+    'index': ('build', 'update', 'status', 'drop'),
+    'ascii': ('banner', 'clock', 'matrix'),
+    'fsmap': ('watch',),
+}
@@ -35,9 +35,11 @@ def cmd_history(args: List[str], shell) -> Tuple[int, str]:
     if not shell. history:
         return (0, "[INFO] No command history")
     
-    output = f"\n[HISTORY] Last {limit} commands\n"
+    entries = shell.history.tail(limit)
+    
+    output = f"\n[HISTORY] Last {len(entries)} commands\n"
     output += "=" * 60 + "\n"
-    for i, cmd in enumerate(shell. history[-limit:], len(shell.history) - limit + 1):
+    for i, cmd in enumerate(entries, len(shell.history) - len(entries) + 1):
         output += f"  {i: 3d}. {cmd}\n"
     
     return (0, output)
@@ -48,13 +50,22 @@ def cmd_stats(args: List[str], shell) -> Tuple[int, str]:
     if not shell.history:
         return (0, "[INFO] No statistics available")
     
-    commands_used = [cmd. split()[0] for cmd in shell. history if cmd.split()]
+    commands_used = [cmd.split()[0] for cmd in shell.history.recent() if cmd.split()]
     top_commands = Counter(commands_used).most_common(5)
     
     output = f"\n[STATS]\n"
     output += "=" * 60 + "\n"
     output += f"Total commands: {len(shell.history)}\n"
     output += f"Unique commands: {len(set(commands_used))}\n"
+    output += f"Startup time: {shell.startup_time * 1000:.1f} ms\n"
+    output += f"Command modules loaded: {len(shell.registry.loaded_modules())}/{len(shell.builtin_cmds)}\n"
+    inline_ns, deferred_ns = shell.hooks.total_time_ns()
+    hook_calls = sum(s.calls for s in shell.hooks.stats.values())
+    output += f"Hook time: {inline_ns / 1e6:.2f} ms inline ({hook_calls} calls), "
+    output += f"{deferred_ns / 1e6:.2f} ms deferred ({shell.hooks.pending()} queued)\n"
+    cache = shell.dir_cache.stats()
+    output += f"Dir cache: {cache['hit_rate']:.0%} hit rate ({cache['hits']} hits, {cache['misses']} misses), "
+    output += f"{cache['dirs']} dirs / {cache['entries']} entries\n"
     output += f"\nTop 5 commands:\n"
     
     for cmd, count in top_commands:
@@ -84,6 +95,30 @@ def cmd_profile(args: List[str], shell) -> Tuple[int, str]:
     return (0, output_msg)
 
 
+def cmd_perf(args: List[str], shell) -> Tuple[int, str]:
+    """Show, reset or dump per-command latency histograms"""
+    subcmd = args[0] if args else 'show'
+    
+    if subcmd == 'show':
+        limit = int(args[1]) if len(args) > 1 and args[1].isdigit() else 20
+        if not shell.perf.histograms:
+            return (0, "[INFO] No timings recorded yet")
+        output = "\n[PERF] Command latency (monotonic clock)\n"
+        output += "=" * 78 + "\n"
+        output += '\n'.join(shell.perf.report(limit)) + "\n"
+        return (0, output)
+    elif subcmd == 'reset':
+        shell.perf.reset()
+        return (0, "[OK] Perf counters reset")
+    elif subcmd == 'dump':
+        filename = args[1] if len(args) > 1 else "perf.json"
+        path = shell.resolve_path(filename)
+        count = shell.perf.dump(path)
+        return (0, f"[OK] Dumped {count} command histograms to {path}")
+    else:
+        return (1, f"[ERROR] perf: unknown subcommand '{subcmd}' (show, reset, dump)")
+
+
 def cmd_timeline(args: List[str], shell) -> Tuple[int, str]:
     """Timeline visualization"""
     if not shell.history:
@@ -91,7 +126,7 @@ def cmd_timeline(args: List[str], shell) -> Tuple[int, str]:
     
     output = "\n[TIMELINE]\n"
     output += "=" * 60 + "\n"
-    for i, cmd in enumerate(shell. history[-10:], 1):
+    for i, cmd in enumerate(shell.history.tail(10), 1):
         output += f"  {i}. {cmd}\n"
     
     return (0, output)
@@ -102,5 +137,6 @@ COMMANDS = {
     'history': cmd_history,
     'stats': cmd_stats,
     'profile': cmd_profile,
+    'perf': cmd_perf,
     'timeline': cmd_timeline,
 }
\ No newline at end of file
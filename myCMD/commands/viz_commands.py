@@ -3,52 +3,139 @@
 Data visualization commands
 """
 
-from pathlib import Path
-from typing import List, Tuple
+import os
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
+from core.fswalk import disk_usage, human_size
+from core.pipeline import CommandCancelled, streaming
 
-def cmd_tree_plus(args: List[str], shell) -> Tuple[int, str]:
-    """Display directory tree"""
-    path = Path(args[0]) if args else shell.cwd
-    max_depth = int(args[1]) if len(args) > 1 else 3
+
+def _tree_lines(root, list_dir: Callable, max_depth: int, dirs_only: bool = False,
+                max_entries: Optional[int] = None, label: Optional[Callable] = None) -> Iterator[str]:
+    """Render a tree iteratively, one line at a time.
+
+    `list_dir(path)` returns sorted CachedEntry items or raises
+    OSError; `label(path)` adds a suffix to directory lines.
+    """
+    def children(path):
+        items = list_dir(path)
+        return [item for item in items if item.is_dir] if dirs_only else items
     
-    def tree_render(directory, prefix="", depth=0):
-        if depth >= max_depth:
-            return ""
+    try:
+        stack = [[children(root), 0, "", 1]]
+    except OSError as e:
+        yield f"[ERROR] {e.strerror or e}"
+        return
+    
+    shown = 0
+    while stack:
+        frame = stack[-1]
+        items, i, prefix, depth = frame
+        if i >= len(items):
+            stack.pop()
+            continue
+        frame[1] = i + 1
         
-        output = ""
-        try:
-            items = sorted(list(directory.iterdir()))
-        except: 
-            return output
+        if max_entries is not None and shown >= max_entries:
+            yield f"... stopped after {max_entries} entries (--max-entries)"
+            return
+        item = items[i]
+        is_last = i == len(items) - 1
+        marker = "[D] " if item.is_dir else "[F] "
+        suffix = label(item.path) if label is not None and item.is_dir else ""
+        yield f"{prefix}{'L-- ' if is_last else '|-- '}{marker}{item.name}{suffix}"
+        shown += 1
         
-        for i, item in enumerate(items):
-            is_last = i == len(items) - 1
-            current_prefix = "L-- " if is_last else "|-- "
-            dir_marker = "[D] " if item.is_dir() else "[F] "
-            output += f"{prefix}{current_prefix}{dir_marker}{item.name}\n"
-            
-            if item.is_dir() and depth < max_depth - 1:
-                next_prefix = prefix + ("    " if is_last else "|   ")
-                output += tree_render(item, next_prefix, depth + 1)
+        if item.is_dir and depth < max_depth:
+            next_prefix = prefix + ("    " if is_last else "|   ")
+            try:
+                stack.append([children(item.path), 0, next_prefix, depth + 1])
+            except OSError as e:
+                yield f"{next_prefix}[ERROR] {e.strerror or e}"
+
+
+@streaming
+def cmd_tree_plus(args: List[str], shell, stdin=None) -> Tuple[int, Iterable[str]]:
+    """Display directory tree (--max-entries N --dirs-only --du --parallel N)"""
+    usage = "Usage: tree+ [path] [depth] [--max-entries N] [--dirs-only] [--du [--parallel N]]"
+    positional = []
+    max_entries = None
+    threads = 1
+    i = 0
+    try:
+        while i < len(args):
+            arg = args[i]
+            if arg in ('--max-entries', '--parallel'):
+                value = int(args[i + 1])
+                if value < 1:
+                    raise ValueError(arg)
+                if arg == '--max-entries':
+                    max_entries = value
+                else:
+                    threads = value
+                i += 2
+                continue
+            if arg not in ('--dirs-only', '--du'):
+                positional.append(arg)
+            i += 1
+        path = shell.resolve_path(positional[0]) if positional else shell.cwd
+        max_depth = int(positional[1]) if len(positional) > 1 else 3
+    except (IndexError, ValueError):
+        return (1, f"[ERROR] tree+: invalid arguments\n{usage}")
+    
+    if '--parallel' in args and '--du' not in args:
+        # The plain tree streams from the dir cache; only the --du walk is parallel
+        return (1, f"[ERROR] tree+: --parallel needs --du\n{usage}")
+    if not path.is_dir():
+        return (1, f"[ERROR] tree+: not a directory: {path}")
+    dirs_only = '--dirs-only' in args
+    cancel = shell.cancel_event
+    
+    if '--du' not in args:
+        def list_dir(directory):
+            return shell.dir_cache.listing(directory, with_stat=False)
+        
+        def generate():
+            yield f"[TREE] {path}/"
+            for line in _tree_lines(path, list_dir, max_depth, dirs_only, max_entries):
+                if cancel.is_set():
+                    raise CommandCancelled()
+                yield line
         
-        return output
+        return (0, generate())
     
-    try:
-        return (0, f"[TREE] {path}/\n" + tree_render(path))
-    except Exception as e:
-        return (1, f"[ERROR] {e}")
+    def generate_du():
+        # One pass over the whole subtree: sizes need every file, the
+        # listing is only kept down to the displayed depth
+        totals, children, errors = disk_usage(str(path), max_depth, threads, cancel)
+        if cancel.is_set():
+            raise CommandCancelled()
+        
+        def list_dir(directory):
+            directory = str(directory)
+            if directory in errors:
+                raise OSError(0, errors[directory])
+            return children.get(directory, [])
+        
+        def label(directory):
+            files, size = totals.get(str(directory), (0, 0))
+            return f"  ({files} files, {human_size(size)})"
+        
+        yield f"[TREE] {path}/{label(os.path.abspath(path))}"
+        yield from _tree_lines(os.path.abspath(path), list_dir, max_depth, dirs_only, max_entries, label)
+    
+    return (0, generate_du())
 
 
 def cmd_ls_plus(args: List[str], shell) -> Tuple[int, str]:
     """ls with symbols"""
-    path = Path(args[0]) if args else shell.cwd
+    path = shell.resolve_path(args[0]) if args else shell.cwd
     
     try:
-        items = sorted(list(path.iterdir()))
+        items = shell.dir_cache.listing(path, with_stat=False)
         output = "[LS+]\n"
         for item in items:
-            marker = "[D]" if item.is_dir() else "[F]"
+            marker = "[D]" if item.is_dir else "[F]"
             output += f"  {marker} {item.name}\n"
         
         return (0, output if output != "[LS+]\n" else "[LS+] (empty)")
@@ -62,7 +149,7 @@ def cmd_cat_plus(args: List[str], shell) -> Tuple[int, str]:
         return (1, "[ERROR] cat+: missing filename")
     
     try:
-        content = Path(args[0]).read_text()
+        content = shell.resolve_path(args[0]).read_text()
         
         lines = []
         for i, line in enumerate(content.split('\n'), 1):
@@ -83,7 +170,7 @@ def cmd_preview(args: List[str], shell) -> Tuple[int, str]:
         return (1, "[ERROR] preview:  missing filename")
     
     try:
-        content = Path(args[0]).read_text()
+        content = shell.resolve_path(args[0]).read_text()
         lines = content.split('\n')[:20]
         
         output = f"[PREVIEW] {args[0]}\n"
@@ -137,18 +224,18 @@ def cmd_fsmap(args: List[str], shell) -> Tuple[int, str]:
             
             output = ""
             try:
-                items = sorted(list(directory.iterdir()))[: 10]
+                items = shell.dir_cache.listing(directory, with_stat=False)[: 10]
             except:
                 return output
             
             for i, item in enumerate(items):
                 is_last = i == len(items) - 1
-                marker = "[D]" if item. is_dir() else "[F]"
-                output += f"{prefix}{'L-- ' if is_last else '|-- '}{marker} {item. name}\n"
+                marker = "[D]" if item.is_dir else "[F]"
+                output += f"{prefix}{'L-- ' if is_last else '|-- '}{marker} {item.name}\n"
                 
-                if item.is_dir() and depth < max_depth - 1:
+                if item.is_dir and depth < max_depth - 1:
                     next_prefix = prefix + ("    " if is_last else "|   ")
-                    output += show_tree(item, next_prefix, max_depth, depth + 1)
+                    output += show_tree(item.path, next_prefix, max_depth, depth + 1)
             
             return output
         
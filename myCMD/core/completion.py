@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+⇥ Tab completion
+Command names from a prefix trie, manifest subcommands, and paths
+"""
+
+import bisect
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+LISTING_TTL = 2.0           # seconds a directory listing is reused while typing
+LISTING_DIRS = 64           # directories kept
+
+_SEPARATORS = ('|', ';', '&&', '||', '&')
+
+
+class Trie:
+    """Prefix tree of words; words(prefix) walks only the matching branch"""
+
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self, words=()):
+        self.children: Dict[str, 'Trie'] = {}
+        self.terminal = False
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str):
+        node = self
+        for ch in word:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = Trie()
+            node = child
+        node.terminal = True
+
+    def words(self, prefix: str = "") -> List[str]:
+        """Every word starting with prefix, sorted"""
+        node = self
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        found = []
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.terminal:
+                found.append(word)
+            stack.extend((child, word + ch) for ch, child in node.children.items())
+        found.sort()
+        return found
+
+
+class Completer:
+    """Completions for a command line, shared by both UIs.
+
+    The first word of each pipeline stage completes against the command
+    trie, the second against the command's manifest subcommands, and
+    anything else (or a word containing a path separator) as a path.
+    Directory names come from the shell's DirCache, and each listing is
+    reused for LISTING_TTL seconds without touching the filesystem, so
+    repeated Tab presses in a huge directory are a bisect into a sorted
+    name list.
+    """
+
+    def __init__(self, shell):
+        self.shell = shell
+        self._commands: Optional[Trie] = None
+        self._command_key = None        # (registry generation, command count) when built
+        self._subcommands: Dict[str, Trie] = {}
+        self._listings: Dict[str, Tuple[float, List[str], List[bool]]] = {}
+
+    def copy(self, shell) -> 'Completer':
+        """Completer for another session, sharing the built tries"""
+        other = Completer(shell)
+        other._commands = self._commands
+        other._command_key = self._command_key
+        other._subcommands = self._subcommands
+        return other
+
+    def rebuild(self):
+        """Re-read command names (after reload_commands or new plugins)"""
+        commands = self.shell.commands
+        self._commands = Trie(commands)
+        self._command_key = self._current_key()
+        self._subcommands = {name: Trie(words)
+                             for name, words in self.shell.registry.subcommands.items()}
+
+    def _current_key(self) -> Tuple[int, int]:
+        return (self.shell.registry.generation, len(self.shell.commands))
+
+    def _command_trie(self) -> Trie:
+        # Sessions share the root's registry, so a reload there reaches every tab
+        if self._commands is None or self._command_key != self._current_key():
+            self.rebuild()
+        return self._commands
+
+    def complete(self, line: str) -> Tuple[int, List[str]]:
+        """(start, candidates): candidates replace line[start:]"""
+        stage = line
+        for sep in _SEPARATORS:
+            stage = stage.rsplit(sep, 1)[-1]
+        words = stage.split()
+        if stage[-1:].isspace() or not stage:
+            words.append('')
+        word = words[-1]
+        start = len(line) - len(word)
+
+        if os.sep in word or word.startswith(('.', '~')):
+            return start, self.paths(word)
+        if len(words) == 1:
+            return start, self._command_trie().words(word)
+        if len(words) == 2:
+            self._command_trie()
+            subcommands = self._subcommands.get(words[0])
+            if subcommands is not None:
+                return start, subcommands.words(word)
+        return start, self.paths(word)
+
+    def paths(self, word: str) -> List[str]:
+        """Paths starting with word, as typed; directories end with a separator"""
+        head, prefix = os.path.split(word)
+        directory = self.shell.resolve_path(os.path.expanduser(head) if head else '.')
+        listing = self._listing(str(directory))
+        if listing is None:
+            return []
+        names, is_dirs = listing
+        lo = bisect.bisect_left(names, prefix)
+        hi = bisect.bisect_left(names, prefix + '\U0010ffff')
+        show_hidden = prefix.startswith('.')
+        found = []
+        for i in range(lo, hi):
+            name = names[i]
+            if name.startswith('.') and not show_hidden:
+                continue
+            found.append(os.path.join(head, name) + (os.sep if is_dirs[i] else ''))
+        return found
+
+    def _listing(self, directory: str) -> Optional[Tuple[List[str], List[bool]]]:
+        now = time.monotonic()
+        cached = self._listings.get(directory)
+        if cached is not None and now - cached[0] < LISTING_TTL:
+            return cached[1], cached[2]
+        try:
+            entries = self.shell.dir_cache.listing(directory, with_stat=False)
+        except OSError:
+            return None
+        names = [entry.name for entry in entries]
+        is_dirs = [entry.is_dir for entry in entries]
+        if len(self._listings) >= LISTING_DIRS:
+            self._listings.pop(next(iter(self._listings)))
+        self._listings[directory] = (now, names, is_dirs)
+        return names, is_dirs
+
+
+def common_prefix(candidates: List[str]) -> str:
+    return os.path.commonprefix(candidates) if candidates else ""
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+🗃️ Persistent file index
+SQLite path index with a trigram full-text table, updated from directory mtimes
+"""
+
+import fnmatch
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from .fscache import RACY_NS
+
+SCHEMA_VERSION = 2
+BATCH_DIRS = 500        # directories rescanned per transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    prune TEXT NOT NULL DEFAULT '',
+    files INTEGER NOT NULL DEFAULT 0,
+    dirs INTEGER NOT NULL DEFAULT 0,
+    built_at REAL NOT NULL DEFAULT 0,
+    build_seconds REAL NOT NULL DEFAULT 0,
+    scanned INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dir_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    is_dir INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_dir ON entries(dir_id);
+"""
+
+# Kept in sync by hand rather than by triggers: one bulk insert per batch
+# is several times faster than a trigger firing per row
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    path, content='entries', content_rowid='id', tokenize='trigram');
+"""
+
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+
+class BuildStats(NamedTuple):
+    root: str
+    files: int
+    dirs: int
+    scanned: int        # directories whose entries were re-read
+    seconds: float
+
+
+class RootInfo(NamedTuple):
+    path: str
+    files: int
+    dirs: int
+    built_at: float
+    build_seconds: float
+    scanned: int
+
+
+class FileIndex:
+    """Paths under one or more roots, kept in a single SQLite file.
+
+    Every directory row stores the mtime it had when it was listed.  An
+    update stats each known directory and re-reads only those whose mtime
+    changed, so unchanged trees cost one stat() per directory.  Substring
+    and glob queries go through an FTS5 trigram table when SQLite has it,
+    and fall back to a table scan otherwise.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._fts: Optional[bool] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS entries_fts; DROP TABLE IF EXISTS entries; "
+                               "DROP TABLE IF EXISTS dirs; DROP TABLE IF EXISTS roots;")
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+            except sqlite3.OperationalError:     # no FTS5 / trigram tokenizer
+                pass
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            conn.commit()
+        if self._fts is None:
+            self._fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name='entries_fts'").fetchone() is not None
+        return conn
+
+    # ----- building -----
+
+    def build(self, root: str, prune: Optional[List[str]] = None,
+              cancel: Optional[threading.Event] = None,
+              progress: Optional[Callable[[int, int], None]] = None) -> BuildStats:
+        """Index `root`, re-reading only directories that changed.
+
+        `prune` globs name directories to leave out (e.g. '.git');
+        without it the root's previous setting is kept.
+        """
+        root = os.path.abspath(root)
+        start = time.perf_counter()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT prune FROM roots WHERE path=?", (root,)).fetchone()
+                if prune is None:
+                    prune = row[0].split('\0') if row and row[0] else []
+                elif row is not None and row[0] != '\0'.join(prune):
+                    self._forget(conn, root)        # pruned dirs changed: start over
+                stats = self._update(conn, root, prune, cancel, progress)
+                seconds = time.perf_counter() - start
+                conn.execute(
+                    "INSERT OR REPLACE INTO roots VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (root, '\0'.join(prune), stats[0], stats[1], time.time(), seconds, stats[2]))
+                conn.commit()
+            finally:
+                conn.close()
+        return BuildStats(root, stats[0], stats[1], stats[2], seconds)
+
+    def _update(self, conn: sqlite3.Connection, root: str, prune: List[str],
+                cancel: Optional[threading.Event], progress) -> tuple:
+        pruned = re.compile('|'.join(fnmatch.translate(g) for g in prune)).match if prune else None
+        known: Dict[str, tuple] = {
+            path: (dir_id, mtime_ns) for dir_id, path, mtime_ns in conn.execute(
+                "SELECT id, path, mtime_ns FROM dirs WHERE path=? OR path LIKE ? ESCAPE '\\'",
+                (root, _like_prefix(root)))}
+        seen = set()
+        files = dirs = scanned = 0
+        stack = [root]
+        pending = 0
+        since = self._next_entry_id(conn)
+
+        while stack:
+            if cancel is not None and cancel.is_set():
+                break
+            path = stack.pop()
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            seen.add(path)
+            dirs += 1
+            record = known.get(path)
+
+            if record is not None and record[1] == st.st_mtime_ns:
+                rows = conn.execute("SELECT path, is_dir FROM entries WHERE dir_id=?", (record[0],))
+                for entry_path, is_dir in rows:
+                    if is_dir:
+                        stack.append(entry_path)
+                    else:
+                        files += 1
+                continue
+
+            try:
+                with os.scandir(path) as it:
+                    listing = []
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            is_dir = False
+                        if is_dir and pruned is not None and pruned(entry.name):
+                            continue
+                        listing.append((entry.path, is_dir))
+            except OSError:
+                continue
+
+            # A directory changed within RACY_NS of its scan may change again
+            # without a new mtime; store 0 so the next update re-reads it
+            mtime_ns = st.st_mtime_ns if time.time_ns() - st.st_mtime_ns > RACY_NS else 0
+            if record is None:
+                dir_id = conn.execute("INSERT INTO dirs(path, mtime_ns) VALUES (?, ?)",
+                                      (path, mtime_ns)).lastrowid
+            else:
+                dir_id = record[0]
+                self._delete_entries(conn, [(dir_id,)])
+                conn.execute("UPDATE dirs SET mtime_ns=? WHERE id=?", (mtime_ns, dir_id))
+            conn.executemany("INSERT INTO entries(dir_id, path, is_dir) VALUES (?, ?, ?)",
+                             [(dir_id, p, d) for p, d in listing])
+            for entry_path, is_dir in listing:
+                if is_dir:
+                    stack.append(entry_path)
+                else:
+                    files += 1
+            scanned += 1
+            pending += 1
+            if pending >= BATCH_DIRS:
+                since = self._index_new_entries(conn, since)
+                conn.commit()
+                pending = 0
+                if progress is not None:
+                    progress(dirs, files)
+
+        if cancel is None or not cancel.is_set():
+            gone = [(known[path][0],) for path in known.keys() - seen]
+            self._delete_entries(conn, gone)
+            conn.executemany("DELETE FROM dirs WHERE id=?", gone)
+        self._index_new_entries(conn, since)
+        return files, dirs, scanned
+
+    @staticmethod
+    def _next_entry_id(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name='entries'").fetchone()
+        return (row[0] if row else 0) + 1
+
+    def _index_new_entries(self, conn: sqlite3.Connection, since: int) -> int:
+        """Add entries inserted since id `since` to the FTS table"""
+        if self._fts:
+            conn.execute("INSERT INTO entries_fts(rowid, path) "
+                         "SELECT id, path FROM entries WHERE id >= ?", (since,))
+        return self._next_entry_id(conn)
+
+    def _delete_entries(self, conn: sqlite3.Connection, dir_ids: List[tuple]):
+        if self._fts:
+            conn.executemany("INSERT INTO entries_fts(entries_fts, rowid, path) "
+                             "SELECT 'delete', id, path FROM entries WHERE dir_id=?", dir_ids)
+        conn.executemany("DELETE FROM entries WHERE dir_id=?", dir_ids)
+
+    def _forget(self, conn: sqlite3.Connection, root: str):
+        ids = conn.execute("SELECT id FROM dirs WHERE path=? OR path LIKE ? ESCAPE '\\'",
+                           (root, _like_prefix(root))).fetchall()
+        self._delete_entries(conn, ids)
+        conn.executemany("DELETE FROM dirs WHERE id=?", ids)
+
+    def drop(self, root: str) -> bool:
+        """Remove a root and everything indexed below it"""
+        root = os.path.abspath(root)
+        with self._lock:
+            conn = self._connect()
+            try:
+                if conn.execute("DELETE FROM roots WHERE path=?", (root,)).rowcount == 0:
+                    return False
+                self._forget(conn, root)
+                conn.commit()
+                conn.execute("VACUUM")
+                return True
+            finally:
+                conn.close()
+
+    # ----- queries -----
+
+    def roots(self) -> List[RootInfo]:
+        if not os.path.exists(self.path):
+            return []
+        conn = self._connect()
+        try:
+            return [RootInfo(*row) for row in conn.execute(
+                "SELECT path, files, dirs, built_at, build_seconds, scanned FROM roots ORDER BY path")]
+        finally:
+            conn.close()
+
+    def size(self) -> int:
+        """Bytes on disk, including the WAL"""
+        return sum(os.path.getsize(self.path + suffix)
+                   for suffix in ('', '-wal') if os.path.exists(self.path + suffix))
+
+    def locate(self, pattern: str, ignore_case: bool = False,
+               limit: Optional[int] = None) -> Iterator[str]:
+        """Yield indexed paths containing `pattern`, or matching it as a glob.
+
+        A glob is matched against the whole path, like ``locate``: '*.py'
+        finds every Python file.
+        """
+        if _GLOB_CHARS.search(pattern):
+            regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE if ignore_case else 0)
+            literals = [part for part in re.split(r'[*?]|\[[^\]]*\]', pattern) if part]
+            needle = max(literals, key=len) if literals else ''
+            check = lambda path: regex.match(path) is not None
+        else:
+            needle = pattern
+            folded = pattern.lower()
+            check = (lambda path: folded in path.lower()) if ignore_case else (lambda path: pattern in path)
+
+        conn = self._connect()
+        try:
+            if self._fts and len(needle) >= 3:
+                # Trigram matching is case-insensitive; `check` narrows it down
+                rows = conn.execute(
+                    "SELECT path FROM entries_fts WHERE entries_fts MATCH ? ORDER BY rowid",
+                    ('"' + needle.replace('"', '""') + '"',))
+            else:
+                rows = conn.execute("SELECT path FROM entries ORDER BY id")
+            found = 0
+            for (path,) in rows:
+                if check(path):
+                    yield path
+                    found += 1
+                    if limit is not None and found >= limit:
+                        return
+        finally:
+            conn.close()
+
+
+def _like_prefix(root: str) -> str:
+    """LIKE pattern for every path strictly below `root`"""
+    escaped = root.rstrip(os.sep).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + os.sep + '%'
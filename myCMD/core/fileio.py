@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+📂 Chunked file reading
+Constant-memory readers for text, binary and hex views of files
+"""
+
+import codecs
+import mmap
+import os
+import stat
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+MMAP_THRESHOLD = 1024 * 1024     # regular files at least this big are mmap'ed
+MMAP_RELEASE = 4 * 1024 * 1024   # resident window kept while scanning a mapping
+SNIFF_SIZE = 8192
+HEX_WIDTH = 16
+FOLLOW_POLL = (0.05, 1.0)         # follow mode: poll interval when busy / idle
+
+
+def iter_chunks(path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a file's bytes in fixed-size chunks.
+
+    Large regular files are read through mmap; pipes, devices and small
+    files use plain buffered reads.
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Drop pages once read so resident memory stays flat (POSIX only)
+                release = getattr(mm, 'madvise', None) if hasattr(mmap, 'MADV_DONTNEED') else None
+                if release is not None:
+                    release(mmap.MADV_SEQUENTIAL)
+                released = 0
+                for start in range(0, len(mm), chunk_size):
+                    yield mm[start:start + chunk_size]
+                    if release is not None and start - released >= MMAP_RELEASE:
+                        release(mmap.MADV_DONTNEED, released, start - released)
+                        released = start
+        else:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+
+def is_binary(path) -> bool:
+    """Guess whether a file is binary (NUL byte in the first 8 KB)"""
+    with open(path, 'rb') as f:
+        return b'\0' in f.read(SNIFF_SIZE)
+
+
+def iter_file_lines(path, encoding: str = 'utf-8') -> Iterator[str]:
+    """Yield lines of a text file without their line endings.
+
+    Decodes chunk by chunk, so memory stays flat, and never fails on bad
+    bytes (they become U+FFFD).  CRLF endings are treated like LF.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    carry = ''
+    for chunk in iter_chunks(path):
+        text = carry + decoder.decode(chunk)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n')
+        lines = text.split('\n')
+        carry = lines.pop()
+        yield from lines
+    carry += decoder.decode(b'', final=True)
+    if carry:
+        yield carry
+
+
+def tail_lines(path, count: int, encoding: str = 'utf-8') -> Tuple[List[str], int]:
+    """Last `count` lines of a file and the offset they end at.
+
+    Regular files are read backwards from EOF in blocks, so the cost
+    depends on `count`, not on the file size.
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return list(deque(iter_file_lines(path, encoding), maxlen=count)), 0
+
+        end = pos = st.st_size
+        if count <= 0:
+            return [], end
+
+        blocks = []
+        newlines = 0
+        # count + 1 newlines guarantee `count` complete lines
+        while pos > 0 and newlines <= count:
+            step = min(CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+
+    text = b''.join(reversed(blocks)).decode(encoding, errors='replace')
+    text = text.replace('\r\n', '\n')
+    if text.endswith('\n'):
+        text = text[:-1]
+    if not text and not pos:
+        return [], end
+    return text.split('\n')[-count:], end
+
+
+def follow_lines(path, cancel, offset: Optional[int] = None, reopen: bool = False,
+                 encoding: str = 'utf-8') -> Iterator[str]:
+    """Yield lines appended to a file until `cancel` (an Event) is set.
+
+    Polls with backoff between FOLLOW_POLL bounds.  A shrinking file is
+    read again from the start.  With `reopen` (tail -F) the path is
+    watched: when the file is replaced or recreated, the new file is
+    followed from its beginning; otherwise the open descriptor is kept
+    (tail -f).
+    """
+    fast, slow = FOLLOW_POLL
+    f = None
+    identity = None
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    carry = ''
+    delay = fast
+
+    try:
+        while not cancel.is_set():
+            if f is None:
+                try:
+                    f = open(path, 'rb')
+                except OSError:
+                    if not reopen:
+                        raise
+                    offset = 0
+                    cancel.wait(delay)
+                    delay = min(delay * 2, slow)
+                    continue
+                st = os.fstat(f.fileno())
+                identity = (st.st_dev, st.st_ino)
+                f.seek(st.st_size if offset is None else min(offset, st.st_size))
+                offset = 0       # files found later are read from the start
+
+            chunk = f.read(CHUNK_SIZE)
+            if chunk:
+                text = carry + decoder.decode(chunk)
+                if '\r' in text:
+                    text = text.replace('\r\n', '\n')
+                lines = text.split('\n')
+                carry = lines.pop()
+                yield from lines
+                delay = fast
+                continue
+
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+
+            if st is not None and (st.st_dev, st.st_ino) == identity:
+                if st.st_size < f.tell():
+                    yield f"[TAIL] {path}: file truncated"
+                    f.seek(0)
+                    continue
+            elif reopen and st is not None:
+                if carry:
+                    yield carry
+                    carry = ''
+                f.close()
+                f = None
+                yield f"[TAIL] {path}: file replaced; following new file"
+                continue
+
+            cancel.wait(delay)
+            delay = min(delay * 2, slow)
+    finally:
+        if f is not None:
+            f.close()
+
+
+def _escape_table() -> dict:
+    table = {}
+    for b in range(256):
+        low = b & 0x7f
+        if low < 32 and low != 9:
+            text = '^' + chr(low + 64)
+        elif low == 127:
+            text = '^?'
+        else:
+            text = chr(low)
+        table[b] = ('M-' + text) if b >= 128 else text
+    return table
+
+
+_ESCAPES = _escape_table()
+
+
+def iter_escaped_lines(path) -> Iterator[str]:
+    """Yield lines with non-printing bytes shown in ``cat -v`` notation"""
+    carry = b''
+    for chunk in iter_chunks(path):
+        lines = (carry + chunk).split(b'\n')
+        carry = lines.pop()
+        for line in lines:
+            yield line.decode('latin-1').translate(_ESCAPES)
+    if carry:
+        yield carry.decode('latin-1').translate(_ESCAPES)
+
+
+def iter_hex_lines(path) -> Iterator[str]:
+    """Yield a ``hexdump -C`` style view: offset, 16 hex bytes, ASCII column"""
+    ascii_table = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+    offset = 0
+    carry = b''
+    for chunk in iter_chunks(path):
+        data = carry + chunk
+        usable = len(data) - len(data) % HEX_WIDTH
+        for i in range(0, usable, HEX_WIDTH):
+            yield _hex_row(offset, data[i:i + HEX_WIDTH], ascii_table)
+            offset += HEX_WIDTH
+        carry = data[usable:]
+    if carry:
+        yield _hex_row(offset, carry, ascii_table)
+        offset += len(carry)
+    yield f"{offset:08x}"
+
+
+def _hex_row(offset: int, row: bytes, ascii_table: bytes) -> str:
+    left = row[:8].hex(' ')
+    right = row[8:].hex(' ')
+    return f"{offset:08x}  {left:<23}  {right:<23}  |{row.translate(ascii_table).decode('ascii')}|"
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+📦 Bulk file operations
+Copy, move and remove trees: one walk to plan, a thread pool for the per-file work
+"""
+
+import os
+import shutil
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .fswalk import WalkError, walk
+
+FILE_WORKERS = 8        # per-file copies/unlinks run in parallel
+BATCH_FILES = 64        # files handed to a worker at once
+IN_FLIGHT = 4           # queued batches per worker (bounds memory on huge trees)
+
+
+class Progress(NamedTuple):
+    files: int          # files finished so far
+    bytes: int          # bytes finished so far
+    error: Optional[str] = None
+
+
+class FilePlan:
+    """Everything one cp/mv/rm will touch, found in a single walk.
+
+    `dirs` are in creation order (parents first), `files` and `links` are
+    (src, dst, size) triples; for removals dst is None.
+    """
+
+    def __init__(self):
+        self.dirs: List[Tuple[str, Optional[str]]] = []
+        self.files: List[Tuple[str, Optional[str], int]] = []
+        self.links: List[Tuple[str, Optional[str], int]] = []
+        self.renames: List[Tuple[str, str]] = []
+        self.errors: List[str] = []
+
+    @property
+    def total_files(self) -> int:
+        return len(self.files) + len(self.links)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self.files)
+
+
+def _add_tree(plan: FilePlan, src: str, dst: Optional[str]):
+    """Plan a directory and everything below it (symlinks are not followed)"""
+    plan.dirs.append((src, dst))
+    cut = len(src.rstrip(os.sep)) + 1
+    for entry, _ in walk(src):
+        if isinstance(entry, WalkError):
+            plan.errors.append(f"cannot read '{entry.path}': {entry.message}")
+            continue
+        target = os.path.join(dst, entry.path[cut:]) if dst is not None else None
+        try:
+            if entry.is_symlink():
+                plan.links.append((entry.path, target, 0))
+            elif entry.is_dir(follow_symlinks=False):
+                plan.dirs.append((entry.path, target))
+            else:
+                plan.files.append((entry.path, target, entry.stat(follow_symlinks=False).st_size))
+        except OSError as e:
+            plan.errors.append(f"cannot stat '{entry.path}': {e.strerror or e}")
+
+
+def _targets(sources: List[str], dest: str, verb: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Pair each source with its destination path, cp/mv style"""
+    errors = []
+    if len(sources) > 1 and not os.path.isdir(dest):
+        return [], [f"target '{dest}' is not a directory"]
+    pairs = []
+    for src in sources:
+        if not os.path.lexists(src):
+            errors.append(f"cannot {verb} '{src}': No such file or directory")
+            continue
+        target = os.path.join(dest, os.path.basename(src.rstrip(os.sep))) if os.path.isdir(dest) else dest
+        real_src = os.path.realpath(src)
+        if os.path.realpath(target) == real_src:
+            errors.append(f"'{src}' and '{target}' are the same file")
+            continue
+        if os.path.isdir(src) and os.path.realpath(target).startswith(real_src + os.sep):
+            errors.append(f"cannot {verb} a directory, '{src}', into itself, '{target}'")
+            continue
+        pairs.append((src, target))
+    return pairs, errors
+
+
+def plan_copy(sources: List[str], dest: str, recursive: bool = False) -> FilePlan:
+    plan = FilePlan()
+    pairs, plan.errors = _targets(sources, dest, 'copy')
+    for src, target in pairs:
+        if os.path.isdir(src):
+            if not recursive:
+                plan.errors.append(f"-r not specified; omitting directory '{src}'")
+                continue
+            _add_tree(plan, src, target)
+        else:
+            # Operands are followed like cp does; links inside trees are copied as links
+            try:
+                plan.files.append((src, target, os.path.getsize(src)))
+            except OSError as e:
+                plan.errors.append(f"cannot stat '{src}': {e.strerror or e}")
+    return plan
+
+
+def plan_move(sources: List[str], dest: str) -> FilePlan:
+    """Renames where possible; sources on another filesystem become copy + remove"""
+    plan = FilePlan()
+    pairs, plan.errors = _targets(sources, dest, 'move')
+    for src, target in pairs:
+        try:
+            same_fs = os.lstat(src).st_dev == os.stat(os.path.dirname(os.path.abspath(target))).st_dev
+        except OSError as e:
+            plan.errors.append(f"cannot move '{src}' to '{target}': {e.strerror or e}")
+            continue
+        if same_fs:
+            plan.renames.append((src, target))
+        elif os.path.islink(src):
+            plan.links.append((src, target, 0))
+        elif os.path.isdir(src):
+            _add_tree(plan, src, target)
+        else:
+            plan.files.append((src, target, os.lstat(src).st_size))
+    return plan
+
+
+def plan_remove(paths: List[str], recursive: bool = True, force: bool = False) -> FilePlan:
+    plan = FilePlan()
+    for path in paths:
+        if not os.path.lexists(path):
+            if not force:
+                plan.errors.append(f"cannot remove '{path}': No such file or directory")
+        elif os.path.isdir(path) and not os.path.islink(path):
+            if not recursive:
+                plan.errors.append(f"cannot remove '{path}': Is a directory")
+                continue
+            _add_tree(plan, path, None)
+        elif os.path.islink(path):
+            plan.links.append((path, None, 0))
+        else:
+            plan.files.append((path, None, os.lstat(path).st_size))
+    return plan
+
+
+def _apply(func: Callable, batch: list) -> List[Tuple[tuple, Optional[str]]]:
+    results = []
+    for item in batch:
+        try:
+            func(item)
+            results.append((item, None))
+        except OSError as e:
+            results.append((item, f"'{item[0]}': {e.strerror or e}"))
+    return results
+
+
+def _run_parallel(func: Callable, items: list, threads: int,
+                  cancel: Optional[threading.Event]) -> Iterator[Tuple[tuple, Optional[str]]]:
+    """Apply func to every item on a pool, yielding (item, error) as each finishes.
+
+    Items go to the workers in batches of BATCH_FILES, which keeps the
+    per-task overhead well below the cost of a small-file copy.
+    """
+    batches = [items[i:i + BATCH_FILES] for i in range(0, len(items), BATCH_FILES)]
+    if threads <= 1 or len(batches) <= 1:
+        for batch in batches:
+            if cancel is not None and cancel.is_set():
+                return
+            yield from _apply(func, batch)
+        return
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='fileops') as pool:
+        pending = set()
+        queue = iter(batches)
+        limit = threads * IN_FLIGHT
+        try:
+            while True:
+                while len(pending) < limit and not (cancel is not None and cancel.is_set()):
+                    batch = next(queue, None)
+                    if batch is None:
+                        break
+                    pending.add(pool.submit(_apply, func, batch))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _copy_file(item):
+    src, dst, _ = item
+    shutil.copy2(src, dst)
+
+
+def _copy_link(item):
+    src, dst, _ = item
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    os.symlink(os.readlink(src), dst)
+
+
+def _remove_file(item):
+    os.unlink(item[0])
+
+
+def execute_copy(plan: FilePlan, threads: int = FILE_WORKERS,
+                 cancel: Optional[threading.Event] = None) -> Iterator[Progress]:
+    """Create directories, then copy files and links on a pool"""
+    for src, dst in plan.dirs:
+        try:
+            os.makedirs(dst, exist_ok=True)
+        except OSError as e:
+            yield Progress(0, 0, f"cannot create directory '{dst}': {e.strerror or e}")
+            return
+    files = done_bytes = 0
+    for func, items in ((_copy_file, plan.files), (_copy_link, plan.links)):
+        for item, error in _run_parallel(func, items, threads, cancel):
+            files += 1
+            done_bytes += item[2]
+            yield Progress(files, done_bytes, error)
+    # Directory times last, after their contents stopped changing them
+    for src, dst in reversed(plan.dirs):
+        try:
+            shutil.copystat(src, dst)
+        except OSError:
+            pass
+
+
+def execute_remove(plan: FilePlan, threads: int = FILE_WORKERS,
+                   cancel: Optional[threading.Event] = None) -> Iterator[Progress]:
+    """Unlink files on a pool, then remove directories deepest first"""
+    files = done_bytes = 0
+    failed = False
+    for item, error in _run_parallel(_remove_file, plan.files + plan.links, threads, cancel):
+        files += 1
+        done_bytes += item[2]
+        failed = failed or error is not None
+        yield Progress(files, done_bytes, error)
+    if (cancel is not None and cancel.is_set()) or failed:
+        return
+    for src, _ in reversed(plan.dirs):
+        try:
+            os.rmdir(src)
+        except OSError as e:
+            yield Progress(files, done_bytes, f"cannot remove '{src}': {e.strerror or e}")
+            return
+
+
+def execute_move(plan: FilePlan, threads: int = FILE_WORKERS,
+                 cancel: Optional[threading.Event] = None) -> Iterator[Progress]:
+    """Rename what stays on one filesystem; copy then remove the rest"""
+    for src, dst in plan.renames:
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            yield Progress(0, 0, f"cannot move '{src}': {e.strerror or e}")
+    failed = False
+    for progress in execute_copy(plan, threads, cancel):
+        failed = failed or progress.error is not None
+        yield progress
+    if failed or (cancel is not None and cancel.is_set()):
+        return
+    sources = FilePlan()
+    sources.files = [(src, None, 0) for src, _, _ in plan.files]
+    sources.links = [(src, None, 0) for src, _, _ in plan.links]
+    sources.dirs = plan.dirs
+    for progress in execute_remove(sources, threads, cancel):
+        if progress.error:
+            yield progress
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ Directory listing cache
+os.scandir results shared by the listing commands, validated by mtime
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple
+
+DIR_CACHE_ENTRIES = 500000   # total cached entries across all directories
+RACY_NS = 2 * 10**9          # listings this close to the dir mtime are rescanned
+STAT_TTL_NS = 2 * 10**9      # file sizes/mtimes are trusted this long, then revalidated
+
+
+class CachedEntry(NamedTuple):
+    name: str
+    path: str
+    is_dir: bool
+    is_symlink: bool
+    size: int = 0
+    mtime: float = 0.0
+
+
+class _Listing:
+    __slots__ = ('dir_id', 'scanned_ns', 'with_stat', 'entries')
+
+    def __init__(self, dir_id, scanned_ns: int, with_stat: bool, entries: List[CachedEntry]):
+        self.dir_id = dir_id
+        self.scanned_ns = scanned_ns
+        self.with_stat = with_stat
+        self.entries = entries
+
+
+class DirCache:
+    """Sorted directory listings, reused until the directory changes.
+
+    A listing is keyed by path and checked with one stat() of the
+    directory: a changed mtime (new, removed or renamed entries) means a
+    rescan.  Directories modified within RACY_NS of their scan are always
+    rescanned, since a change in the same mtime tick would go unnoticed.
+    File sizes do not touch the directory mtime, so once a listing with
+    stat data is older than STAT_TTL_NS its entries are revalidated: one
+    stat() per known path, with no directory read, re-sort or new tuples
+    for files that did not change.
+    """
+
+    def __init__(self, max_entries: int = DIR_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._dirs: 'OrderedDict[str, _Listing]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def listing(self, path, with_stat: bool = True) -> List[CachedEntry]:
+        """Entries of a directory sorted by name (OSError if unreadable).
+
+        Without `with_stat` only names and types are filled in, which
+        scandir provides without a stat() call per entry.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        dir_id = (st.st_ino, st.st_mtime_ns)
+        now = time.time_ns()
+
+        with self._lock:
+            cached = self._dirs.get(key)
+            if (cached is not None and cached.dir_id == dir_id
+                    and cached.scanned_ns - st.st_mtime_ns > RACY_NS
+                    and (cached.with_stat or not with_stat)):
+                self._dirs.move_to_end(key)
+                self.hits += 1
+                if not with_stat or now - cached.scanned_ns < STAT_TTL_NS:
+                    return cached.entries
+            else:
+                cached = None
+                self.misses += 1
+
+        if cached is not None:
+            entries = _revalidate(cached.entries)
+        else:
+            entries = _scan(key, with_stat)
+        listing = _Listing(dir_id, now, with_stat, entries)
+        with self._lock:
+            old = self._dirs.pop(key, None)
+            if old is not None:
+                self._size -= len(old.entries)
+            if len(entries) <= self.max_entries:
+                self._dirs[key] = listing
+                self._size += len(entries)
+                while self._size > self.max_entries:
+                    _, evicted = self._dirs.popitem(last=False)
+                    self._size -= len(evicted.entries)
+        return entries
+
+    def invalidate(self, path=None):
+        """Forget one directory, or everything"""
+        with self._lock:
+            if path is None:
+                self._dirs.clear()
+                self._size = 0
+                return
+            old = self._dirs.pop(os.path.abspath(path), None)
+            if old is not None:
+                self._size -= len(old.entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for the stats command"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+                    'dirs': len(self._dirs), 'entries': self._size}
+
+
+def _scan(path: str, with_stat: bool) -> List[CachedEntry]:
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            size, mtime = 0, 0.0
+            if with_stat:
+                try:
+                    st = entry.stat()
+                    size, mtime = st.st_size, st.st_mtime
+                except OSError:      # dangling symlink
+                    pass
+            entries.append(CachedEntry(entry.name, entry.path, is_dir,
+                                       entry.is_symlink(), size, mtime))
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _revalidate(entries: List[CachedEntry]) -> List[CachedEntry]:
+    """Refresh sizes and mtimes of a listing whose names are still current"""
+    fresh = []
+    for entry in entries:
+        try:
+            st = os.stat(entry.path)
+            size, mtime, is_dir = st.st_size, st.st_mtime, stat.S_ISDIR(st.st_mode)
+        except OSError:          # dangling symlink
+            size, mtime, is_dir = 0, 0.0, False
+        if size != entry.size or mtime != entry.mtime or is_dir != entry.is_dir:
+            entry = entry._replace(is_dir=is_dir, size=size, mtime=mtime)
+        fresh.append(entry)
+    return fresh
+
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+🌲 Filesystem walker, find expressions and disk usage
+os.scandir-based streaming traversal, optionally spread over threads
+"""
+
+import fnmatch
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .fscache import CachedEntry
+
+FIND_TYPES = ('f', 'd', 'l')
+SIZE_UNITS = {'b': 512, 'c': 1, 'w': 2, 'k': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+DAY = 86400
+WALK_QUEUE = 64          # parallel walk: directory batches buffered for the reader
+
+
+class WalkError(NamedTuple):
+    """A directory that could not be read"""
+    path: str
+    message: str
+
+
+def _skip(entry: os.DirEntry, depth: int, max_depth: Optional[int],
+          prune: Optional[Callable[[str], bool]], follow_links: bool) -> bool:
+    """True when the walker should not descend into this entry"""
+    if max_depth is not None and depth >= max_depth:
+        return True
+    try:
+        if not entry.is_dir(follow_symlinks=follow_links):
+            return True
+    except OSError:
+        return True
+    return prune is not None and prune(entry.name)
+
+
+def walk(root: str, max_depth: Optional[int] = None,
+         prune: Optional[Callable[[str], bool]] = None,
+         follow_links: bool = False, threads: int = 1,
+         cancel: Optional[threading.Event] = None) -> Iterator[Tuple[object, int]]:
+    """Yield (os.DirEntry or WalkError, depth) for everything below `root`.
+
+    Depth 1 is the root's own children.  The single-threaded walk is a
+    depth-first pre-order that streams entries as scandir returns them;
+    with `threads` > 1 directories are read concurrently and the order is
+    not defined.  `prune(name)` keeps the walker out of matching dirs.
+    """
+    if threads > 1:
+        yield from _walk_parallel(root, max_depth, prune, follow_links, threads, cancel)
+        return
+
+    try:
+        stack = [(os.scandir(root), 1)]
+    except OSError as e:
+        yield WalkError(root, e.strerror or str(e)), 0
+        return
+
+    try:
+        while stack:
+            it, depth = stack[-1]
+            entry = next(it, None)
+            if entry is None:
+                it.close()
+                stack.pop()
+                continue
+            if cancel is not None and cancel.is_set():
+                return
+            yield entry, depth
+            if not _skip(entry, depth, max_depth, prune, follow_links):
+                try:
+                    stack.append((os.scandir(entry.path), depth + 1))
+                except OSError as e:
+                    yield WalkError(entry.path, e.strerror or str(e)), depth + 1
+    finally:
+        for it, _ in stack:
+            it.close()
+
+
+def _walk_parallel(root: str, max_depth, prune, follow_links: bool, threads: int,
+                   cancel: Optional[threading.Event]) -> Iterator[Tuple[object, int]]:
+    """Read directories on a thread pool; batches come back through a queue"""
+    results: queue.Queue = queue.Queue(maxsize=WALK_QUEUE)
+    stop = threading.Event()
+    lock = threading.Lock()
+    pending = [1]
+    pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='walk')
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def scan(path: str, depth: int):
+        try:
+            if stop.is_set():
+                return
+            batch = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        batch.append((entry, depth))
+                        if not _skip(entry, depth, max_depth, prune, follow_links):
+                            with lock:
+                                pending[0] += 1
+                            pool.submit(scan, entry.path, depth + 1)
+            except OSError as e:
+                batch.append((WalkError(path, e.strerror or str(e)), depth))
+            put(batch)
+        finally:
+            with lock:
+                pending[0] -= 1
+                finished = pending[0] == 0
+            if finished:
+                put(None)
+
+    pool.submit(scan, root, 1)
+    try:
+        while True:
+            try:
+                batch = results.get(timeout=0.1)
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    return
+                continue
+            if batch is None:
+                return
+            yield from batch
+            if cancel is not None and cancel.is_set():
+                return
+    finally:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ----- find expressions -----
+
+class FindOptions(NamedTuple):
+    paths: Tuple[str, ...] = ('.',)
+    names: Tuple[str, ...] = ()         # -name globs
+    inames: Tuple[str, ...] = ()        # -iname globs
+    type: Optional[str] = None          # -type f|d|l
+    min_depth: int = 0                  # -mindepth
+    max_depth: Optional[int] = None     # -maxdepth
+    size: Optional[Tuple[str, int, int]] = None    # -size: (cmp, count, unit)
+    mtime: Optional[Tuple[str, int]] = None        # -mtime: (cmp, days)
+    prune: Tuple[str, ...] = ()         # -prune globs (directories skipped)
+    threads: int = 1                    # -parallel N
+
+
+def _signed(value: str, option: str) -> Tuple[str, str]:
+    if not value:
+        raise ValueError(f"missing argument to '{option}'")
+    if value[0] in '+-':
+        return value[0], value[1:]
+    return '=', value
+
+
+def parse_find_args(args: List[str]) -> FindOptions:
+    """Parse 'find [path...] [options]' (ValueError on bad input)"""
+    paths = []
+    opts = {}
+    names, inames, prune = [], [], []
+    i = 0
+    while i < len(args) and not args[i].startswith('-'):
+        paths.append(args[i])
+        i += 1
+
+    while i < len(args):
+        option = args[i]
+        if i + 1 >= len(args):
+            raise ValueError(f"missing argument to '{option}'")
+        value = args[i + 1]
+        i += 2
+        if option == '-name':
+            names.append(value)
+        elif option == '-iname':
+            inames.append(value)
+        elif option == '-prune':
+            prune.append(value)
+        elif option == '-type':
+            if value not in FIND_TYPES:
+                raise ValueError(f"unknown argument to -type: {value}")
+            opts['type'] = value
+        elif option in ('-maxdepth', '-mindepth', '-parallel'):
+            if not value.isdigit():
+                raise ValueError(f"{option}: invalid number '{value}'")
+            key = {'-maxdepth': 'max_depth', '-mindepth': 'min_depth', '-parallel': 'threads'}[option]
+            opts[key] = int(value)
+        elif option == '-size':
+            cmp, rest = _signed(value, option)
+            unit = rest[-1:] if rest[-1:] in SIZE_UNITS else 'b'
+            number = rest[:-1] if rest[-1:] in SIZE_UNITS else rest
+            if not number.isdigit():
+                raise ValueError(f"invalid -size '{value}'")
+            opts['size'] = (cmp, int(number), SIZE_UNITS[unit])
+        elif option == '-mtime':
+            cmp, rest = _signed(value, option)
+            if not rest.isdigit():
+                raise ValueError(f"invalid -mtime '{value}'")
+            opts['mtime'] = (cmp, int(rest))
+        else:
+            raise ValueError(f"unknown predicate '{option}'")
+
+    return FindOptions(paths=tuple(paths) or ('.',), names=tuple(names),
+                       inames=tuple(inames), prune=tuple(prune), **opts)
+
+
+def _compare(cmp: str, value: int, target: int) -> bool:
+    if cmp == '+':
+        return value > target
+    if cmp == '-':
+        return value < target
+    return value == target
+
+
+def _glob_matcher(globs, ignore_case: bool = False) -> Optional[Callable[[str], bool]]:
+    if not globs:
+        return None
+    flags = re.IGNORECASE if ignore_case else 0
+    regex = re.compile('|'.join(fnmatch.translate(g) for g in globs), flags | re.DOTALL)
+    return lambda name: regex.match(name) is not None
+
+
+def find(options: FindOptions, cwd: str,
+         cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    """Yield paths matching a find expression, as they are found"""
+    name_ok = _glob_matcher(options.names)
+    iname_ok = _glob_matcher(options.inames, ignore_case=True)
+    prune = _glob_matcher(options.prune)
+    now = time.time()
+
+    def matches(entry, name: str) -> bool:
+        if name_ok is not None and not name_ok(name):
+            return False
+        if iname_ok is not None and not iname_ok(name):
+            return False
+        if options.type is not None:
+            if options.type == 'l':
+                if not entry.is_symlink():
+                    return False
+            elif options.type == 'd' and not entry.is_dir(follow_symlinks=False):
+                return False
+            elif options.type == 'f' and not entry.is_file(follow_symlinks=False):
+                return False
+        if options.size is not None or options.mtime is not None:
+            st = entry.stat(follow_symlinks=False)
+            if options.size is not None:
+                cmp, count, unit = options.size
+                if not _compare(cmp, -(-st.st_size // unit), count):
+                    return False
+            if options.mtime is not None:
+                cmp, days = options.mtime
+                if not _compare(cmp, int((now - st.st_mtime) // DAY), days):
+                    return False
+        return True
+
+    for start in options.paths:
+        root = os.path.join(cwd, os.path.expanduser(start))
+        if not os.path.lexists(root):
+            yield f"find: '{start}': No such file or directory"
+            continue
+
+        if options.min_depth == 0 and matches(_RootEntry(root), os.path.basename(os.path.normpath(start))):
+            yield start
+        if not os.path.isdir(root) or options.max_depth == 0:
+            continue
+
+        prefix = start.rstrip('/') + '/' if start != '/' else '/'
+        cut = len(root.rstrip('/')) + 1
+        for entry, depth in walk(root, options.max_depth, prune, threads=options.threads, cancel=cancel):
+            if isinstance(entry, WalkError):
+                yield f"find: '{prefix + entry.path[cut:]}': {entry.message}"
+                continue
+            if depth < options.min_depth:
+                continue
+            if prune is not None and prune(entry.name) and entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                if matches(entry, entry.name):
+                    yield prefix + entry.path[cut:]
+            except OSError:
+                continue
+
+
+class _RootEntry:
+    """DirEntry-like view of a start path, so it is tested like any entry"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return os.path.isdir(self.path) if follow_symlinks else (
+            os.path.isdir(self.path) and not os.path.islink(self.path))
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return os.path.isfile(self.path) if follow_symlinks else (
+            os.path.isfile(self.path) and not os.path.islink(self.path))
+
+    def is_symlink(self) -> bool:
+        return os.path.islink(self.path)
+
+    def stat(self, follow_symlinks: bool = True):
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+
+# ----- disk usage -----
+
+def human_size(size: float) -> str:
+    """Format a byte count as 512B / 1.5K / 20.0M"""
+    for unit in ('B', 'K', 'M', 'G', 'T'):
+        if size < 1024 or unit == 'T':
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+
+
+def disk_usage(root: str, keep_depth: Optional[int] = None, threads: int = 1,
+               cancel: Optional[threading.Event] = None):
+    """Walk a tree once, rolling file counts and sizes up per directory.
+
+    Returns (totals, children, errors): totals maps every directory to
+    [files, bytes] for its whole subtree, children maps directories up to
+    `keep_depth` to their sorted CachedEntry list, errors maps unreadable
+    directories to a message.  Symlinks are counted, never followed.
+    """
+    root = os.path.abspath(root)
+    totals = {root: [0, 0]}
+    children = {}
+    errors = {}
+    for entry, depth in walk(root, threads=threads, cancel=cancel):
+        if isinstance(entry, WalkError):
+            errors[entry.path] = entry.message
+            continue
+        parent = os.path.dirname(entry.path)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if keep_depth is None or depth <= keep_depth:
+            children.setdefault(parent, []).append(
+                CachedEntry(entry.name, entry.path, is_dir, entry.is_symlink()))
+        if is_dir:
+            totals.setdefault(entry.path, [0, 0])
+            continue
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            size = 0
+        own = totals.setdefault(parent, [0, 0])
+        own[0] += 1
+        own[1] += size
+
+    # Deepest directories first, so each one is complete before its parent
+    for path in sorted(totals, key=lambda p: p.count(os.sep), reverse=True):
+        if path != root:
+            files, size = totals[path]
+            parent = totals.setdefault(os.path.dirname(path), [0, 0])
+            parent[0] += files
+            parent[1] += size
+    for entries in children.values():
+        entries.sort(key=lambda e: e.name)
+    return totals, children, errors
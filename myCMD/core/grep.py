@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+🔎 grep engine
+Literal fast path, compiled regexes, windowed mmap scans and a process pool for -r
+"""
+
+import glob
+import mmap
+import os
+import re
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .fileio import MMAP_RELEASE, MMAP_THRESHOLD, SNIFF_SIZE, iter_file_lines
+
+SCAN_WINDOW = 8 * 1024 * 1024            # bytes searched per regex/find call
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024    # smaller -r/multi-file jobs stay in-process
+PARALLEL_CHUNK = 4                       # files per task sent to a worker
+
+_REGEX_CHARS = set('.[]()*+?{}|^$\\')
+_BRE_LITERALS = set('+?|(){}')
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+class GrepOptions(NamedTuple):
+    pattern: str
+    ignore_case: bool = False     # -i
+    invert: bool = False          # -v
+    count: bool = False           # -c
+    line_numbers: bool = False    # -n
+    files_only: bool = False      # -l
+    recursive: bool = False       # -r
+    mode: str = 'basic'           # 'basic', 'extended' (-E) or 'fixed' (-F)
+
+
+class Matcher(NamedTuple):
+    literal: Optional[bytes]      # plain substring search when set
+    regex: Optional['re.Pattern']  # bytes regex otherwise
+    text_regex: 're.Pattern'      # str regex, for stdin and non-ASCII -i
+    fold: bool = False            # literal is lowercase; search lowercased windows
+
+
+FLAGS = {'i': 'ignore_case', 'v': 'invert', 'c': 'count', 'n': 'line_numbers',
+         'l': 'files_only', 'r': 'recursive', 'R': 'recursive'}
+
+
+def parse_grep_args(args: List[str]) -> Tuple[GrepOptions, List[str]]:
+    """Split grep arguments into options and file operands (ValueError if bad)"""
+    flags = {}
+    mode = 'basic'
+    pattern = None
+    operands = []
+    args = iter(args)
+    for arg in args:
+        if arg == '--':
+            operands.extend(args)
+            break
+        if arg == '-e':
+            pattern = next(args, None)
+            if pattern is None:
+                raise ValueError("option requires an argument -- 'e'")
+        elif arg.startswith('-') and len(arg) > 1:
+            for ch in arg[1:]:
+                if ch in FLAGS:
+                    flags[FLAGS[ch]] = True
+                elif ch == 'E':
+                    mode = 'extended'
+                elif ch == 'F':
+                    mode = 'fixed'
+                else:
+                    raise ValueError(f"invalid option -- '{ch}'")
+        else:
+            operands.append(arg)
+
+    if pattern is None:
+        if not operands:
+            raise ValueError("missing pattern")
+        pattern = operands.pop(0)
+    return GrepOptions(pattern, mode=mode, **flags), operands
+
+
+def _bre_to_python(pattern: str) -> str:
+    """Basic regex syntax: + ? | ( ) { } are literal unless backslashed"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\' and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            out.append(nxt if nxt in _BRE_LITERALS else ch + nxt)
+            i += 2
+            continue
+        out.append('\\' + ch if ch in _BRE_LITERALS else ch)
+        i += 1
+    return ''.join(out)
+
+
+def compile_matcher(options: GrepOptions) -> Matcher:
+    """Pick the literal fast path or compile the pattern (re.error if bad)"""
+    pattern = options.pattern
+    fold = False
+    if options.mode == 'fixed' or (options.mode == 'basic' and not _REGEX_CHARS & set(pattern)):
+        source = re.escape(pattern)
+        literal = pattern.encode('utf-8')
+        if options.ignore_case:
+            # ASCII case folding keeps byte offsets, so search a lowercased copy
+            fold = pattern.isascii()
+            literal = literal.lower() if fold else None
+    else:
+        source = _bre_to_python(pattern) if options.mode == 'basic' else pattern
+        literal = None
+
+    flags = re.MULTILINE | (re.IGNORECASE if options.ignore_case else 0)
+    text_regex = re.compile(source, flags)
+    regex = None
+    if literal is None and source.isascii():
+        regex = re.compile(source.encode('ascii'), flags)
+    return Matcher(literal, regex, text_regex, fold)
+
+
+def _count_newlines(buf, start: int, end: int) -> int:
+    if isinstance(buf, bytes):
+        return buf.count(b'\n', start, end)
+    total = 0                       # mmap has no count(): go through slices
+    for i in range(start, end, SCAN_WINDOW):
+        total += buf[i:min(end, i + SCAN_WINDOW)].count(b'\n')
+    return total
+
+
+def _scan(buf, size: int, matcher: Matcher, numbers: bool, release=None) -> Iterator[Tuple[int, int, int]]:
+    """Yield (line number, start, end) of lines matching in buf[:size].
+
+    The search runs in C over windows of SCAN_WINDOW bytes that end on a
+    newline; Python only runs per match.  `release(start, length)` is
+    called for pages that were scanned already.
+    """
+    literal, regex = matcher.literal, matcher.regex
+    pos = counted = released = 0
+    line_no = 1
+    while pos < size:
+        limit = min(size, pos + SCAN_WINDOW)
+        if limit < size:
+            nl = buf.find(b'\n', limit)
+            limit = size if nl < 0 else nl + 1
+        if matcher.fold:
+            window, base = buf[pos:limit].lower(), pos
+
+        while pos < limit:
+            if matcher.fold:
+                start = window.find(literal, pos - base)
+                if start < 0:
+                    break
+                start += base
+                end = start + len(literal)
+            elif literal is not None:
+                start = buf.find(literal, pos, limit)
+                if start < 0:
+                    break
+                end = start + len(literal)
+            else:
+                m = regex.search(buf, pos, limit)
+                if m is None:
+                    break
+                start, end = m.span()
+
+            line_start = buf.rfind(b'\n', pos, start) + 1 or pos
+            line_end = buf.find(b'\n', start, size)
+            if line_end < 0:
+                line_end = size
+            # A regex match may run past the newline; recheck the line alone
+            if end > line_end and regex is not None and not regex.search(buf, line_start, line_end):
+                pos = line_end + 1
+                continue
+
+            if numbers:
+                line_no += _count_newlines(buf, counted, line_start)
+                counted = line_start
+            yield line_no, line_start, line_end
+            pos = line_end + 1
+
+        pos = max(pos, limit)
+        if release is not None and pos - released >= MMAP_RELEASE:
+            aligned = pos - pos % mmap.PAGESIZE
+            release(released, aligned - released)
+            released = aligned
+
+
+def _segment_lines(buf, start: int, end: int) -> Iterator[bytes]:
+    """Split buf[start:end] (whole lines) into lines, one window at a time"""
+    while start < end:
+        stop = min(end, start + SCAN_WINDOW)
+        if stop < end:
+            nl = buf.rfind(b'\n', start, stop)
+            stop = end if nl < 0 else nl + 1
+        chunk = buf[start:stop]
+        lines = chunk.split(b'\n')
+        if chunk.endswith(b'\n'):
+            lines.pop()
+        yield from lines
+        start = stop
+
+
+def _count_lines(buf, size: int) -> int:
+    lines = _count_newlines(buf, 0, size)
+    return lines + 1 if size and buf[size - 1:size] != b'\n' else lines
+
+
+def _scan_inverted(buf, size: int, matcher: Matcher, numbers: bool) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line number, line) of lines that do not match.
+
+    Runs the normal match scan and splits the gaps between matching
+    lines in bulk, so non-matching lines never go through the matcher.
+    """
+    prev = 0
+    line_no = 0
+    for _, start, end in _scan(buf, size, matcher, False):
+        for line in _segment_lines(buf, prev, start):
+            line_no += 1
+            yield line_no, line
+        line_no += 1
+        prev = end + 1
+    for line in _segment_lines(buf, prev, size):
+        line_no += 1
+        yield line_no, line
+
+
+def _decode(data: bytes) -> str:
+    return data.decode('utf-8', errors='replace').rstrip('\r')
+
+
+def grep_file(path: str, options: GrepOptions, matcher: Matcher,
+              name: Optional[str] = None, show_name: bool = False) -> Iterator[str]:
+    """Matching lines of one file, formatted like grep output"""
+    name = name or path
+    prefix = f"{name}:" if show_name else ""
+
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return
+        size = st.st_size
+        if size == 0:
+            if options.count:
+                yield f"{prefix}0"
+            return
+
+        if matcher.literal is None and matcher.regex is None:
+            yield from _grep_text(iter_file_lines(path), options, matcher, name, show_name)
+            return
+
+        mm = None
+        release = None
+        if size >= MMAP_THRESHOLD:
+            buf = mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_DONTNEED') and hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                release = lambda start, length: mm.madvise(mmap.MADV_DONTNEED, start, length)
+        else:
+            buf = f.read()
+
+    try:
+        binary = b'\0' in buf[:SNIFF_SIZE]
+        if options.invert:
+            if options.count:
+                matched = sum(1 for _ in _scan(buf, size, matcher, False, release))
+                yield f"{prefix}{_count_lines(buf, size) - matched}"
+                return
+            hits = _scan_inverted(buf, size, matcher, options.line_numbers)
+        else:
+            hits = ((line_no, buf[start:end]) for line_no, start, end
+                    in _scan(buf, size, matcher, options.line_numbers and not binary, release))
+
+        if options.files_only:
+            if next(hits, None) is not None:
+                yield name
+        elif options.count:
+            yield f"{prefix}{sum(1 for _ in hits)}"
+        elif binary:
+            if next(hits, None) is not None:
+                yield f"Binary file {name} matches"
+        elif options.line_numbers:
+            for line_no, line in hits:
+                yield f"{prefix}{line_no}:{_decode(line)}"
+        else:
+            for _, line in hits:
+                yield prefix + _decode(line)
+    finally:
+        if mm is not None:
+            mm.close()
+
+
+def _grep_text(lines: Iterable[str], options: GrepOptions, matcher: Matcher,
+               name: str = '(standard input)', show_name: bool = False) -> Iterator[str]:
+    """grep over decoded text lines (pipeline stdin, non-ASCII -i)"""
+    search = matcher.text_regex.search
+    if matcher.literal is not None and not options.ignore_case:
+        needle = options.pattern
+        search = lambda line: needle in line
+    invert = options.invert
+    prefix = f"{name}:" if show_name else ""
+
+    count = 0
+    for line_no, line in enumerate(lines, 1):
+        if (not search(line)) != invert:
+            continue
+        count += 1
+        if options.files_only:
+            yield name
+            return
+        if not options.count:
+            yield f"{prefix}{line_no}:{line}" if options.line_numbers else prefix + line
+    if options.count:
+        yield f"{prefix}{count}"
+
+
+def grep_lines(lines: Iterable[str], options: GrepOptions, matcher: Matcher) -> Iterator[str]:
+    """grep over a stream of lines (stdin of a pipe stage)"""
+    return _grep_text(lines, options, matcher)
+
+
+def expand_operands(operands: List[str], cwd, recursive: bool) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Resolve globs, files and (with -r) directories; '' means the cwd.
+
+    Returns ([(filesystem path, display name), ...], [error message, ...]).
+    """
+    files = []
+    errors = []
+    for operand in operands:
+        if glob.has_magic(operand):
+            names = sorted(glob.glob(operand, root_dir=str(cwd))) or [operand]
+        else:
+            names = [operand]
+
+        for name in names:
+            path = os.path.join(cwd, os.path.expanduser(name))
+            if not os.path.isdir(path):
+                if os.path.exists(path):
+                    files.append((path, name))
+                else:
+                    errors.append(f"grep: {name}: No such file or directory")
+            elif not recursive:
+                errors.append(f"grep: {name}: Is a directory")
+            else:
+                for root, dirs, filenames in os.walk(path):
+                    dirs.sort()
+                    for filename in sorted(filenames):
+                        full = os.path.join(root, filename)
+                        rel = os.path.relpath(full, path)
+                        files.append((full, os.path.join(name, rel) if name else rel))
+    return files, errors
+
+
+def _grep_worker(task) -> List[str]:
+    path, options, name, show_name = task
+    try:
+        return list(grep_file(path, options, compile_matcher(options), name, show_name))
+    except OSError as e:
+        return [f"grep: {name}: {e.strerror}"]
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: safe to start from a process that runs pipeline threads
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context('spawn'))
+    return _pool
+
+
+def shutdown_pool():
+    """Stop the -r worker processes (they are started on first use)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def grep_paths(files: List[Tuple[str, str]], options: GrepOptions, matcher: Matcher,
+               show_names: bool) -> Iterator[str]:
+    """grep over many files; large jobs are spread over a process pool"""
+    total = 0
+    for path, _ in files:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+
+    tasks = [(path, options, name, show_names) for path, name in files]
+    done = 0
+    if (os.cpu_count() or 1) > 1 and len(tasks) > 1 and total >= PARALLEL_MIN_BYTES:
+        try:
+            for lines in _get_pool().map(_grep_worker, tasks, chunksize=PARALLEL_CHUNK):
+                yield from lines
+                done += 1
+            return
+        except BrokenProcessPool:
+            shutdown_pool()         # finish the remaining files in-process
+
+    for path, options, name, show_names in tasks[done:]:
+        try:
+            yield from grep_file(path, options, matcher, name, show_names)
+        except OSError as e:
+            yield f"grep: {name}: {e.strerror}"
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+📜 Command history
+Fixed-size in-memory ring backed by an append-only file and an offset index
+"""
+
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+HISTORY_CAPACITY = 1000
+
+
+class History:
+    """Command history with list-style access.
+
+    The newest `capacity` entries live in a ring buffer.  With a history
+    file every entry is also appended to disk, and ``<file>.idx`` keeps the
+    byte offset of each line (array 'Q'), so any entry or slice is read
+    with one seek, whatever the total size.  Without a file, entries older
+    than the ring are dropped.
+    """
+
+    def __init__(self, path: Optional[Path] = None, capacity: int = HISTORY_CAPACITY):
+        self.path = Path(path) if path is not None else None
+        self.capacity = capacity
+        self._ring: List[Optional[str]] = [None] * capacity
+        self._count = 0                  # entries ever appended (memory + disk)
+        self._offsets = array('Q')
+        self._end = 0                    # history file size
+        self._file = None
+        self._index_file = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+        if self.path is not None:
+            self._open()
+
+    # ----- storage -----
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.idx')
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._end = self._file.tell()
+        if self._end:
+            with open(self.path, 'rb') as f:
+                f.seek(self._end - 1)
+                if f.read(1) != b'\n':           # torn last write
+                    self._file.write(b'\n')
+                    self._file.flush()
+                    self._end += 1
+
+        offsets = array('Q')
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            offsets.frombytes(data[:len(data) - len(data) % offsets.itemsize])
+        if offsets and (offsets[0] != 0 or offsets[-1] >= self._end):
+            offsets = array('Q')                 # stale index: rebuild
+        indexed = len(offsets)
+
+        # Re-scan from the last indexed line to pick up unindexed appends
+        pos = offsets.pop() if offsets else 0
+        with open(self.path, 'rb') as f:
+            f.seek(pos)
+            for line in f:
+                offsets.append(pos)
+                pos += len(line)
+
+        if len(offsets) != indexed:
+            with open(self.index_path, 'wb') as f:
+                offsets.tofile(f)
+        self._index_file = open(self.index_path, 'ab')
+        self._offsets = offsets
+        self._count = len(offsets)
+
+        first = max(0, self._count - self.capacity)
+        for i, entry in enumerate(self._read_disk(first, self._count), first):
+            self._ring[i % self.capacity] = entry
+
+    def _read_disk(self, start: int, stop: int) -> List[str]:
+        """Entries [start, stop) from the history file, in one read"""
+        if start >= stop:
+            return []
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        end = self._offsets[stop] if stop < len(self._offsets) else self._end
+        self._reader.seek(self._offsets[start])
+        data = self._reader.read(end - self._offsets[start])
+        return data.decode('utf-8', errors='replace').split('\n')[:stop - start]
+
+    # ----- list-style API -----
+
+    @property
+    def _base(self) -> int:
+        """Absolute number of the entry at index 0"""
+        if self.path is not None:
+            return 0
+        return max(0, self._count - self.capacity)
+
+    def __len__(self) -> int:
+        return self._count - self._base
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def append(self, command: str):
+        """Add an entry to the ring and, if enabled, to the history file"""
+        command = command.replace('\r', ' ').replace('\n', ' ')
+        with self._lock:
+            self._ring[self._count % self.capacity] = command
+            self._count += 1
+            if self._file is not None:
+                data = command.encode('utf-8') + b'\n'
+                self._file.write(data)
+                self._file.flush()
+                entry = array('Q', [self._end])
+                self._offsets.extend(entry)
+                entry.tofile(self._index_file)
+                self._index_file.flush()
+                self._end += len(data)
+
+    def extend(self, commands: Iterable[str]):
+        for command in commands:
+            self.append(command)
+
+    def merge(self, commands: Iterable[str]):
+        """Append commands unless they already run contiguously in memory.
+
+        A saved session holds a window of this history, so loading it again
+        (or loading one saved from the same history file) adds nothing.
+        """
+        commands = [c.replace('\r', ' ').replace('\n', ' ') for c in commands]
+        if not commands:
+            return
+        recent = self.recent()
+        n = len(commands)
+        for i in range(len(recent) - n + 1):
+            if recent[i] == commands[0] and recent[i:i + n] == commands:
+                return
+        self.extend(commands)
+
+    def range(self, start: int, stop: int) -> List[str]:
+        """Entries [start, stop) by index; costs O(stop - start)"""
+        base = self._base
+        start, stop = start + base, stop + base
+        with self._lock:
+            ring_start = max(0, self._count - self.capacity)
+            entries = self._read_disk(start, min(stop, ring_start)) if start < ring_start else []
+            ring = self._ring
+            entries.extend(ring[i % self.capacity] for i in range(max(start, ring_start), stop))
+        return entries
+
+    def __getitem__(self, key):
+        length = len(self)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(length)
+            if step != 1:
+                return self.range(0, length)[key]
+            return self.range(start, stop) if start < stop else []
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("history index out of range")
+        return self.range(key, key + 1)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.range(0, len(self)))
+
+    def tail(self, n: int) -> List[str]:
+        """The last n entries"""
+        length = len(self)
+        return self.range(max(0, length - n), length)
+
+    def recent(self) -> List[str]:
+        """Entries still held in memory (at most `capacity`)"""
+        return self.tail(self.capacity)
+
+    def clear(self):
+        """Forget all entries, including the history file"""
+        with self._lock:
+            self._ring = [None] * self.capacity
+            self._count = 0
+            if self._file is not None:
+                self._close_files()
+                self.path.write_bytes(b'')
+                self.index_path.write_bytes(b'')
+                self._file = open(self.path, 'ab')
+                self._index_file = open(self.index_path, 'ab')
+                self._offsets = array('Q')
+                self._end = 0
+
+    def _close_files(self):
+        for f in (self._file, self._index_file, self._reader):
+            if f is not None:
+                f.close()
+        self._file = self._index_file = self._reader = None
+
+    def close(self):
+        with self._lock:
+            self._close_files()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+🪝 Plugin hook bus
+Dispatch lists are precomputed per event, so events without hooks cost nothing
+"""
+
+import threading
+import time
+from queue import SimpleQueue
+from typing import Callable, Dict, List, Optional, Tuple
+
+EVENTS = ('on_command_execute', 'on_command_complete', 'on_exit')
+
+
+def deferred(func: Callable) -> Callable:
+    """Mark a hook as deferred: it runs on the hook thread, after the output.
+
+    Deferred hooks see the same arguments but can never delay a command.
+    """
+    func.deferred = True
+    return func
+
+
+class HookStats:
+    """Call count, time and failures for one event"""
+
+    __slots__ = ('calls', 'time_ns', 'errors')
+
+    def __init__(self):
+        self.calls = 0
+        self.time_ns = 0
+        self.errors = 0
+
+
+class HookBus:
+    """Plugin hooks by event.
+
+    For every event name the bus has an attribute holding the tuple of all
+    its hooks (empty when there are none), so the shell can guard a call
+    with ``if hooks.on_command_execute:``.  Deferred hooks are queued
+    to a daemon thread that starts with the first deferred registration.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Tuple[str, Callable, bool]]] = {e: [] for e in EVENTS}
+        self._inline: Dict[str, Tuple[Callable, ...]] = {}
+        self._deferred: Dict[str, Tuple[Callable, ...]] = {}
+        self.stats: Dict[str, HookStats] = {e: HookStats() for e in EVENTS}
+        self.deferred_stats = HookStats()
+        self.last_error: Optional[str] = None
+        self._queue: Optional[SimpleQueue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._rebuild()
+
+    def register(self, event: str, func: Callable, owner: str = '',
+                 deferred: Optional[bool] = None):
+        """Add a hook; `deferred` defaults to the function's @deferred mark"""
+        if event not in self._hooks:
+            raise ValueError(f"unknown hook event '{event}'")
+        if deferred is None:
+            deferred = bool(getattr(func, 'deferred', False))
+        self._hooks[event].append((owner, func, deferred))
+        self._rebuild()
+
+    def register_module(self, name: str, module):
+        """Pick up every module-level function named after an event"""
+        for event in EVENTS:
+            func = getattr(module, event, None)
+            if callable(func):
+                self.register(event, func, owner=name)
+
+    def unregister(self, owner: str):
+        """Drop all hooks registered by one plugin"""
+        for event in EVENTS:
+            self._hooks[event] = [h for h in self._hooks[event] if h[0] != owner]
+        self._rebuild()
+
+    def _rebuild(self):
+        for event, hooks in self._hooks.items():
+            self._inline[event] = tuple(func for _, func, is_deferred in hooks if not is_deferred)
+            self._deferred[event] = tuple(func for _, func, is_deferred in hooks if is_deferred)
+            setattr(self, event, tuple(func for _, func, _ in hooks))
+        if any(self._deferred.values()) and self._thread is None:
+            self._queue = SimpleQueue()
+            self._thread = threading.Thread(target=self._worker, name='hooks', daemon=True)
+            self._thread.start()
+
+    def emit(self, event: str, *args):
+        """Run inline hooks now and queue deferred ones"""
+        stats = self.stats[event]
+        for func in self._inline[event]:
+            start = time.perf_counter_ns()
+            try:
+                func(*args)
+            except Exception as e:
+                stats.errors += 1
+                self.last_error = f"{event} hook {getattr(func, '__module__', '?')}: {e}"
+            stats.calls += 1
+            stats.time_ns += time.perf_counter_ns() - start
+
+        hooks = self._deferred[event]
+        if hooks:
+            self._queue.put((event, hooks, args))
+
+    def _worker(self):
+        stats = self.deferred_stats
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            event, hooks, args = item
+            for func in hooks:
+                start = time.perf_counter_ns()
+                try:
+                    func(*args)
+                except Exception as e:
+                    stats.errors += 1
+                    self.last_error = f"{event} hook {getattr(func, '__module__', '?')}: {e}"
+                stats.calls += 1
+                stats.time_ns += time.perf_counter_ns() - start
+
+    def pending(self) -> int:
+        """Deferred hook batches still waiting in the queue"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def close(self, timeout: float = 2.0):
+        """Let queued deferred hooks finish, then stop the hook thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def total_time_ns(self) -> Tuple[int, int]:
+        """(inline, deferred) hook time in nanoseconds"""
+        return (sum(s.time_ns for s in self.stats.values()), self.deferred_stats.time_ns)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ Background job control
+Runs '&' command lists on a worker pool and tracks them in a job table
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+JOB_WORKERS = 4
+
+
+class Job:
+    """One background command list and its buffered result"""
+
+    def __init__(self, job_id: int, command: str, cwd: Path):
+        self.id = job_id
+        self.command = command
+        self.cwd = cwd
+        self.status = 'running'          # running | done | failed | killed
+        self.code: Optional[int] = None
+        self.output = ""
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.future: Optional[Future] = None
+        self.shell = None                # forked shell the job runs in
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started
+
+    @property
+    def active(self) -> bool:
+        return self.status == 'running'
+
+    def describe(self) -> str:
+        return f"[{self.id}]  {self.status.capitalize():<8} {self.elapsed:7.1f}s  {self.command}"
+
+
+class JobTable:
+    """Job table shared by a shell and its forks"""
+
+    def __init__(self, max_workers: int = JOB_WORKERS):
+        self.max_workers = max_workers
+        self.jobs: Dict[int, Job] = {}
+        self.notices: List[str] = []
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, shell, and_or, command: str) -> Job:
+        """Run a parsed && / || list in the background on a shell fork"""
+        job_shell = shell.fork()
+
+        with self._lock:
+            job = Job(self._next_id, command, job_shell.cwd)
+            self._next_id += 1
+            self.jobs[job.id] = job
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='job')
+
+        job.shell = job_shell
+        job.future = self._executor.submit(self._run, job, and_or)
+        return job
+
+    def _run(self, job: Job, and_or):
+        try:
+            code, output = job.shell._execute_logical(and_or)
+        except Exception as e:
+            code, output = 1, f"❌ {e}"
+
+        job.finished = time.monotonic()
+        if job.status == 'killed':
+            return
+        job.code = code
+        job.output = output
+        job.status = 'done' if code == 0 else 'failed'
+        with self._lock:
+            self.notices.append(f"[{job.id}]+ {job.status.capitalize()}  {job.command}")
+
+    def get(self, spec: Optional[str] = None) -> Optional[Job]:
+        """Find a job by '%n' / 'n', or the most recent one"""
+        if spec is None:
+            return self.jobs[max(self.jobs)] if self.jobs else None
+        try:
+            return self.jobs.get(int(spec.lstrip('%')))
+        except ValueError:
+            return None
+
+    def wait(self, job: Job, timeout: Optional[float] = None) -> bool:
+        """Block until a job finishes; False on timeout"""
+        if job.future is None:
+            return True
+        done, _ = wait([job.future], timeout=timeout)
+        return bool(done)
+
+    def kill(self, job: Job) -> bool:
+        """Cancel a job; running ones stop at their next cancellation check"""
+        if not job.active:
+            return False
+        job.status = 'killed'
+        job.finished = time.monotonic()
+        if job.future is not None and not job.future.cancel():
+            job.shell.cancel_event.set()
+        return True
+
+    def remove(self, job: Job):
+        """Forget a finished job and its notice once its output was collected"""
+        prefix = f"[{job.id}]+ "
+        with self._lock:
+            self.jobs.pop(job.id, None)
+            self.notices = [n for n in self.notices if not n.startswith(prefix)]
+
+    def take_notices(self) -> List[str]:
+        """Completion notices since the last call"""
+        with self._lock:
+            notices, self.notices = self.notices, []
+        return notices
+
+    def shutdown(self):
+        """Kill remaining jobs and stop the worker pool"""
+        for job in list(self.jobs.values()):
+            self.kill(job)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
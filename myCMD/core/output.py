@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+📄 Paged command output
+Lazy output objects that produce lines on demand, and the pager that views them
+"""
+
+import threading
+from typing import Iterable, Iterator, List, Optional
+
+PAGE_LINES = 40         # page height when the UI cannot tell
+
+
+class PagedOutput:
+    """Command output read lazily, a page at a time.
+
+    Lines are pulled from the underlying iterator only when a page needs
+    them and are kept, so paging back costs nothing.  Iterating the object
+    yields every line, so a PagedOutput can stand in for any command
+    output (pipes, redirects, execute()).
+    """
+
+    def __init__(self, lines: Iterable[str], title: str = "", quit_at_end: bool = False):
+        self._source = iter(lines)
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+        self.title = title
+        self.quit_at_end = quit_at_end      # 'more' leaves after the last page
+        self.done = False
+
+    def wrap(self, lines: Iterable[str]) -> 'PagedOutput':
+        """Same paging settings over another line stream"""
+        return PagedOutput(lines, self.title, self.quit_at_end)
+
+    def load(self, stop: Optional[int]) -> int:
+        """Read lines until `stop` are loaded (None: all); returns the count"""
+        with self._lock:
+            lines = self._lines
+            while not self.done and (stop is None or len(lines) < stop):
+                try:
+                    lines.append(next(self._source))
+                except StopIteration:
+                    self.done = True
+            return len(lines)
+
+    @property
+    def loaded(self) -> int:
+        return len(self._lines)
+
+    def lines(self, start: int, stop: Optional[int]) -> List[str]:
+        self.load(stop)
+        return self._lines[start:stop]
+
+    def find(self, text: str, start: int) -> Optional[int]:
+        """Index of the first line at or after `start` containing text"""
+        i = start
+        while True:
+            if i >= len(self._lines) and self.load(i + 1) <= i:
+                return None
+            if text in self._lines[i]:
+                return i
+            i += 1
+
+    def __iter__(self) -> Iterator[str]:
+        i = 0
+        while i < len(self._lines) or self.load(i + 1) > i:
+            yield self._lines[i]
+            i += 1
+
+    def close(self):
+        """Stop the producer (runs its cleanup, e.g. perf and hooks)"""
+        close = getattr(self._source, 'close', None)
+        if close is not None:
+            close()
+
+
+class Pager:
+    """less-style navigation over a PagedOutput, shared by both UIs.
+
+    Keys: Enter/Space/f next page, b previous page, j/k one line,
+    g top, G bottom, /text search, q quit.
+    """
+
+    def __init__(self, output: PagedOutput, page_size: int = PAGE_LINES):
+        self.output = output
+        self.page_size = max(1, page_size)
+        self.top = 0
+        self.message = ""
+
+    def page(self) -> List[str]:
+        """Lines of the current page (reads the producer as needed)"""
+        return self.output.lines(self.top, self.top + self.page_size)
+
+    def at_end(self) -> bool:
+        return self.output.done and self.top + self.page_size >= self.output.loaded
+
+    def handle(self, key: str) -> bool:
+        """Apply one key or command; False means quit"""
+        self.message = ""
+        size = self.page_size
+        if key in ('q', 'Q', ':q'):
+            return False
+        if key in ('', ' ', 'f', 'space'):
+            if self.at_end():
+                return not self.output.quit_at_end
+            self.top += size
+        elif key == 'b':
+            self.top = max(0, self.top - size)
+        elif key == 'j':
+            self.top += 1
+        elif key == 'k':
+            self.top = max(0, self.top - 1)
+        elif key == 'g':
+            self.top = 0
+        elif key == 'G':
+            self.top = max(0, self.output.load(None) - size)
+        elif key.startswith('/') and len(key) > 1:
+            found = self.output.find(key[1:], self.top + 1)
+            if found is None:
+                self.message = f"Pattern not found: {key[1:]}"
+            else:
+                self.top = found
+        else:
+            self.message = f"Unknown key '{key}'"
+        # Never scroll past the last line
+        self.top = min(self.top, max(0, self.output.load(self.top + 1) - 1))
+        return True
+
+    def status(self) -> str:
+        shown = min(self.top + self.page_size, self.output.loaded)
+        total = f"of {self.output.loaded}" if self.output.done else "(more)"
+        title = f"{self.output.title} " if self.output.title else ""
+        status = f"-- {title}lines {self.top + 1}-{shown} {total} --"
+        if self.at_end():
+            status += " (END)"
+        hint = "[Enter] next  [b] back  [/text] search  [q] quit"
+        return f"{status} {self.message or hint}"
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+🧩 Command line parser
+Tokenizes command text and compiles it into a cached execution plan
+"""
+
+import re
+import shlex
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+
+
+OPERATORS = ('||', '&&', '>>', '|', ';', '>', '<', '&')
+REDIRECTS = ('>', '>>', '<')
+PLAN_CACHE_SIZE = 1024
+
+_PLAIN_RUN = re.compile(r"""[^\s'"\\|&;<>]+""")
+
+
+class ParseError(Exception):
+    """Raised for malformed command lines"""
+
+
+class Token(NamedTuple):
+    kind: str      # 'word' or 'op'
+    value: str
+
+
+class Redirect(NamedTuple):
+    op: str        # '>', '>>' or '<'
+    target: str
+
+
+class Command(NamedTuple):
+    argv: Tuple[str, ...]
+    redirects: Tuple[Redirect, ...] = ()
+
+
+class Pipeline(NamedTuple):
+    commands: Tuple[Command, ...]
+
+
+class AndOr(NamedTuple):
+    pipelines: Tuple[Pipeline, ...]
+    operators: Tuple[str, ...]     # '&&' / '||' between pipelines
+    background: bool = False       # terminated by '&'
+
+
+class Plan(NamedTuple):
+    lists: Tuple[AndOr, ...]       # separated by ';' or '&'
+    tokens: Tuple[str, ...]        # flat token texts, for dna/parse_command
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split command text into words and operators.
+
+    Supports single quotes, double quotes, backslash escapes and ``#``
+    comments that start a word.
+    """
+    tokens: List[Token] = []
+    word: List[str] = []
+    in_word = False
+    i = 0
+    n = len(text)
+
+    while i < n:
+        ch = text[i]
+
+        if ch.isspace():
+            if in_word:
+                tokens.append(Token('word', ''.join(word)))
+                word = []
+                in_word = False
+            i += 1
+
+        elif ch == '#' and not in_word:
+            break
+
+        elif ch == "'":
+            end = text.find("'", i + 1)
+            if end < 0:
+                raise ParseError("unterminated single quote")
+            word.append(text[i + 1:end])
+            in_word = True
+            i = end + 1
+
+        elif ch == '"':
+            i += 1
+            while True:
+                if i >= n:
+                    raise ParseError("unterminated double quote")
+                ch = text[i]
+                if ch == '"':
+                    break
+                if ch == '\\' and i + 1 < n and text[i + 1] in '"\\$`':
+                    i += 1
+                    ch = text[i]
+                word.append(ch)
+                i += 1
+            in_word = True
+            i += 1
+
+        elif ch == '\\':
+            if i + 1 < n:
+                word.append(text[i + 1])
+            in_word = True
+            i += 2
+
+        elif ch in '|&;<>':
+            if in_word:
+                tokens.append(Token('word', ''.join(word)))
+                word = []
+                in_word = False
+            for op in OPERATORS:
+                if text.startswith(op, i):
+                    tokens.append(Token('op', op))
+                    i += len(op)
+                    break
+
+        else:
+            end = _PLAIN_RUN.match(text, i).end()
+            word.append(text[i:end])
+            in_word = True
+            i = end
+
+    if in_word:
+        tokens.append(Token('word', ''.join(word)))
+
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser over a token list"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> str:
+        if self.pos < len(self.tokens) and self.tokens[self.pos].kind == 'op':
+            return self.tokens[self.pos].value
+        return ''
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.tokens)
+
+    def parse_plan(self) -> Tuple[AndOr, ...]:
+        lists = []
+        while not self.at_end():
+            if self.peek() == ';':
+                self.pos += 1
+                continue
+            and_or = self.parse_and_or()
+            op = self.peek()
+            if op == '&':
+                and_or = and_or._replace(background=True)
+                self.pos += 1
+            elif op == ';':
+                self.pos += 1
+            elif not self.at_end():
+                raise ParseError(f"unexpected '{op}'")
+            lists.append(and_or)
+        return tuple(lists)
+
+    def parse_and_or(self) -> AndOr:
+        pipelines = [self.parse_pipeline()]
+        operators = []
+        while self.peek() in ('&&', '||'):
+            operators.append(self.tokens[self.pos].value)
+            self.pos += 1
+            pipelines.append(self.parse_pipeline())
+        return AndOr(tuple(pipelines), tuple(operators))
+
+    def parse_pipeline(self) -> Pipeline:
+        commands = [self.parse_command()]
+        while self.peek() == '|':
+            self.pos += 1
+            commands.append(self.parse_command())
+        return Pipeline(tuple(commands))
+
+    def parse_command(self) -> Command:
+        argv = []
+        redirects = []
+        while not self.at_end():
+            token = self.tokens[self.pos]
+            if token.kind == 'word':
+                argv.append(token.value)
+                self.pos += 1
+            elif token.value in REDIRECTS:
+                self.pos += 1
+                if self.at_end() or self.tokens[self.pos].kind != 'word':
+                    raise ParseError(f"missing file after '{token.value}'")
+                redirects.append(Redirect(token.value, self.tokens[self.pos].value))
+                self.pos += 1
+            else:
+                break
+        if not argv:
+            raise ParseError(f"syntax error near '{self.peek() or 'end of line'}'")
+        return Command(tuple(argv), tuple(redirects))
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_plan(text: str) -> Plan:
+    """Parse command text into an immutable Plan (LRU-cached by text)"""
+    tokens = tokenize(text)
+    lists = _Parser(tokens).parse_plan()
+    return Plan(lists, tuple(t.value for t in tokens))
+
+
+def format_and_or(and_or: AndOr) -> str:
+    """Render an && / || list back to command text (for job listings)"""
+    parts = []
+    for i, pipeline in enumerate(and_or.pipelines):
+        if i:
+            parts.append(and_or.operators[i - 1])
+        stages = []
+        for command in pipeline.commands:
+            words = [shlex.quote(arg) for arg in command.argv]
+            words += [f"{r.op} {shlex.quote(r.target)}" for r in command.redirects]
+            stages.append(' '.join(words))
+        parts.append(' | '.join(stages))
+    return ' '.join(parts)
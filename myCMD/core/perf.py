@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+⏲️ Command latency instrumentation
+Per-command latency histograms on the monotonic nanosecond clock
+"""
+
+import json
+import threading
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+SUB_BITS = 4                      # 16 sub-buckets per power of two (~6% error)
+SUB_BUCKETS = 1 << SUB_BITS
+BUCKET_COUNT = (64 - SUB_BITS + 1) << SUB_BITS
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(ns: int) -> int:
+    """Log-linear bucket for a duration: exact below 16ns, then 16 per octave"""
+    if ns < SUB_BUCKETS:
+        return ns
+    shift = ns.bit_length() - SUB_BITS - 1
+    return ((shift + 1) << SUB_BITS) + ((ns >> shift) & (SUB_BUCKETS - 1))
+
+
+def bucket_upper(index: int) -> int:
+    """Largest duration (ns) that falls into a bucket"""
+    if index < SUB_BUCKETS:
+        return index
+    shift = (index >> SUB_BITS) - 1
+    return ((SUB_BUCKETS + (index & (SUB_BUCKETS - 1))) << shift) + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Latency distribution and output size for one command"""
+
+    __slots__ = ('count', 'total_ns', 'max_ns', 'output_chars', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.output_chars = 0
+        self.buckets = [0] * BUCKET_COUNT
+
+    def record(self, ns: int, output_chars: int = 0):
+        self.count += 1
+        self.total_ns += ns
+        self.output_chars += output_chars
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.buckets[bucket_index(ns)] += 1
+
+    def percentile(self, p: float) -> int:
+        """Upper bound (ns) of the bucket holding the p-th percentile"""
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bucket_upper(index), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, Any]:
+        data = {
+            'count': self.count,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'max_ms': self.max_ns / 1e6,
+            'output_chars': self.output_chars,
+        }
+        for p in PERCENTILES:
+            data[f'p{p}_ms'] = self.percentile(p) / 1e6
+        return data
+
+
+class PerfRecorder:
+    """Always-on latency histograms keyed by command name"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.started_ns = perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, ns: int, output_chars: int = 0):
+        """Add one timed call (safe from job and pipe worker threads)"""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(ns, output_chars)
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.started_ns = perf_counter_ns()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Summaries per command, busiest first"""
+        with self._lock:
+            items = [(name, h.summary()) for name, h in self.histograms.items()]
+        items.sort(key=lambda item: item[1]['count'], reverse=True)
+        return dict(items)
+
+    def dump(self, path) -> int:
+        """Write summaries plus raw non-empty buckets to a JSON file"""
+        with self._lock:
+            data = {
+                'uptime_s': (perf_counter_ns() - self.started_ns) / 1e9,
+                'commands': {},
+            }
+            for name, h in self.histograms.items():
+                entry = h.summary()
+                entry['buckets_ns'] = {str(bucket_upper(i)): n
+                                       for i, n in enumerate(h.buckets) if n}
+                data['commands'][name] = entry
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return len(data['commands'])
+
+    def report(self, limit: int = 20) -> List[str]:
+        """Table rows for the perf command"""
+        rows = [f"{'Command':<22}{'Count':>7}{'p50 ms':>10}{'p95 ms':>10}"
+                f"{'p99 ms':>10}{'max ms':>10}{'avg out':>9}"]
+        for name, s in list(self.snapshot().items())[:limit]:
+            avg_out = s['output_chars'] // s['count'] if s['count'] else 0
+            rows.append(f"{name[:21]:<22}{s['count']:>7}{s['p50_ms']:>10.3f}{s['p95_ms']:>10.3f}"
+                        f"{s['p99_ms']:>10.3f}{s['max_ms']:>10.3f}{avg_out:>9}")
+        return rows
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+🔗 Streaming pipeline engine
+Pipe stages exchange lazy iterators of lines instead of whole strings
+"""
+
+import inspect
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .fileio import iter_file_lines
+
+
+def streaming(func: Callable) -> Callable:
+    """Mark a command as stream-aware.
+
+    Stream-aware commands are called as ``func(args, shell, stdin=None)``
+    where ``stdin`` is an iterator of lines (without trailing newlines) or
+    None, and may return an iterable of lines instead of a string.
+    """
+    func.streaming = True
+    return func
+
+
+def is_streaming(func: Callable) -> bool:
+    """Check whether a command accepts a stdin line iterator"""
+    return bool(getattr(func, 'streaming', False))
+
+
+def is_async(func: Callable) -> bool:
+    """Check whether a command is an ``async def`` coroutine function"""
+    resolve = getattr(func, 'resolve', None)    # LazyCommand proxies
+    if resolve is not None:
+        func = resolve()
+    return inspect.iscoroutinefunction(func)
+
+
+def run_sync(result: Any) -> Any:
+    """Drive a coroutine returned by an async command to completion"""
+    if inspect.iscoroutine(result):
+        import asyncio      # slow to import, so only async paths load it
+        return asyncio.run(result)
+    return result
+
+
+def iter_lines(output: Any) -> Iterator[str]:
+    """Turn command output (string or iterable of lines) into a line iterator"""
+    if isinstance(output, str):
+        return iter(output.split('\n')) if output else iter(())
+    return iter(output)
+
+
+def call_stage(func: Callable, args: List[str], shell,
+               stdin: Optional[Iterator[str]] = None) -> Tuple[int, Any]:
+    """Call one pipe stage, adapting legacy commands to streams.
+
+    Legacy commands still receive their input as a single ``--stdin=...``
+    argument, so they materialize upstream output; stream-aware commands
+    get the iterator itself.
+    """
+    if is_streaming(func):
+        result = func(args, shell, stdin=stdin)
+    else:
+        if stdin is not None:
+            data = '\n'.join(stdin)
+            if data:
+                args = args + [f"--stdin={data}"]
+        result = func(args, shell)
+
+    result = run_sync(result)
+    if isinstance(result, tuple):
+        return result
+    return (0, result)
+
+
+class CommandCancelled(Exception):
+    """Raised inside a running command once its shell was asked to stop"""
+
+    def __init__(self, message: str = "Cancelled"):
+        super().__init__(message)
+
+
+def count_lines(lines: Iterable[str], stats: Dict[str, Any],
+                cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    """Pass lines through, counting them into stats['output_lines']"""
+    cancelled = cancel.is_set if cancel is not None else bool
+    for line in lines:
+        if cancelled():
+            raise CommandCancelled()
+        stats['output_lines'] += 1
+        yield line
+
+
+def upstream(stream: Iterable[str]) -> Iterator[str]:
+    """A stage's output as the next stage reads it; a quiet exit status is EOF"""
+    try:
+        yield from stream
+    except StageError as e:
+        if e.output:
+            raise
+
+
+def close_streams(streams: List[Iterator[str]]):
+    """Close stage generators so early-exited producers release files"""
+    for stream in reversed(streams):
+        close = getattr(stream, 'close', None)
+        if close is not None:
+            close()
+
+
+# --- Pipeline runners -------------------------------------------------------
+
+PIPE_BUFFER_LINES = 16384   # lines buffered between two stages (backpressure)
+PIPE_WAKE_LINES = 256       # lines that wake a waiting reader early
+PIPE_LATENCY = 0.02         # max seconds a waiting reader sleeps between checks
+PIPE_MAX_WORKERS = 32       # pump threads shared by all running pipelines
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_workers_in_use = 0
+
+
+class StageError(Exception):
+    """A pipe stage failed with a non-zero return code.
+
+    With empty output it is just an exit status (grep without a match):
+    nothing is printed, and a stage downstream sees plain end of input.
+    """
+
+    def __init__(self, code: int, output: str):
+        super().__init__(output)
+        self.code = code
+        self.output = output
+
+
+class _Link:
+    """Bounded line buffer between two stages.
+
+    Lines go through a deque, whose append/popleft are atomic, so neither
+    side takes a lock per line.  A waiting reader is woken once a batch of
+    PIPE_WAKE_LINES is ready, and otherwise polls every PIPE_LATENCY, so
+    slow producers ('tail -f') are never held back waiting for a batch.
+    """
+
+    def __init__(self, cancel: threading.Event):
+        self.lines: deque = deque()
+        self.cancel = cancel
+        self.done = False
+        self.failure: Optional[BaseException] = None
+        self.reader_waiting = False
+        self.writer_waiting = False
+        self.readable = threading.Event()
+        self.writable = threading.Event()
+
+    def pump(self, stream: Iterable[str]) -> bool:
+        """Copy a stage's output into the buffer; False if cancelled"""
+        lines = self.lines
+        append = lines.append
+        cancelled = self.cancel.is_set
+        for line in stream:
+            if cancelled():
+                return False
+            append(line)
+            if self.reader_waiting and len(lines) >= PIPE_WAKE_LINES:
+                self.reader_waiting = False
+                self.readable.set()
+            while len(lines) >= PIPE_BUFFER_LINES:
+                if self.cancel.is_set():
+                    return False
+                self.writer_waiting = True
+                self.writable.wait(PIPE_LATENCY)
+                self.writable.clear()
+        return True
+
+    def finish(self, failure: Optional[BaseException] = None):
+        """End the stream, optionally with an error for the reader"""
+        self.failure = failure
+        self.done = True
+        self.readable.set()
+
+    def reader(self) -> Iterator[str]:
+        """Downstream view of the link as a line iterator"""
+        lines = self.lines
+        popleft = lines.popleft
+        low_water = PIPE_BUFFER_LINES // 2
+        while True:
+            try:
+                line = popleft()
+            except IndexError:
+                if self.done and not lines:
+                    if self.failure is not None:
+                        raise self.failure
+                    return
+                if self.cancel.is_set():
+                    return
+                self.reader_waiting = True
+                self.readable.wait(PIPE_LATENCY)
+                self.readable.clear()
+                continue
+            if self.writer_waiting and len(lines) < low_water:
+                self.writer_waiting = False
+                self.writable.set()
+            yield line
+
+
+def _reserve_workers(count: int) -> Optional[ThreadPoolExecutor]:
+    """Claim pump threads, or None when the shared pool is saturated.
+
+    Every pump of a pipeline must be running at once, so a pipeline that
+    cannot get all of its threads falls back to sequential streaming
+    instead of deadlocking behind other pipelines.
+    """
+    global _executor, _workers_in_use
+    with _executor_lock:
+        if _workers_in_use + count > PIPE_MAX_WORKERS:
+            return None
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PIPE_MAX_WORKERS,
+                                           thread_name_prefix='pipe')
+        _workers_in_use += count
+        return _executor
+
+
+def _release_workers(count: int):
+    global _workers_in_use
+    with _executor_lock:
+        _workers_in_use -= count
+
+
+class SequentialPipeline:
+    """Stages chained as lazy generators in the calling thread"""
+
+    def __init__(self, stages: List[Tuple[Callable, Dict[str, Any]]]):
+        self.streams: List[Iterator[str]] = []
+        stream = None
+        try:
+            for opener, stats in stages:
+                stream = opener(upstream(stream) if stream is not None else None)
+                self.streams.append(stream)
+        except BaseException:
+            self.close()
+            raise
+        self.output = stream if stream is not None else iter(())
+
+    def close(self):
+        close_streams(self.streams)
+
+
+class ConcurrentPipeline:
+    """Every stage but the last runs on a pump thread.
+
+    Stages are linked by bounded line buffers, so a fast producer blocks
+    instead of buffering unboundedly.  Closing the pipeline (after the
+    last stage finished early, or failed) cancels all upstream pumps.
+    """
+
+    def __init__(self, stages: List[Tuple[Callable, Dict[str, Any]]],
+                 executor: ThreadPoolExecutor):
+        self.cancel = threading.Event()
+        self.output: Iterator[str] = iter(())
+
+        stdin = None
+        pumps = 0
+        try:
+            for opener, stats in stages[:-1]:
+                link = _Link(self.cancel)
+                executor.submit(self._pump, opener, stats, stdin, link)
+                pumps += 1
+                stdin = link.reader()
+            opener, stats = stages[-1]
+            self.output = opener(stdin)
+        except BaseException:
+            _release_workers(len(stages) - 1 - pumps)
+            self.close()
+            raise
+
+    def _pump(self, opener: Callable, stats: Dict[str, Any],
+              stdin: Optional[Iterator[str]], link: _Link):
+        """Run one stage, forwarding its lines downstream"""
+        start = time.perf_counter()
+        stats['status'] = 'running'
+        stream = None
+        try:
+            stream = opener(stdin)
+            stats['status'] = 'done' if link.pump(upstream(stream)) else 'cancelled'
+            link.finish()
+        except BaseException as e:
+            stats['status'] = 'cancelled' if self.cancel.is_set() else 'error'
+            link.finish(e)
+        finally:
+            stats['elapsed'] = time.perf_counter() - start
+            close_streams([s for s in (stdin, stream) if s is not None])
+            _release_workers(1)
+
+    def close(self):
+        """Cancel upstream stages; their pumps exit within PIPE_LATENCY"""
+        self.cancel.set()
+        close_streams([self.output])
+
+
+def open_pipeline(stages: List[Tuple[Callable, Dict[str, Any]]], concurrent: bool = True):
+    """Start a pipeline from (opener, stats) pairs.
+
+    Each opener takes the upstream line iterator (or None) and returns the
+    stage's output iterator.  Returns an object with ``output`` and
+    ``close()``.
+    """
+    if concurrent and len(stages) > 1:
+        executor = _reserve_workers(len(stages) - 1)
+        if executor is not None:
+            return ConcurrentPipeline(stages, executor)
+    return SequentialPipeline(stages)
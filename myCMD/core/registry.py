@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+📇 Command registry
+Installs built-in commands from the manifest and imports their modules lazily
+"""
+
+import sys
+from importlib import import_module, reload
+from pathlib import Path
+from typing import Callable, Dict, Set
+
+
+class LazyCommand:
+    """Stand-in for a built-in command that imports its module on first use.
+
+    After resolving, it swaps the real function into the commands dict, so
+    only the first call pays for the proxy.
+    """
+
+    def __init__(self, registry: 'CommandRegistry', commands: Dict[str, Callable],
+                 name: str, module_name: str, func_name: str, help_text: str):
+        self._func = None
+        self._registry = registry
+        self._commands = commands
+        self.name = name
+        self.module_name = module_name
+        self.func_name = func_name
+        self.__doc__ = help_text
+
+    def resolve(self) -> Callable:
+        """Import the command module and return the real function"""
+        if self._func is None:
+            module = self._registry.import_command_module(self.module_name)
+            self._func = getattr(module, self.func_name)
+            if self._commands.get(self.name) is self:
+                self._commands[self.name] = self._func
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # Attributes such as 'streaming' live on the real function
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return f"<LazyCommand {self.name} -> {self.module_name}:{self.func_name}>"
+
+
+class CommandRegistry:
+    """Built-in command manifest plus lazy module loading"""
+
+    def __init__(self, commands_path: Path):
+        self.commands_path = commands_path
+        self.package = commands_path.name
+
+        package_root = str(commands_path.parent)
+        if package_root not in sys.path:
+            sys.path.insert(0, package_root)
+
+        manifest = import_module(f'{self.package}.manifest')
+        self.modules = manifest.MODULES
+        self.manifest = manifest.MANIFEST
+        self.subcommands = getattr(manifest, 'SUBCOMMANDS', {})
+        self._stale: Set[str] = set()
+        self.generation = 0         # bumped on every reload; completers rebuild on change
+
+    def install(self, commands: Dict[str, Callable]):
+        """Register every manifest command as a LazyCommand"""
+        for name, (module_name, func_name, help_text) in self.manifest.items():
+            commands[name] = LazyCommand(self, commands, name,
+                                         module_name, func_name, help_text)
+
+    def import_command_module(self, module_name: str):
+        """Import a built-in command module, reloading it if marked stale"""
+        full_name = f'{self.package}.{module_name}'
+        module = import_module(full_name)
+        if full_name in self._stale:
+            self._stale.discard(full_name)
+            module = reload(module)
+        return module
+
+    def mark_stale(self):
+        """Reload already-imported modules on their next use (hot reload)"""
+        self.generation += 1
+        self._stale = {f'{self.package}.{m}' for m in self.modules
+                       if f'{self.package}.{m}' in sys.modules}
+
+    def resolve_all(self, commands: Dict[str, Callable]):
+        """Import everything up front (the old eager behaviour)"""
+        for func in list(commands.values()):
+            if isinstance(func, LazyCommand):
+                func.resolve()
+
+    def loaded_modules(self) -> Set[str]:
+        """Names of built-in command modules imported so far"""
+        return {m for m in self.modules if f'{self.package}.{m}' in sys.modules}
@@ -5,21 +5,39 @@ Parses and executes commands without UI dependency
 """
 
 import os
+import copy
 import json
-import re
-import sys
+import threading
 import time
+from collections import ChainMap
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Callable
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional, Callable, Iterable, Iterator, Sequence
 from datetime import datetime
-from importlib import import_module
+from functools import partial
+
+from .completion import Completer
+from .fscache import DirCache
+from .history import History
+from .output import PagedOutput
+from .hooks import HookBus
+from .jobs import JobTable
+from .perf import PerfRecorder
+from .parser import AndOr, Command, ParseError, Pipeline, Plan, Redirect, compile_plan, format_and_or
+from .pipeline import (CommandCancelled, StageError, call_stage, count_lines, is_async,
+                       iter_file_lines, iter_lines, open_pipeline, run_sync)
+from .registry import CommandRegistry
+
+HOOK_OUTPUT_LINES = 10000   # streamed lines kept for on_command_complete ('tail -f' never ends)
 
 
 class ShellCore:
     """Core shell engine - parses and executes commands"""
     
     def __init__(self, commands_path: Path, plugins_path: Path, 
-                 sandbox_enabled: bool = True, i18n=None):
+                 sandbox_enabled: bool = True, i18n=None,
+                 history_file: Optional[Path] = None, index_file: Optional[Path] = None):
+        init_start = time.perf_counter()
         self.commands_path = commands_path
         self.plugins_path = plugins_path
         self.sandbox_enabled = sandbox_enabled
@@ -30,14 +48,18 @@ class ShellCore:
         self.i18n = i18n
         
         # State
-        self.history: List[str] = []
+        self.history = History(history_file)
+        self.index_file = index_file
         self.history_index = -1
         self.last_command = ""
         self.last_error:  Optional[str] = None
         self.last_output = ""
+        self.last_exit_code: Optional[int] = None   # final code of a stream, once known
         self.env:  Dict[str, str] = dict(os.environ)
         self.cwd = Path.cwd()
+        self.sync_process_cwd = True
         self.session_active = True
+        self.parent: Optional['ShellCore'] = None      # set on sessions from new_session()
         self. dryrun_mode = False
         self.trace_mode = False
         self. current_theme = 'dos'
@@ -45,45 +67,42 @@ class ShellCore:
         # Visual system map
         self.system_map_enabled = False
         self.pipe_chain:  List[Dict[str, Any]] = []
+        self.pipe_concurrency = True
         
         # Variables and functions
         self.variables: Dict[str, str] = {}
         
         # Performance tracking
         self.last_command_time = 0.0
+        self.perf = PerfRecorder()
+        self.dir_cache = DirCache()
+        
+        # Background jobs and cooperative cancellation
+        self.jobs = JobTable()
+        self.cancel_event = threading.Event()
+        self.ui_thread: Optional[int] = None    # UI event-loop thread that must never block
         
         # Load commands
         self.commands:  Dict[str, Callable] = {}
         self. plugins: Dict[str, Any] = {}
-        self.builtin_cmds = [
-            'bash_commands',
-            'ai_commands',
-            'extend_commands',
-            'sandbox_commands',
-            'ascii_commands',
-            'viz_commands',
-            'session_commands',
-            'language_commands'
-        ]
+        self.hooks = HookBus()
+        self.registry = CommandRegistry(commands_path)
         
         self.load_builtin_commands()
         self.load_custom_commands()
         self.load_plugins()
+        self.completer = Completer(self)
+        
+        self.startup_time = time.perf_counter() - init_start
+    
+    @property
+    def builtin_cmds(self) -> Tuple[str, ...]:
+        """Built-in command modules listed in the manifest"""
+        return self.registry.modules
     
     def load_builtin_commands(self):
-        """Load built-in commands"""
-        for cmd_module in self.builtin_cmds:
-            try:
-                sys.path.insert(0, str(self.commands_path. parent))
-                module = import_module(f'commands.{cmd_module}')
-                
-                if hasattr(module, 'COMMANDS'):
-                    cmds_dict = module.COMMANDS
-                    for cmd_name, cmd_func in cmds_dict.items():
-                        if callable(cmd_func):
-                            self.commands[cmd_name] = cmd_func
-            except Exception as e:
-                print(f"⚠️ Warning: Failed to load {cmd_module}: {e}", file=sys.stderr)
+        """Register built-in commands from the manifest (imported on first use)"""
+        self.registry.install(self.commands)
     
     def load_custom_commands(self):
         """Load custom commands from commands/ directory"""
@@ -93,6 +112,8 @@ class ShellCore:
         for py_file in sorted(self.commands_path.glob('*.py')):
             if py_file.name.startswith('_') or py_file.name.startswith('.'):
                 continue
+            if py_file.stem in self.registry.modules or py_file.stem == 'manifest':
+                continue
             
             try:
                 spec = __import__('importlib.util').util. spec_from_file_location(
@@ -127,22 +148,80 @@ class ShellCore:
                     self.plugins[py_file.stem] = module
                     if hasattr(module, 'initialize'):
                         module.initialize(self)
+                    self.hooks.register_module(py_file.stem, module)
             except Exception as e:
                 self.last_error = f"Failed to load plugin {py_file.stem}: {e}"
     
+    def fork(self) -> 'ShellCore':
+        """Cheap copy for background work.
+        
+        Shares commands, plugins, history and the job table, but has its own
+        cwd snapshot, pipe_chain and cancel flag, and never calls os.chdir.
+        """
+        child = copy.copy(self)
+        child.cwd = Path(self.cwd)
+        child.sync_process_cwd = False
+        child.pipe_chain = []
+        child.cancel_event = threading.Event()
+        return child
+    
+    def new_session(self) -> 'ShellCore':
+        """Another interactive session (a GUI tab) over the same loaded commands.
+        
+        Commands (read-only), plugins, hooks, caches, perf and the file
+        index are shared.  The session has its own cwd, history, variables,
+        modes, jobs and cancel flag; env is a ChainMap whose first map
+        takes the session's own settings.  Nothing is imported or copied
+        wholesale, so a session costs a few milliseconds.
+        """
+        root = self.parent or self
+        session = root.fork()
+        session.parent = root
+        session.cwd = Path(self.cwd)
+        session.commands = MappingProxyType(root.commands)
+        session.env = ChainMap({}, root.env)
+        session.history = History()
+        session.history_index = -1
+        session.last_command = ""
+        session.last_error = None
+        session.last_output = ""
+        session.last_exit_code = None
+        session.variables = {}
+        session.dryrun_mode = False
+        session.trace_mode = False
+        session.system_map_enabled = False
+        session.session_active = True
+        session.jobs = JobTable()
+        session.completer = root.completer.copy(session)
+        return session
+    
+    def close_session(self):
+        """Release what a session from new_session() owns"""
+        self.session_active = False
+        self.cancel_event.set()
+        self.jobs.shutdown()
+        self.history.close()
+    
+    def resolve_path(self, path) -> Path:
+        """Resolve a user-supplied path against the shell's cwd"""
+        p = Path(path).expanduser()
+        return p if p.is_absolute() else self.cwd / p
+    
+    def chdir(self, path: Path):
+        """Change the shell's cwd (and the process cwd for the foreground shell)"""
+        self.cwd = path
+        if self.sync_process_cwd:
+            os.chdir(path)
+    
     def parse_command(self, cmd_str: str) -> List[str]:
         """Parse command string into tokens"""
-        cmd_str = cmd_str.strip()
-        if not cmd_str:
+        if not cmd_str.strip():
             return []
         
-        if '#' in cmd_str:
-            cmd_str = cmd_str[:cmd_str.index('#')]
-        
-        tokens = re.split(r'(\|{1,2}|&&|\|\||>>?  |\s+)', cmd_str)
-        tokens = [t for t in tokens if t and not t.isspace()]
-        
-        return tokens
+        try:
+            return list(compile_plan(cmd_str).tokens)
+        except ParseError:
+            return cmd_str.split()
     
     def execute(self, cmd_str: str) -> Tuple[int, str]:
         """Execute command string.  Returns (return_code, output)"""
@@ -153,28 +232,306 @@ class ShellCore:
         self.history.append(cmd_str)
         self.history_index = len(self.history) - 1
         self.pipe_chain = []
+        self.cancel_event.clear()
         
-        start_time = time.time()
+        hooks = self.hooks
+        if hooks.on_command_execute:
+            hooks.emit('on_command_execute', self, cmd_str)
+        
+        start_time = time.perf_counter()
         
         try:
-            tokens = self.parse_command(cmd_str)
-            
-            if not tokens:
-                return (0, "")
+            plan = compile_plan(cmd_str)
+            result = self._run_plan(plan)
             
-            if '|' in tokens:
-                result = self._execute_pipe(tokens)
-            elif '&&' in tokens or '||' in tokens:
-                result = self._execute_logical(tokens)
-            else:
-                result = self._execute_simple(tokens)
+            self.last_command_time = time.perf_counter() - start_time
+            if self.jobs.notices:
+                code, output = result
+                notices = '\n'.join(self.jobs.take_notices())
+                result = (code, f"{output}\n{notices}" if output else notices)
+        
+        except Exception as e:
+            self.last_error = str(e)
+            result = (1, f"❌ {self.i18n.t('error')}: {e}")
+        
+        if hooks.on_command_complete:
+            hooks.emit('on_command_complete', self, cmd_str, *result)
+        return result
+    
+    async def execute_async(self, cmd_str: str) -> Tuple[int, str]:
+        """Execute command string on the running event loop.
+        
+        ``async def`` commands are awaited directly on the loop; everything
+        else runs on the loop's default executor, so many invocations can
+        share one loop without a thread per call.
+        """
+        if not cmd_str.strip():
+            return (0, "")
+        
+        self.last_command = cmd_str
+        self.history.append(cmd_str)
+        self.history_index = len(self.history) - 1
+        self.pipe_chain = []
+        self.cancel_event.clear()
+        
+        hooks = self.hooks
+        if hooks.on_command_execute:
+            hooks.emit('on_command_execute', self, cmd_str)
+        
+        start_time = time.perf_counter()
+        
+        try:
+            plan = compile_plan(cmd_str)
+            result = await self._run_plan_async(plan)
             
-            self.last_command_time = time.time() - start_time
-            return result
+            self.last_command_time = time.perf_counter() - start_time
+            if self.jobs.notices:
+                code, output = result
+                notices = '\n'.join(self.jobs.take_notices())
+                result = (code, f"{output}\n{notices}" if output else notices)
         
-        except Exception as e: 
+        except Exception as e:
             self.last_error = str(e)
-            return (1, f"❌ {self.i18n.t('error')}: {e}")
+            result = (1, f"❌ {self.i18n.t('error')}: {e}")
+        
+        if hooks.on_command_complete:
+            hooks.emit('on_command_complete', self, cmd_str, *result)
+        return result
+    
+    def execute_stream(self, cmd_str: str) -> Tuple[int, Iterable[str]]:
+        """Execute command string, returning output lines as they are produced.
+        
+        A single command or pipeline comes back as a lazy iterator, so
+        endless producers such as 'tail -f' can be shown while they run;
+        setting cancel_event stops them.  Errors raised mid-stream become
+        a final '❌' line, and background-job notices follow the output;
+        the code returned up front may then be stale, so last_exit_code is
+        set to the final one before those trailing lines.  When the last
+        command returned a PagedOutput ('less', 'more'), so does this.
+        Anything else (';', '&&', '&') runs through execute() and comes
+        back as a list.
+        """
+        if not cmd_str.strip():
+            return (0, [])
+        
+        try:
+            plan = compile_plan(cmd_str)
+        except ParseError:
+            plan = None
+        if (plan is None or len(plan.lists) != 1 or plan.lists[0].background
+                or plan.lists[0].operators or self.dryrun_mode):
+            code, output = self.execute(cmd_str)
+            self.last_exit_code = code
+            return (code, output.split('\n') if output else [])
+        
+        self.last_command = cmd_str
+        self.history.append(cmd_str)
+        self.history_index = len(self.history) - 1
+        self.pipe_chain = []
+        self.cancel_event.clear()
+        self.last_exit_code = None
+        
+        hooks = self.hooks
+        if hooks.on_command_execute:
+            hooks.emit('on_command_execute', self, cmd_str)
+        
+        commands = plan.lists[0].pipelines[0].commands
+        name = ' | '.join(command.argv[0] for command in commands)
+        start = time.perf_counter_ns()
+        pipeline = None
+        paged = None
+        try:
+            if len(commands) == 1 and not commands[0].redirects:
+                cmd, *args = commands[0].argv
+                if cmd not in self.commands:
+                    self.last_error = f"{cmd}:  {self.i18n.t('command_not_found')}"
+                    code, lines = 127, [f"❌ {self.last_error}"]
+                else:
+                    if self.trace_mode:
+                        print(f"[TRACE] 📍 Executing: {cmd} {' '.join(args)}")
+                    code, output = call_stage(self.commands[cmd], args, self)
+                    if isinstance(output, PagedOutput):
+                        paged = output
+                    lines = count_lines(iter_lines(output), {'output_lines': 0}, self.cancel_event)
+            else:
+                stages = self._pipe_stages(commands)
+                if isinstance(stages, tuple):
+                    code, lines = stages[0], [stages[1]]
+                else:
+                    pipeline = open_pipeline(stages, concurrent=self.pipe_concurrency)
+                    code, lines = 0, pipeline.output
+                    paged = self.pipe_chain[-1].get('paged')
+        except StageError as e:
+            code, lines = e.code, iter_lines(e.output)
+        except Exception as e:
+            self.last_error = str(e)
+            code, lines = 1, [f"❌ {e}"]
+        
+        stream = self._drain_stream(cmd_str, name, code, lines, start, pipeline)
+        # A pager at the end of the line hands the UI a PagedOutput to page through
+        return (code, paged.wrap(stream) if paged is not None else stream)
+    
+    def _drain_stream(self, cmd_str: str, name: str, code: int, lines: Iterable[str],
+                      start: int, pipeline=None) -> Iterator[str]:
+        """Pass lines through, then job notices; record perf and fire on_command_complete"""
+        chars = 0
+        # Plugins get the output as execute() gave it, up to HOOK_OUTPUT_LINES lines
+        kept = [] if self.hooks.on_command_complete else None
+        try:
+            try:
+                for line in lines:
+                    chars += len(line) + 1
+                    if kept is not None and len(kept) < HOOK_OUTPUT_LINES:
+                        kept.append(line)
+                    yield line
+            except StageError as e:
+                code = e.code
+                trailer = [e.output] if e.output else []
+            except CommandCancelled as e:
+                code = 130
+                trailer = [f"❌ {e}"]
+            except Exception as e:
+                code = 1
+                self.last_error = str(e)
+                trailer = [f"❌ {e}"]
+            else:
+                trailer = []
+            self.last_exit_code = code      # final from here on, trailer included
+            if self.jobs.notices:
+                trailer.extend(self.jobs.take_notices())
+            for line in trailer:
+                chars += len(line) + 1
+                if kept is not None and len(kept) < HOOK_OUTPUT_LINES:
+                    kept.append(line)
+                yield line
+        finally:
+            if pipeline is not None:
+                pipeline.close()
+            self.last_exit_code = code
+            elapsed = time.perf_counter_ns() - start
+            self.last_command_time = elapsed / 1e9
+            if self.pipe_chain:
+                self.pipe_chain[-1]['elapsed'] = elapsed / 1e9
+            self.perf.record(name, elapsed, chars)
+            if self.hooks.on_command_complete:
+                self.hooks.emit('on_command_complete', self, cmd_str, code, '\n'.join(kept or ()))
+    
+    def execute_script(self, script_path, record_history: bool = False,
+                       stop_on_error: bool = False) -> Tuple[int, str]:
+        """Execute a script file line by line.
+        
+        Lines are streamed from disk and compiled through the plan cache;
+        unlike execute(), no per-line history, timing or pipe_chain
+        bookkeeping is done.  Ends with an aggregate throughput line.
+        """
+        path = self.resolve_path(script_path)
+        if not path.is_file():
+            return (1, f"❌ {self.i18n.t('no_file')}: {script_path}")
+        
+        run_plan = self._run_plan
+        history = self.history
+        outputs = []
+        code = 0
+        executed = 0
+        
+        start_time = time.perf_counter()
+        with open(path) as f:
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
+                
+                executed += 1
+                if record_history:
+                    history.append(line)
+                
+                try:
+                    code, output = run_plan(compile_plan(line))
+                except Exception as e:
+                    code, output = 1, f"❌ {path.name}:{number}: {e}"
+                
+                if output:
+                    outputs.append(output)
+                if code != 0 and stop_on_error:
+                    break
+                if self.cancel_event.is_set():
+                    outputs.append(f"❌ {CommandCancelled()}")
+                    break
+        
+        elapsed = time.perf_counter() - start_time
+        rate = executed / elapsed if elapsed > 0 else 0.0
+        outputs.append(f"[SCRIPT] {executed} lines in {elapsed:.3f}s ({rate:,.0f} lines/s)")
+        self.last_command_time = elapsed
+        
+        return (code, '\n'.join(outputs))
+    
+    def _run_plan(self, plan: Plan) -> Tuple[int, str]:
+        """Run a compiled plan: ';'-separated lists of && / || chains"""
+        if len(plan.lists) == 1 and not plan.lists[0].background:
+            return self._execute_logical(plan.lists[0])
+        
+        code = 0
+        outputs = []
+        for and_or in plan.lists:
+            if self.cancel_event.is_set():
+                return (130, f"❌ {CommandCancelled()}")
+            if and_or.background:
+                job = self.jobs.submit(self, and_or, format_and_or(and_or))
+                code, output = 0, f"[{job.id}] {job.command}"
+            else:
+                code, output = self._execute_logical(and_or)
+            if output:
+                outputs.append(output)
+        
+        return (code, '\n'.join(outputs))
+    
+    async def _run_plan_async(self, plan: Plan) -> Tuple[int, str]:
+        """Async counterpart of _run_plan()"""
+        code = 0
+        outputs = []
+        for and_or in plan.lists:
+            if self.cancel_event.is_set():
+                return (130, f"❌ {CommandCancelled()}")
+            if and_or.background:
+                job = self.jobs.submit(self, and_or, format_and_or(and_or))
+                code, output = 0, f"[{job.id}] {job.command}"
+            else:
+                code, output = await self._execute_logical_async(and_or)
+            if output:
+                outputs.append(output)
+        
+        return (code, '\n'.join(outputs))
+    
+    def _execute_pipeline(self, pipeline: Pipeline) -> Tuple[int, str]:
+        """Execute one pipeline, taking the fast path for plain commands"""
+        commands = pipeline.commands
+        if len(commands) == 1 and not commands[0].redirects:
+            return self._execute_simple(list(commands[0].argv))
+        return self._execute_pipe(commands)
+    
+    async def _execute_pipeline_async(self, pipeline: Pipeline) -> Tuple[int, str]:
+        """Await async commands on the loop, run the rest on the executor"""
+        commands = pipeline.commands
+        if len(commands) == 1 and not commands[0].redirects and not self.dryrun_mode:
+            cmd, *args = commands[0].argv
+            func = self.commands.get(cmd)
+            if func is not None and is_async(func):
+                if self.trace_mode:
+                    print(f"[TRACE] 📍 Executing: {cmd} {' '.join(args)}")
+                start = time.perf_counter_ns()
+                try:
+                    result = self._command_result(await func(args, self))
+                except CommandCancelled as e:
+                    result = (130, f"❌ {e}")
+                except Exception as e:
+                    self.last_error = str(e)
+                    result = (1, f"❌ {e}")
+                self.perf.record(cmd, time.perf_counter_ns() - start, len(result[1]))
+                return result
+        
+        import asyncio      # slow to import, so only async paths load it
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute_pipeline, pipeline)
     
     def _execute_simple(self, tokens: List[str]) -> Tuple[int, str]:
         """Execute simple command"""
@@ -194,93 +551,179 @@ class ShellCore:
         if self.trace_mode:
             print(f"[TRACE] 📍 Executing: {cmd} {' '.join(args)}")
         
+        start = time.perf_counter_ns()
         try:
-            result = self.commands[cmd](args, self)
-            if isinstance(result, tuple):
-                return result
-            return (0, str(result))
+            result = self._command_result(run_sync(self.commands[cmd](args, self)))
         except Exception as e:
             self.last_error = str(e)
+            result = (1, f"❌ {e}")
+        self.perf.record(cmd, time.perf_counter_ns() - start, len(result[1]))
+        return result
+    
+    def _command_result(self, result: Any) -> Tuple[int, str]:
+        """Normalize a command's return value to (code, text).
+        
+        A line stream that fails part-way keeps the lines it already
+        produced, followed by its error.
+        """
+        if isinstance(result, tuple):
+            code, output = result
+            if not isinstance(output, str):
+                lines = []
+                try:
+                    lines.extend(iter_lines(output))
+                except StageError as e:
+                    code = e.code
+                    if e.output:
+                        lines.append(e.output)
+                except CommandCancelled as e:
+                    code = 130
+                    lines.append(f"❌ {e}")
+                except Exception as e:
+                    code = 1
+                    self.last_error = str(e)
+                    lines.append(f"❌ {e}")
+                output = '\n'.join(lines)
+            return (code, output)
+        return (0, str(result))
+    
+    def _execute_pipe(self, commands: Sequence[Command]) -> Tuple[int, str]:
+        """Execute piped commands as a chain of lazy line streams.
+        
+        With pipe_concurrency on, stages run concurrently on a thread pool
+        linked by bounded queues (see core/pipeline.py).
+        """
+        stages = self._pipe_stages(commands)
+        if isinstance(stages, tuple):
+            return stages
+        chain = self.pipe_chain
+        
+        start_time = time.perf_counter_ns()
+        pipeline = None
+        output = ""
+        try:
+            pipeline = open_pipeline(stages, concurrent=self.pipe_concurrency)
+            # Only the last stage is drained; upstream stages produce on demand
+            output = '\n'.join(pipeline.output)
+            chain[-1]['status'] = 'done'
+        except StageError as e:
+            chain[-1]['status'] = 'error'
+            return (e.code, e.output)
+        except CommandCancelled as e:
+            chain[-1]['status'] = 'cancelled'
+            return (130, f"❌ {e}")
+        except Exception as e:
+            chain[-1]['status'] = 'error'
             return (1, f"❌ {e}")
+        finally:
+            if pipeline is not None:
+                pipeline.close()
+            elapsed_ns = time.perf_counter_ns() - start_time
+            chain[-1]['elapsed'] = elapsed_ns / 1e9
+            self.perf.record(' | '.join(stats['command'] for stats in chain),
+                             elapsed_ns, len(output))
+        
+        self.last_output = output
+        return (0, output)
     
-    def _execute_pipe(self, tokens: List[str]) -> Tuple[int, str]:
-        """Execute piped commands"""
-        pipes = []
-        current = []
-        
-        for token in tokens:
-            if token == '|':
-                if current: 
-                    pipes.append(current)
-                    current = []
-            else:
-                current. append(token)
-        
-        if current:
-            pipes.append(current)
+    def _pipe_stages(self, commands: Sequence[Command]):
+        """Build (opener, stats) stages and a fresh pipe_chain; (127, msg) if a command is unknown"""
+        chain = self.pipe_chain = []
+        stages = []
+        for command in commands:
+            cmd = command.argv[0]
+            if cmd not in self.commands:
+                return (127, f"❌ {cmd}: {self.i18n.t('command_not_found')}")
+            
+            stats = {'command': cmd, 'args': list(command.argv[1:]), 'output_lines': 0}
+            chain.append(stats)
+            stages.append((partial(self._open_stage, command, stats), stats))
+        return stages
+    
+    def _open_stage(self, command: Command, stats: Dict[str, Any],
+                    stdin: Optional[Iterator[str]]) -> Iterator[str]:
+        """Start one pipe stage and return its output stream"""
+        for redirect in command.redirects:
+            if redirect.op == '<':
+                path = self.resolve_path(redirect.target)
+                if not path.is_file():
+                    raise StageError(1, f"❌ {self.i18n.t('no_file')}: {redirect.target}")
+                stdin = iter_file_lines(path)
+        
+        code, output = call_stage(self.commands[command.argv[0]],
+                                  list(command.argv[1:]), self, stdin)
+        if code != 0:
+            raise StageError(*self._command_result((code, output)))
+        if isinstance(output, PagedOutput):
+            stats['paged'] = output
+        
+        stream = count_lines(iter_lines(output), stats, self.cancel_event)
+        for redirect in command.redirects:
+            if redirect.op in ('>', '>>'):
+                self._write_redirect(redirect, stream)
+                stream = iter(())
+        return stream
+    
+    def _write_redirect(self, redirect: Redirect, lines: Iterator[str]):
+        """Write a stage's output stream to a '>' or '>>' target"""
+        path = self.resolve_path(redirect.target)
+        mode = 'a' if redirect.op == '>>' else 'w'
+        with open(path, mode) as f:
+            for line in lines:
+                f.write(line)
+                f.write('\n')
+    
+    def _execute_logical(self, and_or: AndOr) -> Tuple[int, str]:
+        """Execute with && and || operators"""
+        code, output = self._execute_pipeline(and_or.pipelines[0])
+        if not and_or.operators:
+            return (code, output)
         
-        input_data = ""
-        for pipe in pipes:
-            if not pipe:
+        outputs = [output] if output else []
+        for operator, pipeline in zip(and_or.operators, and_or.pipelines[1:]):
+            if (operator == '&&') != (code == 0):
                 continue
-            
-            cmd = pipe[0]
-            args = list(pipe[1:])
-            
-            if cmd not in self. commands:
-                return (127, f"❌ {cmd}: {self.i18n. t('command_not_found')}")
-            
-            try:
-                if input_data:
-                    args.append(f"--stdin={input_data}")
-                
-                result = self.commands[cmd](args, self)
-                input_data = str(result[1] if isinstance(result, tuple) else result)
-                
-                self.pipe_chain.append({
-                    'command': cmd,
-                    'args': args[: len(pipe)-1],
-                    'output_lines': len(input_data.split('\n'))
-                })
-            except Exception as e:
-                return (1, f"❌ {e}")
+            code, output = self._execute_pipeline(pipeline)
+            if output:
+                outputs.append(output)
         
-        self.last_output = input_data
-        return (0, input_data)
+        return (code, '\n'.join(outputs))
     
-    def _execute_logical(self, tokens: List[str]) -> Tuple[int, str]:
-        """Execute with && and || operators"""
-        result_code = 0
-        result_output = ""
-        
-        i = 0
-        while i < len(tokens):
-            cmd_tokens = []
-            while i < len(tokens) and tokens[i] not in ('&&', '||'):
-                cmd_tokens.append(tokens[i])
-                i += 1
-            
-            if cmd_tokens: 
-                code, output = self._execute_simple(cmd_tokens)
-                result_output += output
-                result_code = code
-            
-            if i < len(tokens):
-                operator = tokens[i]
-                i += 1
-                
-                if operator == '&&' and result_code != 0:
-                    break
-                elif operator == '||' and result_code == 0:
-                    break
+    async def _execute_logical_async(self, and_or: AndOr) -> Tuple[int, str]:
+        """Async counterpart of _execute_logical()"""
+        code, output = await self._execute_pipeline_async(and_or.pipelines[0])
+        if not and_or.operators:
+            return (code, output)
+        
+        outputs = [output] if output else []
+        for operator, pipeline in zip(and_or.operators, and_or.pipelines[1:]):
+            if (operator == '&&') != (code == 0):
+                continue
+            code, output = await self._execute_pipeline_async(pipeline)
+            if output:
+                outputs.append(output)
         
-        return (result_code, result_output)
+        return (code, '\n'.join(outputs))
+    
+    def shutdown(self):
+        """Fire on_exit hooks, stop jobs and the hook thread, close history"""
+        if self.hooks.on_exit:
+            self.hooks.emit('on_exit', self)
+        self.jobs.shutdown()
+        from .grep import shutdown_pool
+        shutdown_pool()
+        self.hooks.close()
+        self.history.close()
     
     def reload_commands(self):
         """Hot-reload commands"""
+        if self.parent is not None:
+            return self.parent.reload_commands()    # sessions share the root's commands
         self.commands. clear()
+        self.registry.mark_stale()
         self.load_builtin_commands()
         self.load_custom_commands()
+        self.completer.rebuild()
         return (0, "✅ Commands reloaded successfully")
     
     def save_session(self, filename: str = "session.json"):
@@ -288,13 +731,13 @@ class ShellCore:
         session_data = {
             'timestamp': datetime.now().isoformat(),
             'language': self.i18n.language,
-            'history': self.history[-50:],
+            'history': self.history.tail(50),
             'cwd': str(self.cwd),
             'theme': self.current_theme,
         }
         
         try:
-            session_file = Path(filename)
+            session_file = self.resolve_path(filename)
             with open(session_file, 'w') as f:
                 json.dump(session_data, f, indent=2)
             return (0, f"✅ {self.i18n.t('session_saved')}")
@@ -303,7 +746,7 @@ class ShellCore:
     
     def load_session(self, filename: str = "session.json"):
         """Load session"""
-        session_file = Path(filename)
+        session_file = self.resolve_path(filename)
         if not session_file.exists():
             return (1, f"❌ {self.i18n.t('no_file')}")
         
@@ -311,8 +754,9 @@ class ShellCore:
             with open(session_file, 'r') as f:
                 session_data = json.load(f)
             
-            self.history = session_data.get('history', [])
-            self.cwd = Path(session_data.get('cwd', '.'))
+            self.history.merge(session_data.get('history', []))
+            self.history_index = len(self.history) - 1
+            self.chdir(self.resolve_path(session_data.get('cwd', '.')))
             self.current_theme = session_data. get('theme', 'dos')
             
             return (0, f"✅ {self. i18n.t('session_loaded')}")
@@ -341,7 +785,10 @@ class ShellCore:
             cmd = step['command']
             lines = step['output_lines']
             arrow = "→" if i < len(self. pipe_chain) - 1 else ""
-            output += f"│ [{cmd}] {arrow} ({lines} lines)\n"
+            timing = ""
+            if 'elapsed' in step:
+                timing = f", {step['elapsed'] * 1000:.1f} ms, {step.get('status', 'pending')}"
+            output += f"│ [{cmd}] {arrow} ({lines} lines{timing})\n"
         
         output += "│\n└────────────────────────────────────┘\n"
         
@@ -65,12 +65,17 @@ def main():
             commands_path=PROJECT_ROOT / "commands",
             plugins_path=PROJECT_ROOT / "plugins",
             sandbox_enabled=True,
-            i18n=i18n
+            i18n=i18n,
+            history_file=PROJECT_ROOT / ".history",
+            index_file=PROJECT_ROOT / ".index.db"
         )
         
         # Launch GUI
         window = GUITerminalWindow(shell=shell, i18n=i18n)
-        window.run()
+        try:
+            window.run()
+        finally:
+            shell.shutdown()
         
     except KeyboardInterrupt:
         print("\n\nGoodbye!")
@@ -3,6 +3,8 @@
 Test plugin showing how to extend nextgen-bash
 """
 
+from core.hooks import deferred
+
 
 def initialize(shell):
     """Initialize plugin
@@ -20,8 +22,9 @@ def on_command_execute(shell, cmd_str):
     pass
 
 
+@deferred
 def on_command_complete(shell, cmd_str, code, output):
-    """Hook: after command execution"""
+    """Hook: after command execution (deferred: runs on the hook thread)"""
     pass
 
 
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+ANSI escape rendering for the GUI output area
+SGR sequences become Tk tag ranges; other escape sequences are dropped
+"""
+
+import re
+import tkinter.font as tkfont
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+Color = Union[int, str, None]      # palette index, '#rrggbb', or the widget default
+
+# CSI (ESC [ params final), OSC (ESC ] ... BEL/ST) and two-byte escapes
+_ESCAPE = re.compile(r'\x1b(?:\[([0-9;:?<=>]*)[ -/]*([@-~])|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])')
+# An escape cut off at the end of a chunk; kept for the next one
+_PARTIAL = re.compile(r'\x1b(?:\[[0-9;:?<=>]*[ -/]*|\][^\x07\x1b]*)?$')
+
+PALETTE = (
+    '#000000', '#CD3131', '#0DBC79', '#E5E510', '#2472C8', '#BC3FBC', '#11A8CD', '#E5E5E5',
+    '#666666', '#F14C4C', '#23D18B', '#F5F543', '#3B8EEA', '#D670D6', '#29B8DB', '#FFFFFF',
+)
+DEFAULT_FG = '#808080'
+DEFAULT_BG = '#000000'
+
+
+def palette_color(color: Color) -> str:
+    """'#rrggbb' for a palette index (xterm 256-color layout) or hex string"""
+    if isinstance(color, str):
+        return color
+    if color < 16:
+        return PALETTE[color]
+    if color < 232:
+        color -= 16
+        levels = [0, 95, 135, 175, 215, 255]
+        r, g, b = levels[color // 36], levels[color // 6 % 6], levels[color % 6]
+        return f'#{r:02X}{g:02X}{b:02X}'
+    gray = 8 + 10 * (color - 232)
+    return f'#{gray:02X}{gray:02X}{gray:02X}'
+
+
+class Style(NamedTuple):
+    fg: Color = None
+    bg: Color = None
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    inverse: bool = False
+
+
+PLAIN = Style()
+
+
+def _extended_color(params: List[int], i: int) -> Tuple[Color, int]:
+    """38/48 ;5;n or ;2;r;g;b starting at params[i]; returns (color, next index)"""
+    if i + 1 < len(params) and params[i] == 5:
+        return params[i + 1] & 0xFF, i + 2
+    if i + 3 < len(params) and params[i] == 2:
+        r, g, b = (min(255, v) for v in params[i + 1:i + 4])
+        return f'#{r:02X}{g:02X}{b:02X}', i + 4
+    return None, len(params)
+
+
+def apply_sgr(style: Style, params: List[int]) -> Style:
+    """Style after one SGR ('ESC [ ... m') sequence"""
+    fg, bg, bold, italic, underline, inverse = style
+    i = 0
+    while i < len(params):
+        code = params[i]
+        i += 1
+        if code == 0:
+            fg, bg, bold, italic, underline, inverse = PLAIN
+        elif code == 1:
+            bold = True
+        elif code == 3:
+            italic = True
+        elif code == 4:
+            underline = True
+        elif code == 7:
+            inverse = True
+        elif code == 22:
+            bold = False
+        elif code == 23:
+            italic = False
+        elif code == 24:
+            underline = False
+        elif code == 27:
+            inverse = False
+        elif 30 <= code <= 37:
+            fg = code - 30
+        elif 90 <= code <= 97:
+            fg = code - 82
+        elif code == 39:
+            fg = None
+        elif 40 <= code <= 47:
+            bg = code - 40
+        elif 100 <= code <= 107:
+            bg = code - 92
+        elif code == 49:
+            bg = None
+        elif code == 38:
+            fg, i = _extended_color(params, i)
+        elif code == 48:
+            bg, i = _extended_color(params, i)
+    return Style(fg, bg, bold, italic, underline, inverse)
+
+
+class AnsiParser:
+    """Incremental escape-sequence parser.
+
+    feed() splits text into (text, Style) spans in one regex split.  The
+    current style carries over between calls, and an escape sequence cut
+    off at the end of a chunk is completed by the next one.
+    """
+
+    def __init__(self):
+        self.style = PLAIN
+        self._tail = ''
+
+    def reset(self):
+        self.style = PLAIN
+        self._tail = ''
+
+    @property
+    def plain(self) -> bool:
+        """True when text without escapes can bypass the parser"""
+        return self.style is PLAIN and not self._tail
+
+    def feed(self, text: str) -> List[Tuple[str, Style]]:
+        if self._tail:
+            text, self._tail = self._tail + text, ''
+        # split() alternates text with the two groups of each escape:
+        # [text, params, final, text, params, final, ..., text]
+        parts = _ESCAPE.split(text)
+        rest = parts[-1]
+        if '\x1b' in rest:
+            cut = _PARTIAL.search(rest)
+            if cut is not None:
+                self._tail = rest[cut.start():]
+                parts[-1] = rest[:cut.start()]
+
+        spans: List[Tuple[str, Style]] = []
+        style = self.style
+        run: List[str] = [parts[0]]     # text since the last style change
+        cached = _sgr_cache.get
+        for params, final, text in zip(parts[1::3], parts[2::3], parts[3::3]):
+            if final == 'm':
+                new = cached((style, params)) or _sgr(style, params)
+                if new != style:
+                    chunk = ''.join(run)
+                    if chunk:
+                        spans.append((chunk, style))
+                    run = []
+                    style = new
+            run.append(text)
+        chunk = ''.join(run)
+        if chunk:
+            spans.append((chunk, style))
+        self.style = style
+        return spans
+
+
+_sgr_cache: Dict[Tuple[Style, str], Style] = {}
+
+
+def _sgr(style: Style, params: str) -> Style:
+    """apply_sgr() for a raw parameter string, memoized (output repeats few styles)"""
+    key = (style, params)
+    new = _sgr_cache.get(key)
+    if new is None:
+        new = apply_sgr(style, [int(p) if p.isdigit() else 0 for p in params.replace(':', ';').split(';')])
+        if new == PLAIN:
+            new = PLAIN         # keep the identity checks in `plain` and AnsiTags cheap
+        if len(_sgr_cache) < 4096:
+            _sgr_cache[key] = new
+    return new
+
+
+class AnsiTags:
+    """Tk tags for ANSI styles, configured once per distinct style"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._tags: Dict[Style, str] = {}
+        self._fonts: Dict[Tuple[bool, bool], tkfont.Font] = {}
+        self._combined: Dict[Tuple[object, Style], object] = {}
+
+    def tag(self, style: Style) -> Optional[str]:
+        """Tag name for a style (None for plain text)"""
+        if style is PLAIN:
+            return None
+        name = self._tags.get(style)
+        if name is None:
+            name = f'ansi{len(self._tags)}'
+            self.widget.tag_config(name, **self._options(style))
+            self._tags[style] = name
+        return name
+
+    def _options(self, style: Style) -> dict:
+        fg, bg = style.fg, style.bg
+        if style.bold and isinstance(fg, int) and fg < 8:
+            fg += 8                 # bold shows as the bright color, like most terminals
+        fg = palette_color(fg) if fg is not None else None
+        bg = palette_color(bg) if bg is not None else None
+        if style.inverse:
+            fg, bg = bg or DEFAULT_BG, fg or DEFAULT_FG
+        options = {}
+        if fg:
+            options['foreground'] = fg
+        if bg:
+            options['background'] = bg
+        if style.underline:
+            options['underline'] = True
+        if style.bold or style.italic:
+            options['font'] = self._font(style.bold, style.italic)
+        return options
+
+    def _font(self, bold: bool, italic: bool) -> tkfont.Font:
+        key = (bold, italic)
+        if key not in self._fonts:
+            font = tkfont.Font(font=self.widget.cget('font'))
+            font.configure(weight='bold' if bold else 'normal', slant='italic' if italic else 'roman')
+            self._fonts[key] = font
+        return self._fonts[key]
+
+    def set_font(self, font):
+        """Follow the widget's font (size changes)"""
+        base = tkfont.Font(font=font).actual()
+        for font_obj in self._fonts.values():
+            font_obj.configure(family=base['family'], size=base['size'])
+
+    def spans(self, parser: AnsiParser, text: str, tag) -> List[Tuple[str, object]]:
+        """(text, tags) pairs for Text.insert, `tag` first on every span"""
+        combined = self._combined
+        result = []
+        for span, style in parser.feed(text):
+            tags = combined.get((tag, style))
+            if tags is None:
+                name = self.tag(style)
+                tags = combined[(tag, style)] = (tag, name) if name else tag
+            result.append((span, tags))
+        return result
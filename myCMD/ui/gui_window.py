@@ -5,28 +5,73 @@ Clean black background with gray Helvetica text
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import filedialog, messagebox
 import sys
 import os
+import queue
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
+from core.completion import common_prefix
+from core.output import Pager, PagedOutput
+from ui.scrollback import FRAME_MS, SCROLLBACK_LINES, OutputBuffer, Scrollback
 
-class GUITerminalWindow:   
+DRAIN_BUDGET = 0.008            # seconds per frame spent taking worker output
+COMPLETION_LIST = 200           # candidates printed when Tab is ambiguous
+
+
+class TerminalTab:
+    """One tab: a shell session, its output area and its running command"""
+    
+    def __init__(self, shell, output_text: tk.Text, scrollback_lines: int):
+        self.shell = shell
+        self.output_text = output_text
+        self.scrollback = Scrollback(output_text, scrollback_lines)
+        self.label = None
+        
+        # Commands run on a worker thread; its output is drained with after()
+        self.stream_queue = OutputBuffer(cancel=shell.cancel_event)
+        self.stream_thread = None
+        self.pending = deque()          # commands typed while one was running
+        self.started_at = 0.0
+        self.cancelled = False
+        
+        # Pager ('less'): only the current page is rendered, below a mark
+        self.pager = None
+        self.pager_busy = False
+        self.pager_quit = False
+        
+        # History index
+        self.history_index = -1
+    
+    @property
+    def title(self) -> str:
+        name = self.shell.cwd.name or str(self.shell.cwd)
+        return f"● {name}" if self.stream_thread is not None else name
+
+
+class GUITerminalWindow:
     """Simple terminal window - macOS Console.app style"""
     
-    def __init__(self, shell=None, i18n=None):
+    def __init__(self, shell=None, i18n=None, scrollback_lines: int = SCROLLBACK_LINES):
         self.shell = shell
         self.i18n = i18n or self._default_i18n()
         self.running = True
         self.font_size = 12
         self.is_fullscreen = False
+        self.scrollback_lines = scrollback_lines
         
         # Create main window
         self.root = tk.Tk()
         self.root.title("Terminal")
         self.root.geometry("1000x700")
         self.root.configure(bg='#000000')
+        if shell is not None:
+            shell.ui_thread = threading.get_ident()    # 'tail -f' must never run here
         
         # Bind keyboard shortcuts
         self. root.bind('<F11>', lambda e: self._toggle_fullscreen())
@@ -35,12 +80,34 @@ class GUITerminalWindow:
         self.root.bind('<Control-plus>', lambda e: self._increase_font())
         self.root.bind('<Control-minus>', lambda e: self._decrease_font())
         self.root.bind('<Control-0>', lambda e: self._reset_font())
+        self.root.bind('<Control-c>', self._on_interrupt)
+        self.root.bind('<Control-f>', self._open_search)
+        self.root.bind('<F3>', lambda e: self._search(1))
+        self.root.bind('<Shift-F3>', lambda e: self._search(-1))
+        self.root.bind('<Control-t>', self._new_tab)
+        self.root.bind('<Control-w>', self._close_tab)
+        self.root.bind('<Control-Tab>', lambda e: self._cycle_tab(1))
+        try:
+            self.root.bind('<Control-ISO_Left_Tab>', lambda e: self._cycle_tab(-1))    # X11
+        except tk.TclError:
+            self.root.bind('<Control-Shift-Tab>', lambda e: self._cycle_tab(-1))
+        
+        # Tabs share the shell's loaded commands; each has its own session
+        self.tabs = []
+        self.tab = None
+        
+        # Search (Ctrl+F): matches are (line, column) in the scrollback index
+        self.search_match = None
+        self.search_anchor = (0, 0)
+        self.search_query = ""
+        self.search_idle = None
         
         # Setup UI
         self._setup_ui()
+        self._add_tab(self.shell)
         self._print_banner()
         self. input_field. focus()
-        
+    
     def _default_i18n(self):
         """Fallback i18n"""
         from core.i18n import I18n
@@ -52,33 +119,60 @@ class GUITerminalWindow:
         main_frame = tk.Frame(self.root, bg='#000000')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
         
-        # Output text area - pure black background
-        self.output_text = tk.Text(
-            main_frame,
+        # Tab bar
+        self.tab_bar = tk.Frame(main_frame, bg='#000000')
+        self.tab_bar.pack(fill=tk.X, padx=15, pady=(8, 0))
+        self.new_tab_label = tk.Label(
+            self.tab_bar,
+            text=" + ",
+            bg='#000000',
+            fg='#808080',
+            font=('Helvetica', self.font_size)
+        )
+        self.new_tab_label.pack(side=tk.LEFT)
+        self.new_tab_label.bind('<Button-1>', self._new_tab)
+        
+        # Output area: holds the text widget of the current tab
+        self.output_area = tk.Frame(main_frame, bg='#000000')
+        self.output_area.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        
+        # Search bar (Ctrl+F), shown above the input
+        self.search_frame = tk.Frame(main_frame, bg='#000000')
+        tk.Label(
+            self.search_frame,
+            text="Find:",
+            bg='#000000',
+            fg='#6DD5FF',
+            font=('Helvetica', self.font_size)
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        self.search_field = tk.Entry(
+            self.search_frame,
             bg='#000000',
             fg='#808080',
             font=('Helvetica', self.font_size),
-            wrap=tk.WORD,
             relief=tk.FLAT,
             bd=0,
-            padx=15,
-            pady=15,
-            highlightthickness=0,
-            insertbackground='#808080'
+            insertbackground='#808080',
+            highlightthickness=0
         )
-        self.output_text.pack(fill=tk. BOTH, expand=True, padx=0, pady=0)
-        
-        # Configure text tags
-        self.output_text. tag_config('error', foreground='#FF6B6B')
-        self.output_text. tag_config('success', foreground='#808080')
-        self.output_text.tag_config('warning', foreground='#FFD93D')
-        self.output_text.tag_config('info', foreground='#6DD5FF')
-        self.output_text.tag_config('input', foreground='#808080')
-        self.output_text.tag_config('prompt', foreground='#808080')
+        self.search_field.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.search_status = tk.Label(
+            self.search_frame,
+            text="",
+            bg='#000000',
+            fg='#6DD5FF',
+            font=('Helvetica', self.font_size)
+        )
+        self.search_status.pack(side=tk.RIGHT, padx=(5, 0))
+        self.search_field.bind('<KeyRelease>', self._on_search_key)
+        self.search_field.bind('<Return>', lambda e: self._search(1))
+        self.search_field.bind('<Shift-Return>', lambda e: self._search(-1))
+        self.search_field.bind('<Escape>', self._close_search)
         
         # Input frame
         input_frame = tk.Frame(main_frame, bg='#000000')
         input_frame.pack(fill=tk.X, padx=15, pady=15)
+        self.input_frame = input_frame
         
         # Prompt
         prompt_label = tk.Label(
@@ -90,6 +184,16 @@ class GUITerminalWindow:
         )
         prompt_label.pack(side=tk.LEFT, padx=(0, 5))
         
+        # Running indicator
+        self.status_label = tk.Label(
+            input_frame,
+            text="",
+            bg='#000000',
+            fg='#FFD93D',
+            font=('Helvetica', self.font_size)
+        )
+        self.status_label.pack(side=tk.RIGHT, padx=(5, 0))
+        
         # Input field
         self.input_field = tk.Entry(
             input_frame,
@@ -105,15 +209,120 @@ class GUITerminalWindow:
         self.input_field.bind('<Return>', self._on_input)
         self.input_field.bind('<Up>', self._on_history_up)
         self.input_field.bind('<Down>', self._on_history_down)
+        self.input_field.bind('<Tab>', self._on_tab)
+        self.input_field.bind('<Control-Tab>', lambda e: self._cycle_tab(1))
+        self.input_field.bind('<Next>', lambda e: self._pager_key(''))
+        self.input_field.bind('<Prior>', lambda e: self._pager_key('b'))
+    
+    def _create_output_text(self) -> tk.Text:
+        """Output text area of a tab - pure black background"""
+        output_text = tk.Text(
+            self.output_area,
+            bg='#000000',
+            fg='#808080',
+            font=('Helvetica', self.font_size),
+            wrap=tk.WORD,
+            relief=tk.FLAT,
+            bd=0,
+            padx=15,
+            pady=15,
+            highlightthickness=0,
+            insertbackground='#808080',
+            state=tk.DISABLED
+        )
         
-        # History index
-        self.history_index = -1
+        # Configure text tags
+        output_text. tag_config('error', foreground='#FF6B6B')
+        output_text. tag_config('success', foreground='#808080')
+        output_text.tag_config('warning', foreground='#FFD93D')
+        output_text.tag_config('info', foreground='#6DD5FF')
+        output_text.tag_config('input', foreground='#808080')
+        output_text.tag_config('prompt', foreground='#808080')
+        output_text.tag_config('search', background='#5C4B00')
+        output_text.tag_config('search_current', background='#FFD93D', foreground='#000000')
+        return output_text
+    
+    # ----- tabs -----
+    
+    def _add_tab(self, shell) -> TerminalTab:
+        output_text = self._create_output_text()
+        tab = TerminalTab(shell, output_text, self.scrollback_lines)
+        output_text.config(yscrollcommand=lambda *args: self._on_view_change(tab))
+        tab.label = tk.Label(
+            self.tab_bar,
+            text=tab.title,
+            bg='#000000',
+            fg='#808080',
+            font=('Helvetica', self.font_size),
+            padx=10
+        )
+        tab.label.pack(side=tk.LEFT, before=self.new_tab_label)
+        tab.label.bind('<Button-1>', lambda e: self._select_tab(tab))
+        tab.label.bind('<Button-2>', lambda e: self._close_tab(tab=tab))
+        self.tabs.append(tab)
+        self._select_tab(tab)
+        return tab
+    
+    def _new_tab(self, event=None):
+        """Ctrl+T: open a session on the same commands, starting in this tab's directory"""
+        start = time.perf_counter()
+        session = self.tab.shell.new_session()
+        tab = self._add_tab(session)
+        elapsed = (time.perf_counter() - start) * 1000
+        self._write_output(f"New session in {session.cwd} ({elapsed:.1f} ms)", 'info', tab)
+        return 'break'
+    
+    def _select_tab(self, tab: TerminalTab):
+        if self.tab is not None and self.tab is not tab:
+            self._close_search()
+            self.tab.output_text.pack_forget()
+        self.tab = tab
+        tab.output_text.pack(fill=tk. BOTH, expand=True, padx=0, pady=0)
+        self._update_tab_labels()
+        self._update_prompt()
+        self._show_running()
+        self.input_field.focus()
+    
+    def _cycle_tab(self, step: int):
+        """Ctrl+Tab / Ctrl+Shift+Tab"""
+        i = self.tabs.index(self.tab)
+        self._select_tab(self.tabs[(i + step) % len(self.tabs)])
+        return 'break'
+    
+    def _close_tab(self, event=None, tab=None):
+        """Ctrl+W: stop the tab's command and release its session"""
+        tab = tab or self.tab
+        if len(self.tabs) == 1:
+            self.root.bell()
+            return 'break'
+        tab.pending.clear()
+        tab.shell.cancel_event.set()
+        tab.stream_queue.close()        # nothing drains it from now on
+        if tab.pager is not None:
+            # A busy pager's output is still being read on its thread; _pager_poll closes it
+            if not tab.pager_busy:
+                tab.pager.output.close()
+            tab.pager = None
+        i = self.tabs.index(tab)
+        self.tabs.remove(tab)
+        if tab is self.tab:
+            self._select_tab(self.tabs[min(i, len(self.tabs) - 1)])
+        tab.label.destroy()
+        tab.output_text.destroy()
+        if tab.shell is not self.shell:
+            tab.shell.close_session()
+        return 'break'
+    
+    def _update_tab_labels(self):
+        for tab in self.tabs:
+            tab.label.config(text=tab.title, fg='#FFFFFF' if tab is self.tab else '#808080')
     
     def _update_prompt(self):
         """Update window title"""
-        if self.shell:
-            cwd = str(self.shell.cwd).replace(os.path.expanduser('~'), '~')
-            user = self.shell.env.get('USER', 'user')
+        shell = self.tab.shell
+        if shell:
+            cwd = str(shell.cwd).replace(os.path.expanduser('~'), '~')
+            user = shell.env.get('USER', 'user')
             self.root.title(f"{user} — Terminal — {cwd}")
     
     def _print_banner(self):
@@ -126,67 +335,373 @@ class GUITerminalWindow:
         self._write_output(banner, 'info')
         self._update_prompt()
     
-    def _write_output(self, text:  str, tag: str = 'input'):
-        """Write to output text area"""
-        self. output_text.config(state=tk.NORMAL)
-        self.output_text. insert(tk.END, text, tag)
-        if not text.endswith('\n'):
-            self.output_text.insert(tk.END, '\n')
-        self.output_text. see(tk.END)
-        self.output_text.config(state=tk.DISABLED)
+    def _write_output(self, text:  str, tag: str = 'input', tab: TerminalTab = None):
+        """Write to output text area (drawn with the next frame)"""
+        (tab or self.tab).scrollback.write(text, tag)
     
     def _on_input(self, event=None):
         """Handle input"""
+        tab = self.tab
         cmd_input = self.input_field.get().strip()
         self. input_field.delete(0, tk.END)
         
-        if not cmd_input:  
+        if tab.pager is not None:
+            self._pager_key(cmd_input)
+            return
+        
+        if not cmd_input:
+            return
+        
+        tab.history_index = -1
+        if tab.stream_thread is not None:
+            # Typed ahead: runs once the current command finishes
+            tab.pending.append(cmd_input)
+            self._show_running()
+            return
+        
+        self._run_command(tab, cmd_input)
+    
+    def _run_command(self, tab: TerminalTab, cmd_input: str):
+        """Execute a command on a worker thread so the window stays responsive"""
+        self._write_output(f"→ {cmd_input}", 'input', tab)
+        tab.scrollback.reset_style()
+        shell, out = tab.shell, tab.stream_queue
+        
+        def worker():
+            try:
+                code, lines = shell.execute_stream(cmd_input)
+                if isinstance(lines, PagedOutput):
+                    out.put('pager', lines)
+                    return
+                tag = 'success' if code == 0 else 'error'
+                out.put('tag', tag)
+                for line in lines:
+                    # Errors raised mid-stream arrive as lines once the final code is known
+                    final = shell.last_exit_code
+                    if final is not None and (final == 0) != (tag == 'success'):
+                        tag = 'success' if final == 0 else 'error'
+                        out.put('tag', tag)
+                    out.put('line', line)
+            except Exception as e:
+                out.put('tag', 'error')
+                out.put('line', f"Error: {e}")
+            finally:
+                out.put('done', None)
+        
+        tab.started_at = time.monotonic()
+        tab.cancelled = False
+        tab.stream_thread = threading.Thread(target=worker, name='command', daemon=True)
+        tab.stream_thread.start()
+        self._update_tab_labels()
+        self._show_running()
+        self.root.after(FRAME_MS, self._drain_stream, tab, 'success')
+    
+    def _drain_stream(self, tab: TerminalTab, tag: str):
+        """Once per frame: move the worker's output into the text widget"""
+        if tab not in self.tabs:
             return
+        batch = []
+        finished = False
+        for kind, value in tab.stream_queue.take(DRAIN_BUDGET):
+            if kind == 'line':
+                batch.append(value)
+                continue
+            if batch:
+                self._write_output('\n'.join(batch), tag, tab)
+                batch = []
+            if kind == 'tag':
+                tag = value
+            elif kind == 'pager':
+                self._start_pager(tab, value)
+            else:
+                finished = True
+        
+        if batch:
+            self._write_output('\n'.join(batch), tag, tab)
+        tab.scrollback.flush()
+        
+        if finished:
+            tab.stream_thread = None
+            if tab.pager is None:
+                self._finish_command(tab)
+            else:
+                self._show_running()
+        else:
+            self._show_running()
+            self.root.after(FRAME_MS, self._drain_stream, tab, tag)
+    
+    def _show_running(self):
+        """Running indicator next to the input field (for the current tab)"""
+        tab = self.tab
+        if tab.stream_thread is None or tab.pager is not None:
+            text = f"{len(tab.pending)} queued" if tab.pending else ""
+        else:
+            state = "stopping" if tab.cancelled else "running"
+            text = f"● {state} {time.monotonic() - tab.started_at:.1f}s"
+            if tab.pending:
+                text += f" · {len(tab.pending)} queued"
+        if self.status_label.cget('text') != text:
+            self.status_label.config(text=text)
+    
+    def _page_lines(self, tab: TerminalTab) -> int:
+        """Lines that fit in the output area"""
+        self.root.update_idletasks()
+        output_text = tab.output_text
+        linespace = tkfont.Font(font=output_text.cget('font')).metrics('linespace')
+        height = self.output_area.winfo_height() - 2 * int(output_text.cget('pady'))
+        return max(5, height // max(1, linespace) - 2)
+    
+    def _start_pager(self, tab: TerminalTab, output: PagedOutput):
+        """Enter pager mode; input lines become pager keys until 'q'"""
+        tab.pager = Pager(output, self._page_lines(tab))
+        tab.pager_quit = False
+        tab.scrollback.begin_region()
+        self._pager_run(tab, None)
+    
+    def _pager_key(self, key: str):
+        """Handle a pager key typed in the input field"""
+        tab = self.tab
+        if tab.pager is None:
+            return None
+        if tab.pager_busy:
+            if key in ('q', 'Q'):
+                # Still waiting for output (e.g. 'tail -f | less'): stop the producer
+                tab.pager_quit = True
+                tab.shell.cancel_event.set()
+            return 'break'
+        self._pager_run(tab, key)
+        return 'break'
+    
+    def _pager_run(self, tab: TerminalTab, key):
+        """Apply a key and read the page on a thread; producers may be slow"""
+        pager = tab.pager
+        result: queue.Queue = queue.Queue()
         
-        self._write_output(f"→ {cmd_input}", 'input')
+        def work():
+            try:
+                keep = key is None or pager.handle(key)
+                result.put((keep, pager.page() if keep else [], pager.status()))
+            except Exception as e:
+                result.put((False, [f"❌ {e}"], ""))
         
+        tab.pager_busy = True
+        threading.Thread(target=work, name='pager', daemon=True).start()
+        self.root.after(20, self._pager_poll, tab, pager, result)
+    
+    def _pager_poll(self, tab: TerminalTab, pager: Pager, result: queue.Queue):
         try:
-            code, output = self.shell.execute(cmd_input)
-            
-            if output:
-                if code == 0:
-                    self._write_output(output, 'success')
-                else:   
-                    self._write_output(output, 'error')
-            
-            if self.shell.system_map_enabled and self.shell.pipe_chain:    
-                self._write_output(self.shell._visualize_pipe_chain(), 'info')
-            
+            keep, lines, status = result.get_nowait()
+        except queue.Empty:
+            self.root.after(20, self._pager_poll, tab, pager, result)
+            return
+        tab.pager_busy = False
+        if tab.pager is None:
+            pager.output.close()    # the tab was closed while the page loaded
+            return
+        if tab.pager_quit:
+            keep = False
+        
+        if keep or lines:
+            # The page replaces the previous one and is indexed for Ctrl+F
+            tab.scrollback.set_region('\n'.join(lines), 'success', status if keep else "")
+        
+        if keep and tab.pager.output.quit_at_end and tab.pager.at_end():
+            keep = False
+        if not keep:
+            self._stop_pager(tab)
+    
+    def _stop_pager(self, tab: TerminalTab):
+        """Leave pager mode, keeping the last page on screen"""
+        pager, tab.pager = tab.pager, None
+        tab.scrollback.end_region()
+        pager.output.close()
+        self._finish_command(tab)
+    
+    def _finish_command(self, tab: TerminalTab):
+        """Post-command updates: system map, window title, next queued command"""
+        shell = tab.shell
+        if shell.system_map_enabled and shell.pipe_chain:
+            self._write_output(shell._visualize_pipe_chain(), 'info', tab)
+        
+        self._update_tab_labels()
+        if tab is self.tab:
             self._update_prompt()
-            
-        except Exception as e:
-            self._write_output(f"Error: {e}", 'error')
+        if tab.pending:
+            self._run_command(tab, tab.pending.popleft())
+        else:
+            self._show_running()
+    
+    def _on_interrupt(self, event=None):
+        """Ctrl+C: stop the running command"""
+        tab = self.tab
+        if tab.pager is not None:
+            return self._pager_key('q') if tab.pager_busy else (self._stop_pager(tab) or 'break')
+        if tab.stream_thread is None:
+            return None
+        tab.shell.cancel_event.set()
+        tab.cancelled = True
+        self._write_output("^C", 'warning')
+        if tab.pending:
+            self._write_output(f"[INFO] Dropped {len(tab.pending)} queued command(s)", 'info')
+            tab.pending.clear()
+        self._show_running()
+        return 'break'
+    
+    def _open_search(self, event=None):
+        """Ctrl+F: show the search bar, searching down from the top of the view"""
+        tab = self.tab
+        if not self.search_frame.winfo_ismapped():
+            self.search_frame.pack(fill=tk.X, padx=15, pady=(10, 0), before=self.input_frame)
+        tab.scrollback.flush()
+        top = int(tab.output_text.index('@0,0').split('.')[0])
+        self.search_anchor = (tab.scrollback.trimmed + top - 1, 0)
+        self.search_match = None
+        self.search_field.focus()
+        self.search_field.select_range(0, tk.END)
+        self._search(0)
+        return 'break'
+    
+    def _close_search(self, event=None):
+        """Hide the search bar and its highlights"""
+        output_text = self.tab.output_text
+        self.search_frame.pack_forget()
+        output_text.tag_remove('search', '1.0', tk.END)
+        output_text.tag_remove('search_current', '1.0', tk.END)
+        self.search_match = None
+        self.input_field.focus()
+        return 'break'
+    
+    def _on_search_key(self, event=None):
+        """Incremental search: re-run from the anchor when the query changes"""
+        if self.search_field.get() != self.search_query:
+            self._search(0)
+    
+    def _search(self, direction: int):
+        """Find the next (1), previous (-1) or first from the anchor (0) match"""
+        if not self.search_frame.winfo_ismapped():
+            return None
+        scrollback = self.tab.scrollback
+        scrollback.flush()
+        index = scrollback.index
+        query = self.search_query = self.search_field.get()
+        match = self.search_match
+        if direction == 0 or match is None:
+            start = self.search_anchor
+        else:
+            start = (match[0], match[1] + 1) if direction > 0 else match
+        
+        match = index.find(query, start, backward=direction < 0)
+        wrapped = False
+        if match is None and query:
+            match = index.find(query, (0, 0) if direction >= 0 else (index.line_count, 0),
+                               backward=direction < 0)
+            wrapped = match is not None
+        self.search_match = match
+        if direction != 0 and match is not None:
+            self.search_anchor = match      # typing more continues from here
+        
+        text = self.tab.output_text
+        text.tag_remove('search_current', '1.0', tk.END)
+        if not query:
+            status = ""
+        elif match is None:
+            status = "No matches"
+        else:
+            line = scrollback.widget_line(match[0])
+            start_index, end_index = f'{line}.{match[1]}', f'{line}.{match[1] + len(query)}'
+            text.tag_add('search_current', start_index, end_index)
+            text.see(start_index)
+            status = f"{index.count(query, match) + 1} of {index.count(query)}"
+            if wrapped:
+                status += " (wrapped)"
+        self.search_status.config(text=status)
+        self._highlight_visible()
+        return 'break'
+    
+    def _highlight_visible(self):
+        """Mark the matches inside the viewport only"""
+        self.search_idle = None
+        text = self.tab.output_text
+        text.tag_remove('search', '1.0', tk.END)
+        query = self.search_query.lower()
+        if not query or not self.search_frame.winfo_ismapped():
+            return
+        first = int(text.index('@0,0').split('.')[0])
+        last = int(text.index(f'@0,{text.winfo_height()}').split('.')[0])
+        visible = text.get(f'{first}.0', f'{last}.end').lower().split('\n')
+        for line, content in enumerate(visible, first):
+            col = content.find(query)
+            while col >= 0:
+                text.tag_add('search', f'{line}.{col}', f'{line}.{col + len(query)}')
+                col = content.find(query, col + len(query))
+        text.tag_raise('search')
+        text.tag_raise('search_current')
+    
+    def _on_view_change(self, tab: TerminalTab):
+        """yscrollcommand: refresh viewport highlights once the view settles"""
+        if tab is self.tab and (self.search_match is not None or self.search_query):
+            if self.search_idle is None and self.search_frame.winfo_ismapped():
+                self.search_idle = self.root.after_idle(self._highlight_visible)
+    
+    def _on_tab(self, event=None):
+        """Tab: complete the word before the cursor, or list the choices"""
+        tab = self.tab
+        if tab.pager is not None:
+            return 'break'
+        cursor = self.input_field.index(tk.INSERT)
+        line = self.input_field.get()[:cursor]
+        start, candidates = tab.shell.completer.complete(line)
+        if not candidates:
+            self.root.bell()
+            return 'break'
+        
+        word = line[start:]
+        if len(candidates) == 1:
+            completion = candidates[0]
+            if not completion.endswith(os.sep):
+                completion += ' '
+        else:
+            completion = common_prefix(candidates)
+        
+        if len(completion) > len(word):
+            self.input_field.delete(start, cursor)
+            self.input_field.insert(start, completion)
+        elif len(candidates) > 1:
+            shown = [os.path.basename(c.rstrip(os.sep)) + (os.sep if c.endswith(os.sep) else '')
+                     for c in candidates[:COMPLETION_LIST]]
+            more = f"\n... {len(candidates) - len(shown)} more" if len(candidates) > len(shown) else ""
+            self._write_output('  '.join(shown) + more, 'info')
+        return 'break'
     
     def _on_history_up(self, event=None):
         """Navigate history up"""
-        if not self.shell. history:   
+        tab = self.tab
+        history = tab.shell.history
+        if not history:
             return 'break'
         
-        if self.history_index == -1:
-            self.history_index = len(self.shell.history) - 1
+        if tab.history_index == -1:
+            tab.history_index = len(history) - 1
         else:
-            self. history_index = max(0, self.history_index - 1)
+            tab. history_index = max(0, tab.history_index - 1)
         
         self. input_field.delete(0, tk.END)
-        self.input_field.insert(0, self.shell.history[self. history_index])
+        self.input_field.insert(0, history[tab. history_index])
         return 'break'
     
     def _on_history_down(self, event=None):
         """Navigate history down"""
-        if not self.shell.history:
+        tab = self.tab
+        history = tab.shell.history
+        if not history:
             return 'break'
         
-        if self.history_index < len(self.shell.history) - 1:
-            self.history_index += 1
+        if tab.history_index < len(history) - 1:
+            tab.history_index += 1
             self.input_field.delete(0, tk.END)
-            self.input_field.insert(0, self.shell.history[self.history_index])
+            self.input_field.insert(0, history[tab.history_index])
         else:
-            self.history_index = -1
+            tab.history_index = -1
             self.input_field.delete(0, tk.END)
         
         return 'break'
@@ -220,6 +735,13 @@ Ctrl + =        Increase font size
 Ctrl + -        Decrease font size
 Ctrl + 0        Reset font size
 ↑ / ↓           Navigate history
+Tab             Complete commands, subcommands and paths
+Ctrl + C        Stop running command, drop queued ones
+PgDn / PgUp     Page forward / back in less
+Ctrl + F        Search output (Enter/F3 next, Shift+Enter previous, Esc close)
+Ctrl + T        New tab (same directory, own history)
+Ctrl + W        Close tab
+Ctrl + Tab      Next tab (Ctrl+Shift+Tab previous)
 Enter           Execute command
 
 FILE OPERATIONS
@@ -257,7 +779,6 @@ EXAMPLES
 
 Type 'help' in terminal for full command list. 
 """
-        
         help_text.insert(tk.END, help_content)
         help_text.config(state=tk.DISABLED)
     
@@ -289,16 +810,28 @@ Type 'help' in terminal for full command list.
     
     def _update_font_size(self):
         """Update all fonts"""
-        self.output_text.config(font=('Helvetica', self.font_size))
-        self.input_field. config(font=('Helvetica', self.font_size))
+        font = ('Helvetica', self.font_size)
+        for tab in self.tabs:
+            tab.output_text.config(font=font)
+            tab.scrollback.tags.set_font(font)
+            tab.label.config(font=font)
+        self.new_tab_label.config(font=font)
+        self.input_field. config(font=font)
+        self.status_label.config(font=font)
+        self.search_field.config(font=font)
     
     def _on_exit(self):
         """Exit application"""
         if messagebox.askyesno("Quit", "Save session before exit?"):
-            self.shell.save_session()
+            self.tab.shell.save_session()
         self.root.quit()
         self.root.destroy()
     
     def run(self):
         """Run the GUI"""
-        self.root.mainloop()
\ No newline at end of file
+        try:
+            self.root.mainloop()
+        finally:
+            for tab in self.tabs:
+                if tab.shell is not self.shell:
+                    tab.shell.close_session()
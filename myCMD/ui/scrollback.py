@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Scrollback for the GUI output area
+Bounded line store on top of tk.Text, rendered at most once per frame
+"""
+
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from typing import List, Optional, Tuple
+
+from ui.ansi import AnsiParser, AnsiTags
+from ui.search import ScrollbackIndex
+
+SCROLLBACK_LINES = 20000    # lines kept in the output area
+TRIM_SLACK = 0.1            # trim only after the cap is exceeded by this fraction
+FRAME_MS = 16               # pending output is flushed at most once per frame
+
+Span = Tuple[str, object]   # text and its tag (or tuple of tags)
+
+
+class OutputBuffer:
+    """Messages from a command's worker thread to the Tk thread.
+
+    A deque with a soft cap instead of queue.Queue: appends and pops are
+    atomic, which makes a line cost a fraction of a microsecond, and the
+    worker only blocks when the UI falls `limit` messages behind.  Once
+    `cancel` is set it no longer blocks: surplus lines are dropped, but
+    the final message still gets through.  After close() nobody drains
+    it any more, so put() never blocks and the rest is dropped.
+    """
+
+    def __init__(self, limit: int = 50000, cancel: Optional[threading.Event] = None):
+        self.limit = limit
+        self.cancel = cancel
+        self.closed = False
+        self._items = deque()
+        self._room = threading.Event()
+        self._room.set()
+
+    def put(self, kind: str, value=None):
+        items = self._items
+        if len(items) < self.limit:
+            items.append((kind, value))
+            return
+        while len(items) >= self.limit and not self.closed:
+            if self.cancel is not None and self.cancel.is_set():
+                if kind == 'line':
+                    return          # stopping anyway: drop the overflow
+                break
+            self._room.clear()
+            if len(items) >= self.limit:
+                self._room.wait(0.05)
+        if not self.closed:
+            items.append((kind, value))
+
+    def take(self, budget: float) -> List[Tuple[str, object]]:
+        """Messages available now, for at most `budget` seconds of popping"""
+        items = self._items
+        taken = []
+        deadline = time.perf_counter() + budget
+        while items:
+            taken.append(items.popleft())
+            if len(taken) % 1024 == 0 and time.perf_counter() > deadline:
+                break
+        if len(items) <= self.limit:
+            self._room.set()
+        return taken
+
+    def clear(self):
+        self._items.clear()
+        self._room.set()
+
+    def close(self):
+        """Drop everything and release a blocked put() for good (tab closed)"""
+        self.closed = True
+        self.clear()
+
+
+class Scrollback:
+    """Output area content, capped at `max_lines`.
+
+    Writes are queued and inserted by one flush per frame: consecutive
+    chunks with the same tag become one insert, the widget state is
+    toggled once, and the view follows the end only if it was already
+    there.  ANSI colors become tag ranges, so colored text costs the same
+    single insert as plain text.  When a flush alone brings more than
+    `max_lines` lines, the older ones are never inserted.  `trimmed`
+    counts lines removed from the top, so line n of the widget is line
+    `trimmed + n - 1` of `index`, which holds the session's text for search.
+
+    A region (begin_region) is a block at the end whose content is
+    replaced as a whole, such as the page a pager shows, with an optional
+    status line below it that is not indexed.
+    """
+
+    def __init__(self, widget: tk.Text, max_lines: int = SCROLLBACK_LINES):
+        self.widget = widget
+        self.max_lines = max(100, max_lines)
+        self.trimmed = 0
+        self._pending: List[Tuple[List[Span], int]] = []    # (spans, lines) per write
+        self._pending_lines = 0
+        self._scheduled = None
+        self.ansi = AnsiParser()
+        self.tags = AnsiTags(widget)
+        self.index = ScrollbackIndex()
+        self._region = None         # index line where the region starts
+        self._status = False        # a status line follows the region
+
+    def write(self, text: str, tag: str):
+        """Queue text (a newline is added if missing) for the next frame"""
+        if not text.endswith('\n'):
+            text += '\n'
+        if self.ansi.plain and '\x1b' not in text:
+            spans = [(text, tag)]
+        else:
+            spans = self.tags.spans(self.ansi, text, tag)
+        lines = text.count('\n')
+        self._pending.append((spans, lines))
+        self._pending_lines += lines
+        if self._pending_lines > 2 * self.max_lines:
+            self._drop_pending()
+        if self._scheduled is None:
+            self._scheduled = self.widget.after(FRAME_MS, self.flush)
+
+    def reset_style(self):
+        """Drop colors left on by the previous command"""
+        self.ansi.reset()
+
+    def _drop_pending(self):
+        """Keep only the writes that can still be visible after the flush"""
+        keep, lines = [], 0
+        for spans, count in reversed(self._pending):
+            need = self.max_lines - lines
+            if need <= 0:
+                break
+            if count > need:
+                spans, count = _last_lines(spans, need), need
+            keep.append((spans, count))
+            lines += count
+        keep.reverse()
+        self._pending = keep
+        self._pending_lines = lines
+
+    def flush(self):
+        """Insert everything queued so far"""
+        if self._scheduled is not None:
+            self.widget.after_cancel(self._scheduled)
+            self._scheduled = None
+        if not self._pending:
+            return
+        if self._pending_lines > self.max_lines:
+            self._drop_pending()
+        writes, self._pending, self._pending_lines = self._pending, [], 0
+
+        # Text and tags alternate; a write continuing the previous tag is merged into it
+        args = []
+        for spans, _ in writes:
+            for text, tag in spans:
+                if args and args[-1] == tag:
+                    args[-2] += text
+                else:
+                    args += (text, tag)
+
+        widget = self.widget
+        follow = widget.yview()[1] >= 0.999
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, *args)
+        self.index.append(''.join(args[0::2]))
+        self.trim()
+        if follow:
+            widget.see(tk.END)
+        widget.config(state=tk.DISABLED)
+
+    def begin_region(self):
+        """Start a replaceable block at the end of the output"""
+        self.flush()
+        self.widget.mark_set('region', 'end-1c')
+        self.widget.mark_gravity('region', tk.LEFT)
+        self._region = self.index.line_count
+        self._status = False
+
+    def set_region(self, text: str, tag: str, status: str = ""):
+        """Replace the region with `text` (searchable) and a status line"""
+        self.flush()
+        widget = self.widget
+        widget.config(state=tk.NORMAL)
+        widget.delete('region', tk.END)
+        self.index.truncate(self._region)
+        if text:
+            spans = self.tags.spans(AnsiParser(), text + '\n', tag)
+            widget.insert(tk.END, *[item for span in spans for item in span])
+            self.index.append(''.join(span for span, _ in spans))
+        if status:
+            widget.insert(tk.END, status, 'info')
+        self._status = bool(status)
+        self.trim()
+        widget.see(tk.END)
+        widget.config(state=tk.DISABLED)
+
+    def end_region(self):
+        """Keep the region's content as ordinary scrollback, without the status line"""
+        if self._status:
+            self.widget.config(state=tk.NORMAL)
+            self.widget.delete('end-1c linestart', 'end-1c')
+            self.widget.config(state=tk.DISABLED)
+        self._region = None
+        self._status = False
+
+    def widget_line(self, line: int) -> int:
+        """Widget line number of an index line"""
+        return line - self.trimmed + 1
+
+    def line_count(self) -> int:
+        """Complete lines in the widget (output always ends with a newline)"""
+        return int(self.widget.index('end-1c').split('.')[0]) - 1
+
+    def trim(self):
+        """Delete lines above the cap (in steps, so not on every flush)"""
+        lines = self.line_count()
+        if lines > self.max_lines * (1 + TRIM_SLACK):
+            excess = lines - self.max_lines
+            state = self.widget.cget('state')
+            self.widget.config(state=tk.NORMAL)
+            self.widget.delete('1.0', f'{excess + 1}.0')
+            self.widget.config(state=state)
+            self.trimmed += excess
+            self.index.drop_before(self.trimmed)
+
+
+def _last_lines(spans: List[Span], count: int) -> List[Span]:
+    """The trailing `count` lines of a write (spans ending with a newline)"""
+    kept: List[Span] = []
+    for text, tag in reversed(spans):
+        lines = text.count('\n')
+        if lines >= count + 1:
+            text = '\n'.join(text.rsplit('\n', count + 1)[-1 - count:])
+            if text:
+                kept.append((text, tag))
+            break
+        kept.append((text, tag))
+        count -= lines
+    kept.reverse()
+    return kept
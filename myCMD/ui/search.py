@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Scrollback search index
+Lower-cased scrollback text in blocks of lines, searched with str.find
+"""
+
+import bisect
+from typing import List, Optional, Tuple
+
+BLOCK_LINES = 4096          # lines per block; a block is joined once when it fills up
+
+Match = Tuple[int, int]     # (line, column); lines are numbered from 0 for the whole session
+
+
+class _Block:
+    __slots__ = ('first', 'lines', 'parts', '_text')
+
+    def __init__(self, first: int):
+        self.first = first
+        self.lines = 0
+        self.parts: List[str] = []
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = ''.join(self.parts).lower()
+            self.parts = [self._text]
+        return self._text
+
+    def append(self, text: str, lines: int):
+        self.parts.append(text)
+        self.lines += lines
+        self._text = None
+
+    def offset(self, line: int, col: int) -> int:
+        """Character offset of (line, col) inside the block"""
+        text = self.text
+        pos = 0
+        for _ in range(line - self.first):
+            pos = text.index('\n', pos) + 1
+        return pos + col
+
+    def position(self, offset: int) -> Match:
+        text = self.text
+        line_start = text.rfind('\n', 0, offset) + 1
+        return self.first + text.count('\n', 0, line_start), offset - line_start
+
+
+class ScrollbackIndex:
+    """Everything shown in the output area, ready for case-insensitive search.
+
+    Appends cost a list append; a block is lower-cased and joined once,
+    the first time it is searched after it changed.  Searching is a
+    str.find per block, so a million lines take a few hundred
+    milliseconds at worst and usually stop at the first block with a
+    match.  Line numbers never shift: trimming the top only raises
+    `first_line`.
+    """
+
+    def __init__(self, block_lines: int = BLOCK_LINES):
+        self.block_lines = block_lines
+        self.blocks: List[_Block] = [_Block(0)]
+        self.first_line = 0
+        self._total = None          # (query, line_count, first_line, count) of the last full count
+
+    @property
+    def line_count(self) -> int:
+        """Lines appended so far (the next line number)"""
+        last = self.blocks[-1]
+        return last.first + last.lines
+
+    def append(self, text: str):
+        """Add complete lines (text ends with a newline)"""
+        block = self.blocks[-1]
+        if block.lines >= self.block_lines:
+            block = _Block(block.first + block.lines)
+            self.blocks.append(block)
+        block.append(text, text.count('\n'))
+
+    def drop_before(self, line: int):
+        """Forget lines below `line` (trimmed from the widget)"""
+        self.first_line = max(self.first_line, line)
+        while len(self.blocks) > 1 and self.blocks[1].first <= self.first_line:
+            self.blocks.pop(0)
+
+    def truncate(self, line: int):
+        """Forget lines from `line` on (a pager page that is being replaced)"""
+        if line >= self.line_count:
+            return
+        i = self._block_at(line)
+        del self.blocks[i + 1:]
+        block = self.blocks[i]
+        text = block.text[:block.offset(line, 0)] if line > block.first else ''
+        block.parts = [text]
+        block._text = text
+        block.lines = max(0, line - block.first)
+        self._total = None
+
+    def _block_at(self, line: int) -> int:
+        return max(0, bisect.bisect_right([b.first for b in self.blocks], line) - 1)
+
+    def find(self, query: str, start: Match, backward: bool = False) -> Optional[Match]:
+        """First match at or after `start` (before it when backward)"""
+        query = query.lower()
+        if not query or '\n' in query:
+            return None
+        line = max(start[0], self.first_line)
+        col = start[1] if line == start[0] else 0
+        if line >= self.line_count:
+            if not backward:
+                return None
+            line, col = self.line_count, 0
+        i = self._block_at(line)
+        block = self.blocks[i]
+        pos = block.offset(line, col) if line < block.first + block.lines else len(block.text)
+
+        while True:
+            text = block.text
+            hit = text.rfind(query, 0, pos) if backward else text.find(query, pos)
+            if hit >= 0:
+                match = block.position(hit)
+                return match if match[0] >= self.first_line else None
+            i += -1 if backward else 1
+            if not 0 <= i < len(self.blocks):
+                return None
+            block = self.blocks[i]
+            pos = len(block.text) if backward else 0
+
+    def count(self, query: str, upto: Optional[Match] = None) -> int:
+        """Matches in the whole index, or only those before `upto`"""
+        query = query.lower()
+        if not query or '\n' in query:
+            return 0
+        key = (query, self.line_count, self.first_line)
+        if upto is None and self._total is not None and self._total[:3] == key:
+            return self._total[3]
+        total = 0
+        for block in self.blocks:
+            if upto is not None and block.first > upto[0]:
+                break
+            text = block.text
+            stop = len(text)
+            if upto is not None and upto[0] < block.first + block.lines:
+                stop = block.offset(*upto)
+            start = block.offset(self.first_line, 0) if block.first < self.first_line else 0
+            total += text.count(query, start, stop)
+        if upto is None:
+            self._total = key + (total,)
+        return total
@@ -5,9 +5,12 @@
 
 import sys
 import os
+import shutil
 from typing import Optional
 from pathlib import Path
 
+from core.output import Pager, PagedOutput
+
 class TerminalWindow:
     """Main terminal window"""
     
@@ -26,6 +29,7 @@ class TerminalWindow:
     def run(self):
         """Main loop"""
         self._print_banner()
+        self._setup_completion()
         print(f"\n{self.i18n.t('welcome')}\n")
         
         while self.running and self.shell. session_active:
@@ -36,10 +40,18 @@ class TerminalWindow:
                 if not cmd_input:
                     continue
                 
-                code, output = self.shell.execute(cmd_input)
-                
-                if output:
-                    print(output)
+                code, lines = self.shell.execute_stream(cmd_input)
+                if isinstance(lines, PagedOutput):
+                    self._page(lines)
+                    continue
+                try:
+                    for line in lines:
+                        print(line)
+                except KeyboardInterrupt:
+                    self.shell.cancel_event.set()
+                    print("^C")
+                    for line in lines:
+                        print(line)
                 
                 if self.shell.system_map_enabled:
                     print(self.shell._visualize_pipe_chain())
@@ -51,6 +63,51 @@ class TerminalWindow:
             except Exception as e: 
                 print(f"❌ {e}")
     
+    def _setup_completion(self):
+        """Tab completion through readline, where it is available"""
+        try:
+            import readline
+        except ImportError:
+            return
+        matches = []
+        
+        def complete(text, state):
+            if state == 0:
+                line = readline.get_line_buffer()[:readline.get_endidx()]
+                start, candidates = self.shell.completer.complete(line)
+                # readline replaces from begidx; our word may start earlier or later
+                cut = readline.get_begidx() - start
+                matches[:] = [c[cut:] for c in candidates] if cut >= 0 else candidates
+                if len(matches) == 1 and not matches[0].endswith(os.sep):
+                    matches[0] += ' '
+            return matches[state] if state < len(matches) else None
+        
+        readline.set_completer_delims(' \t\n|;&')
+        readline.set_completer(complete)
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+    
+    def _page(self, output: PagedOutput):
+        """Show paged output one screen at a time"""
+        pager = Pager(output, shutil.get_terminal_size().lines - 2)
+        try:
+            while True:
+                for line in pager.page():
+                    print(line)
+                if output.quit_at_end and pager.at_end():
+                    break
+                if not pager.handle(input(pager.status() + " ").strip()):
+                    break
+        except KeyboardInterrupt:
+            self.shell.cancel_event.set()
+            print("^C")
+        except EOFError:
+            pass
+        finally:
+            output.close()
+    
     def _print_banner(self):
         """Print welcome banner"""
         from commands.ascii_commands import THEMES